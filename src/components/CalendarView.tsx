@@ -15,7 +15,7 @@ import {
   Target, // Icon for tasks
   Bot // Icon for AI suggestions
 } from "lucide-react";
-import { useWellness } from "@/hooks/wellness-context";
+import { useCollections, useWellness } from "@/hooks/wellness-context";
 import { cn } from "@/lib/utils"; 
 
 // Stress level configuration (matching StressTracker)
@@ -333,6 +333,7 @@ export function CalendarView() {
     todos = [], 
     chatSuggestions = [] 
   } = useWellness();
+  useCollections('journalEntries', 'sleepEntries');
 
   const year = currentDate.getFullYear();
   const month = currentDate.getMonth();
@@ -1,10 +1,12 @@
 import { useState, useEffect, useRef } from "react";
-import { GoogleGenerativeAI, HarmCategory, HarmBlockThreshold } from "@google/generative-ai";
+import { GoogleGenerativeAI, HarmCategory, HarmBlockThreshold, SchemaType, type Schema } from "@google/generative-ai";
 import { Card } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { MessageCircle, Send, Bot, User, GripVertical } from "lucide-react";
-import { useWellness } from "@/hooks/wellness-context";
+import { useCollections, useWellness } from "@/hooks/wellness-context";
+import { chatAnalysisCache } from "@/lib/analysis-cache";
+import { testHook } from "@/lib/test-hooks";
 import { motion, AnimatePresence } from "framer-motion";
 
 // Component to format bot messages with bold text
@@ -151,6 +153,147 @@ Social & Emotional Connection
 
 const apiKey: string | undefined = (import.meta as any).env?.VITE_GEMINI_API_KEY;
 
+// Cache keys for the model's analyses; bump a version whenever its prompt or
+// the shape of its answer changes, so that cached answers are not reused.
+const STRESS_ANALYSIS_PROMPT = "stress-analysis@1";
+const HABIT_REQUEST_PROMPT = "habit-request@1";
+const MESSAGE_ANALYSIS_PROMPT = "message-analysis@1";
+
+// "fused" asks for the stress level, todos and habit intent of a message in
+// one structured request that runs concurrently with the reply; "separate"
+// makes the habit, stress and reply calls one after the other. Tests pick a
+// mode with window.__CHAT_ANALYSIS_MODE__ (see src/lib/test-hooks.ts).
+const ANALYSIS_MODE: "fused" | "separate" =
+  testHook<"fused" | "separate">("__CHAT_ANALYSIS_MODE__") ||
+  (import.meta as any).env?.VITE_CHAT_ANALYSIS_MODE ||
+  "fused";
+
+const CATEGORY_SCHEMA: Schema = {
+  type: SchemaType.STRING,
+  format: "enum",
+  enum: ["mindfulness", "health", "reflection", "exercise", "learning"],
+};
+
+const ACTIVITIES_SCHEMA: Schema = {
+  type: SchemaType.ARRAY,
+  items: {
+    type: SchemaType.OBJECT,
+    properties: { title: { type: SchemaType.STRING }, category: CATEGORY_SCHEMA },
+    required: ["title", "category"],
+  },
+};
+
+const MESSAGE_ANALYSIS_SCHEMA: Schema = {
+  type: SchemaType.OBJECT,
+  properties: {
+    stressLevel: {
+      type: SchemaType.STRING,
+      format: "enum",
+      enum: ["very-low", "low", "moderate", "high", "very-high"],
+    },
+    todos: ACTIVITIES_SCHEMA,
+    habit: {
+      type: SchemaType.OBJECT,
+      properties: {
+        action: { type: SchemaType.STRING, format: "enum", enum: ["add", "remove", "update", "none"] },
+        habits: ACTIVITIES_SCHEMA,
+        habitToRemove: { type: SchemaType.STRING },
+        habitToUpdate: {
+          type: SchemaType.OBJECT,
+          properties: {
+            oldTitle: { type: SchemaType.STRING },
+            newTitle: { type: SchemaType.STRING },
+            category: CATEGORY_SCHEMA,
+          },
+          required: ["oldTitle", "newTitle"],
+        },
+        confidence: { type: SchemaType.NUMBER },
+      },
+      required: ["action", "confidence"],
+    },
+  },
+  required: ["stressLevel", "todos", "habit"],
+};
+
+// Tests can point the client at a local stand-in of the Gemini API with window.__GEMINI_BASE_URL__.
+const geminiBaseUrl = testHook<string>("__GEMINI_BASE_URL__");
+const requestOptions = geminiBaseUrl ? { baseUrl: geminiBaseUrl } : undefined;
+
+// One client and one model object per configuration for the whole app.
+const genAI = apiKey ? new GoogleGenerativeAI(apiKey) : null;
+const replyModel = genAI?.getGenerativeModel(
+  { model: "gemini-1.5-flash", systemInstruction: SYSTEM_PROMPT },
+  requestOptions
+);
+const analysisModel = genAI?.getGenerativeModel({ model: "gemini-1.5-flash" }, requestOptions);
+const messageAnalysisModel = genAI?.getGenerativeModel(
+  {
+    model: "gemini-1.5-flash",
+    generationConfig: { responseMimeType: "application/json", responseSchema: MESSAGE_ANALYSIS_SCHEMA },
+  },
+  requestOptions
+);
+
+const CRISIS_REGEX = /(suicide|kill myself|end it|can't go on|self[- ]?harm|hurt myself)/i;
+const CRISIS_PREFIX = "• I'm really sorry you're feeling this way. You deserve *immediate support*.\n• If you might be in danger or thinking about hurting yourself, please contact *local emergency services*, a trusted person, or a crisis line in your area *right now*.\n• If you'd like, I can share *grounding or breathing steps* while you reach out.\n• ";
+
+// Text of a reply while it streams in. Chunks are appended as they arrive and
+// subscribers hear about them at most once per animation frame, so a fast
+// stream costs one render of the streaming bubble per frame.
+class ReplyStream {
+  text = "";
+  private listeners = new Set<(text: string) => void>();
+  private frame: number | null = null;
+
+  append(chunk: string) {
+    this.text += chunk;
+    this.schedule();
+  }
+
+  reset() {
+    this.text = "";
+    this.schedule();
+  }
+
+  subscribe(listener: (text: string) => void) {
+    this.listeners.add(listener);
+    listener(this.text);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  private schedule() {
+    if (this.frame !== null) return;
+    this.frame = requestAnimationFrame(() => {
+      this.frame = null;
+      this.listeners.forEach((listener) => listener(this.text));
+    });
+  }
+}
+
+// The bot's reply while it streams, rendered apart from the message list so
+// that new chunks do not re-render the list.
+const StreamingMessage = ({ stream }: { stream: ReplyStream }) => {
+  const [text, setText] = useState(stream.text);
+  useEffect(() => stream.subscribe(setText), [stream]);
+  if (!text) return null;
+  return (
+    <div data-testid="chat-streaming" className="flex justify-start">
+      <div className="flex items-start space-x-2 max-w-[85%]">
+        <div className="w-8 h-8 rounded-full flex items-center justify-center flex-shrink-0 bg-secondary text-secondary-foreground shadow-md">
+          <Bot className="h-5 w-5" />
+        </div>
+        <div className="px-4 py-3 rounded-xl max-w-full bg-muted text-foreground rounded-bl-md shadow-md">
+          <div className="text-sm leading-relaxed whitespace-pre-line">
+            <FormattedText text={text} />
+          </div>
+        </div>
+      </div>
+    </div>
+  );
+};
+
 interface ChatBotProps {
   isPopup?: boolean;
   context?: 'dashboard' | 'tab';
@@ -161,6 +304,7 @@ export function ChatBot({ isPopup = false, context = 'tab' }: ChatBotProps) {
   const [currentMessage, setCurrentMessage] = useState("");
   const [isTyping, setIsTyping] = useState(false);
   const [isAnalyzing, setIsAnalyzing] = useState(false);
+  const [replyStream, setReplyStream] = useState<ReplyStream | null>(null);
   const [lastError, setLastError] = useState<string | null>(null);
   const [notifications, setNotifications] = useState<Notification[]>([]);
   const [chatbotSize, setChatbotSize] = useState(() => {
@@ -180,6 +324,7 @@ export function ChatBot({ isPopup = false, context = 'tab' }: ChatBotProps) {
   });
   const [isResizing, setIsResizing] = useState(false);
   const { addStressEntry, addTodos, registerChatSuggestions, chatMessages, addChatMessage, habits, deleteHabit, addHabit } = useWellness();
+  useCollections("chatMessages");
   
   // Refs for the messages container to enable auto-scrolling
   const messagesEndRef = useRef<HTMLDivElement>(null);
@@ -243,12 +388,12 @@ export function ChatBot({ isPopup = false, context = 'tab' }: ChatBotProps) {
     return () => clearTimeout(timer);
   }, [messages]);
 
-  // Auto-scroll when typing or analyzing starts
+  // Auto-scroll when typing, analyzing or streaming starts
   useEffect(() => {
-    if (isTyping || isAnalyzing) {
+    if (isTyping || isAnalyzing || replyStream) {
       scrollToBottom();
     }
-  }, [isTyping, isAnalyzing]);
+  }, [isTyping, isAnalyzing, replyStream]);
 
   // State to track if user has scrolled up
   const [showScrollButton, setShowScrollButton] = useState(false);
@@ -296,7 +441,13 @@ export function ChatBot({ isPopup = false, context = 'tab' }: ChatBotProps) {
     return offTopicKeywords.some(keyword => lowerText.includes(keyword));
   };
 
-  const generateBotReply = async (history: Message[], userText: string): Promise<string> => {
+  // Streams the reply into `stream` as it arrives when one is given, and resolves to the full text.
+  const generateBotReply = async (
+    history: Message[],
+    userText: string,
+    stream?: ReplyStream,
+    signal?: AbortSignal
+  ): Promise<string> => {
     // Check if the message is off-topic first
     if (isOffTopic(userText)) {
       return `• I'm here specifically to support your *mental health and wellbeing*.
@@ -305,20 +456,14 @@ export function ChatBot({ isPopup = false, context = 'tab' }: ChatBotProps) {
     }
 
     try {
-      if (!apiKey) {
+      if (!replyModel) {
         throw new Error("Missing API key");
       }
 
-      const genAI = new GoogleGenerativeAI(apiKey);
-      const model = genAI.getGenerativeModel({
-        model: "gemini-1.5-flash",
-        systemInstruction: SYSTEM_PROMPT
-      });
-
       const firstUserIndex = history.findIndex((m) => m.sender === "user");
       const chatHistory = firstUserIndex >= 0 ? history.slice(firstUserIndex) : [];
 
-      const chat = model.startChat({
+      const chat = replyModel.startChat({
         history: chatHistory.map((m) => ({
           role: m.sender === "user" ? "user" : "model",
           parts: [{ text: m.text }]
@@ -336,24 +481,26 @@ export function ChatBot({ isPopup = false, context = 'tab' }: ChatBotProps) {
         }
       });
 
+      // Gentle crisis interjection if user text indicates urgent risk
+      const prefix = CRISIS_REGEX.test(userText) ? CRISIS_PREFIX : "";
+
       // Retry with exponential backoff for overloads
       let lastError: any = null;
       for (let attempt = 0; attempt < 3; attempt++) {
         try {
-          const result = await chat.sendMessage(userText);
-          const response = await result.response;
-          const text = response.text();
-
-          // Gentle crisis interjection if user text indicates urgent risk
-          const crisisRegex = /(suicide|kill myself|end it|can't go on|self[- ]?harm|hurt myself)/i;
-          if (crisisRegex.test(userText)) {
-            return "• I'm really sorry you're feeling this way. You deserve *immediate support*.\n• If you might be in danger or thinking about hurting yourself, please contact *local emergency services*, a trusted person, or a crisis line in your area *right now*.\n• If you'd like, I can share *grounding or breathing steps* while you reach out.\n• " + text;
+          stream?.reset();
+          stream?.append(prefix);
+          const result = await chat.sendMessageStream(userText, { signal });
+          let text = "";
+          for await (const chunk of result.stream) {
+            const piece = chunk.text();
+            text += piece;
+            stream?.append(piece);
           }
-
-          return text;
+          return prefix + text;
         } catch (err) {
           lastError = err;
-          if (isOverloadedError(err)) {
+          if (!signal?.aborted && isOverloadedError(err)) {
             // Backoff with jitter
             const delay = 800 * Math.pow(2, attempt) + Math.floor(Math.random() * 300);
             await sleep(delay);
@@ -370,6 +517,8 @@ export function ChatBot({ isPopup = false, context = 'tab' }: ChatBotProps) {
       const fallback = botResponses[Math.floor(Math.random() * botResponses.length)];
       return fallback;
     } catch (error) {
+      // An abandoned reply (see sendMessage) needs neither a log nor a fallback.
+      if (signal?.aborted) return "";
       console.error(error);
       // Fallback immediately on errors
       if (isOverloadedError(error)) {
@@ -389,15 +538,16 @@ export function ChatBot({ isPopup = false, context = 'tab' }: ChatBotProps) {
     const fallback = fallbackAnalyze(userText);
     
     try {
-      if (!apiKey) return fallback;
+      if (!analysisModel) return fallback;
+
+      const cached = await chatAnalysisCache.get<Analyzed>(STRESS_ANALYSIS_PROMPT, userText);
+      if (cached) return cached;
       
       // Add timeout to prevent hanging
       const timeoutPromise = new Promise<never>((_, reject) => {
         setTimeout(() => reject(new Error('Analysis timeout')), 10000); // 10 second timeout
       });
       
-      const genAI = new GoogleGenerativeAI(apiKey);
-      const model = genAI.getGenerativeModel({ model: "gemini-1.5-flash" });
       const prompt = `Classify the user's message for a wellness app and suggest DIVERSE, SPECIFIC activities.
 
 Rules:
@@ -431,7 +581,7 @@ User message: "${userText.replace(/"/g, '\\"')}"`
       let lastError: any = null;
       for (let attempt = 0; attempt < 3; attempt++) {
         try {
-          const result = await Promise.race([model.generateContent(prompt), timeoutPromise]);
+          const result = await Promise.race([analysisModel.generateContent(prompt), timeoutPromise]);
           const text = result.response.text();
           const jsonStart = text.indexOf('{');
           const jsonEnd = text.lastIndexOf('}');
@@ -461,6 +611,7 @@ User message: "${userText.replace(/"/g, '\\"')}"`
           category: (t.category as Analyzed["todos"][number]["category"]) || "health",
         })).filter(t => t.title.length > 0);
         if (parsed.todos.length === 0) parsed.todos = fallback.todos;
+        chatAnalysisCache.set(STRESS_ANALYSIS_PROMPT, userText, parsed);
         return parsed;
       } catch (parseError) {
         if (isOverloadedError(lastError)) {
@@ -759,24 +910,28 @@ User message: "${userText.replace(/"/g, '\\"')}"`
   };
 
   // Intelligent habit management request analysis
-  const analyzeHabitManagementRequest = async (userText: string): Promise<{
+  type HabitRequest = {
     action: "add" | "remove" | "update" | "none";
     habits?: { title: string; category: "mindfulness" | "health" | "reflection" | "exercise" | "learning" }[];
     habitToRemove?: string;
     habitToUpdate?: { oldTitle: string; newTitle: string; category?: "mindfulness" | "health" | "reflection" | "exercise" | "learning" };
     confidence: number;
-  }> => {
+  };
+
+  const analyzeHabitManagementRequest = async (userText: string): Promise<HabitRequest> => {
     const text = userText.toLowerCase();
     
     try {
-      if (!apiKey) {
+      if (!analysisModel) {
         // Fallback to rule-based analysis
         return fallbackHabitAnalysis(text);
       }
 
-      const genAI = new GoogleGenerativeAI(apiKey);
-      const model = genAI.getGenerativeModel({ model: "gemini-1.5-flash" });
-      
+      // The model's answer is cached even when it is not confident, since the
+      // rule-based fallback then gives the same result for the same text.
+      const cached = await chatAnalysisCache.get<HabitRequest>(HABIT_REQUEST_PROMPT, userText);
+      if (cached) return cached.confidence > 0.7 ? cached : fallbackHabitAnalysis(text);
+
       const prompt = `Analyze this user message for habit management requests. Determine if they want to:
 1. ADD new habits
 2. REMOVE existing habits  
@@ -803,7 +958,7 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
         setTimeout(() => reject(new Error('Analysis timeout')), 8000);
       });
 
-      const result = await Promise.race([model.generateContent(prompt), timeoutPromise]);
+      const result = await Promise.race([analysisModel.generateContent(prompt), timeoutPromise]);
       const responseText = result.response.text();
       
       const jsonStart = responseText.indexOf('{');
@@ -812,6 +967,9 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
       
       try {
         const parsed = JSON.parse(json);
+        if (parsed.action && typeof parsed.confidence === "number") {
+          chatAnalysisCache.set(HABIT_REQUEST_PROMPT, userText, parsed);
+        }
         if (parsed.action && parsed.confidence && parsed.confidence > 0.7) {
           return parsed;
         }
@@ -828,14 +986,73 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
     }
   };
 
+  // Fused analysis: stress level, todos and habit intent from one structured request
+  type MessageAnalysis = Analyzed & { habit: HabitRequest };
+
+  const analyzeMessage = async (userText: string): Promise<MessageAnalysis> => {
+    const fallback = (): MessageAnalysis => ({
+      ...fallbackAnalyze(userText),
+      habit: fallbackHabitAnalysis(userText.toLowerCase()),
+    });
+    // Same rule as analyzeHabitManagementRequest: a habit intent the model is unsure of is decided locally.
+    const withConfidentHabit = (analysis: MessageAnalysis): MessageAnalysis =>
+      analysis.habit.confidence > 0.7 ? analysis : { ...analysis, habit: fallbackHabitAnalysis(userText.toLowerCase()) };
+
+    if (!messageAnalysisModel) return fallback();
+
+    const cached = await chatAnalysisCache.get<MessageAnalysis>(MESSAGE_ANALYSIS_PROMPT, userText);
+    if (cached) return withConfidentHabit(cached);
+
+    const prompt = `Analyze the user's message for a wellness app: classify their stress, suggest activities, and detect habit management requests.
+
+Stress rules:
+- stressLevel must be exactly one of: very-low, low, moderate, high, very-high.
+- Only classify stress as "high" or "very-high" if there's a clear, explicit reason present in the message (such as work, relationships, health, finances, deadlines, school, traffic, etc.).
+- If someone says they're "stressed" or "anxious" but provides no specific cause, classify as "moderate" stress.
+- todos: for "high" or "very-high" stress, EXACTLY 5 diverse, specific stress relief activities (technique, duration, instructions); otherwise 3-5 actionable activities. Mix breathing, movement, mindfulness and self-care, tailored to the user's situation.
+
+Habit rules:
+- habit.action is "add" if they want to start new habits (list them in habit.habits), "remove" if they want to drop one (habit.habitToRemove), "update" if they want to change one (habit.habitToUpdate), otherwise "none".
+- habit.confidence is between 0.0 and 1.0.
+
+Every activity and habit has a category: mindfulness, health, reflection, exercise or learning.
+
+User message: "${userText.replace(/"/g, '\\"')}"`;
+
+    let lastError: any = null;
+    for (let attempt = 0; attempt < 3; attempt++) {
+      try {
+        const timeout = new Promise<never>((_, reject) => {
+          setTimeout(() => reject(new Error('Analysis timeout')), 10000);
+        });
+        const result = await Promise.race([messageAnalysisModel.generateContent(prompt), timeout]);
+        const parsed = JSON.parse(result.response.text()) as MessageAnalysis;
+        if (!parsed.stressLevel || !Array.isArray(parsed.todos) || !parsed.habit?.action) {
+          throw new Error("Invalid analysis");
+        }
+        parsed.todos = parsed.todos.slice(0, 5).map(t => ({
+          title: String(t.title).trim(),
+          category: t.category || "health",
+        })).filter(t => t.title.length > 0);
+        if (parsed.todos.length === 0) parsed.todos = fallbackAnalyze(userText).todos;
+        parsed.habit.confidence = Number(parsed.habit.confidence) || 0;
+        chatAnalysisCache.set(MESSAGE_ANALYSIS_PROMPT, userText, parsed);
+        return withConfidentHabit(parsed);
+      } catch (err) {
+        lastError = err;
+        if (!isOverloadedError(err)) break;
+        await sleep(600 * Math.pow(2, attempt) + Math.floor(Math.random() * 300));
+      }
+    }
+    if (isOverloadedError(lastError)) {
+      addNotification("Analysis is temporarily unavailable due to high load. Using local fallback.", "info");
+    }
+    console.warn('Message analysis failed, using fallback:', lastError);
+    return fallback();
+  };
+
   // Fallback rule-based habit analysis
-  const fallbackHabitAnalysis = (text: string): {
-    action: "add" | "remove" | "update" | "none";
-    habits?: { title: string; category: "mindfulness" | "health" | "reflection" | "exercise" | "learning" }[];
-    habitToRemove?: string;
-    habitToUpdate?: { oldTitle: string; newTitle: string; category?: "mindfulness" | "health" | "reflection" | "exercise" | "learning" };
-    confidence: number;
-  } => {
+  const fallbackHabitAnalysis = (text: string): HabitRequest => {
     // Add habits
     if (/(?:want|need|start|begin|add|create|make)\s+(?:to\s+)?(?:a\s+)?(?:new\s+)?(?:habit|routine|practice)/.test(text)) {
       const habits: { title: string; category: "mindfulness" | "health" | "reflection" | "exercise" | "learning" }[] = [];
@@ -989,20 +1206,33 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
     setCurrentMessage("");
     setIsTyping(true);
 
+    // In fused mode the reply is requested alongside the single analysis call.
+    // It streams into a buffer that is only shown once the analysis says the
+    // message is not a habit management request; otherwise it is aborted.
+    const fused = ANALYSIS_MODE === "fused";
+    const pendingReplyAbort = fused ? new AbortController() : null;
     try {
+      const stream = new ReplyStream();
+      const pendingReply = fused
+        ? generateBotReply([...messages, userMessage], userMessage.text, stream, pendingReplyAbort.signal)
+        : null;
+      const fusedAnalysis = fused ? await analyzeMessage(userMessage.text) : null;
+
       // First, analyze if this is a habit management request
-      const habitAnalysis = await analyzeHabitManagementRequest(userMessage.text);
+      const habitAnalysis = fusedAnalysis?.habit ?? await analyzeHabitManagementRequest(userMessage.text);
       
       if (habitAnalysis.action !== "none") {
+        pendingReplyAbort?.abort();
         // Handle habit management actions
         await handleHabitManagement(habitAnalysis);
         setIsTyping(false);
         return; // Skip regular stress analysis for habit management
       }
+      if (fused) setReplyStream(stream);
 
       // Regular stress and habit analysis (existing logic)
       setIsAnalyzing(true);
-      const analysis = await analyzeUserText(userMessage.text);
+      const analysis = fusedAnalysis ?? await analyzeUserText(userMessage.text);
       const { causes, hasClearReason } = extractStressCauses(userMessage.text);
       
       // Only add stress entry if we detected a meaningful stress level (not just fallback "moderate")
@@ -1083,7 +1313,8 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
       
       setIsAnalyzing(false);
 
-      const reply = await generateBotReply([...messages, userMessage], userMessage.text);
+      if (!fused) setReplyStream(stream);
+      const reply = await (pendingReply ?? generateBotReply([...messages, userMessage], userMessage.text, stream));
 
       // Extract actionable tasks from the bot's response and register as chat suggestions
       const suggestedTasksRaw = extractTasksFromBotResponse(reply);
@@ -1171,9 +1402,11 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
         timestamp: new Date()
       };
       setMessages(prev => [...prev, botMessage]);
+      setReplyStream(null);
       addChatMessage({ ...botMessage, timestamp: botMessage.timestamp.toISOString() });
       setLastError(null);
     } catch (err: any) {
+      pendingReplyAbort?.abort();
       setLastError(err?.message ? String(err.message) : "Connection error");
       const fallback = botResponses[Math.floor(Math.random() * botResponses.length)];
       const botMessage: Message = {
@@ -1185,6 +1418,7 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
       setMessages(prev => [...prev, botMessage]);
       addChatMessage({ ...botMessage, timestamp: botMessage.timestamp.toISOString() });
     } finally {
+      setReplyStream(null);
       setIsTyping(false);
       setIsAnalyzing(false);
     }
@@ -1381,6 +1615,7 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
               {/* Messages - Scrollable area */}
               <div 
                 ref={messagesContainerRef}
+                data-testid="chat-messages"
                 className="flex-1 overflow-y-auto py-4 space-y-6 relative chat-messages-container animate-in fade-in-50 duration-1000 delay-300 px-2"
                 onScroll={handleScroll}
               >
@@ -1388,6 +1623,8 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
                   {messages.map((message, index) => (
                     <motion.div
                       key={message.id}
+                      data-testid="chat-message"
+                      data-sender={message.sender}
                       initial={{ opacity: 0, y: 12, scale: 0.98 }}
                       animate={{ opacity: 1, y: 0, scale: 1 }}
                       exit={{ opacity: 0, y: -8, scale: 0.98 }}
@@ -1435,6 +1672,8 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
                     </motion.div>
                   ))}
                 </AnimatePresence>
+
+                {replyStream && <StreamingMessage stream={replyStream} />}
                 
                 {/* Typing Indicator */}
                 <AnimatePresence>
@@ -1534,12 +1773,16 @@ User message: "${userText.replace(/"/g, '\\"')}"`;
                     onChange={(e) => setCurrentMessage(e.target.value)}
                     onKeyPress={handleKeyPress}
                     placeholder="Share your thoughts, feelings, or concerns..."
+                    aria-label="Message"
+                    data-testid="chat-input"
                     className="flex-1 text-sm h-12 px-4 py-2 rounded-xl transition-all duration-300 focus:ring-2 focus:ring-primary/20 focus:scale-[1.01] shadow-md"
                     disabled={isTyping}
                   />
                   <Button 
                     onClick={sendMessage}
                     disabled={!currentMessage.trim() || isTyping}
+                    aria-label="Send message"
+                    data-testid="chat-send"
                     size="sm"
                     className="px-4 h-12 rounded-xl transition-all duration-300 hover:scale-105 disabled:opacity-50 shadow-md"
                   >
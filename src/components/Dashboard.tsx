@@ -13,8 +13,10 @@ import {
   BookOpen,
   Activity
 } from "lucide-react";
-import Spline from '@splinetool/react-spline';
-import { ChatBot } from "./ChatBot";
+import { lazy, Suspense } from "react";
+
+// The Spline runtime is large; load it after the dashboard itself has rendered.
+const Spline = lazy(() => import('@splinetool/react-spline'));
 
 interface DashboardProps {
   onSectionChange: (section: string) => void;
@@ -41,7 +43,9 @@ export function Dashboard({ onSectionChange }: DashboardProps) {
       {/* Enhanced Hero Section with Spline background */}
       <div className="relative rounded-3xl overflow-hidden group h-80 md:h-96">
         <div className="absolute inset-0 z-0">
-          <Spline scene="https://prod.spline.design/FCdSLsoYZRtfzat4/scene.splinecode" />
+          <Suspense fallback={null}>
+            <Spline scene="https://prod.spline.design/FCdSLsoYZRtfzat4/scene.splinecode" />
+          </Suspense>
         </div>
         <div className="absolute inset-0 flex items-center z-10 pointer-events-none">
           <div className="p-8 md:p-12 text-white">
@@ -15,6 +15,7 @@ import {
   Trash2
 } from "lucide-react";
 import { useWellness } from "@/hooks/wellness-context";
+import { useToast } from "@/hooks/use-toast";
 import { playClickSound, playTaskCompleteSound } from "@/lib/audio";
 
 interface Task {
@@ -34,11 +35,22 @@ const categoryColors = {
 export function HabitTracker() {
   const [newHabitName, setNewHabitName] = useState("");
   const [showAddForm, setShowAddForm] = useState(false);
-  const { habits, addHabit, toggleHabit, deleteHabit, getDailyHabitCompletions, tasks, toggleTask, deleteTask, pinnedTasks, pinTask, unpinTask } = useWellness();
+  const { toast } = useToast();
+  const { habits, addHabit, findDuplicateHabit, toggleHabit, deleteHabit, getDailyHabitCompletions, tasks, toggleTask, deleteTask, pinnedTasks, pinTask, unpinTask } = useWellness();
+
+  // Adds a habit, or says which existing habit it duplicates.
+  const tryAddHabit = (name: string) => {
+    if (addHabit(name, "health")) return true;
+    const existing = findDuplicateHabit(name);
+    toast({
+      title: "Habit already exists",
+      description: existing ? `"${name}" is too similar to "${existing}".` : `"${name}" is already on your list.`,
+    });
+    return false;
+  };
 
   const handleAddHabit = () => {
-    if (newHabitName.trim()) {
-      addHabit(newHabitName.trim(), "health");
+    if (newHabitName.trim() && tryAddHabit(newHabitName.trim())) {
       playTaskCompleteSound();
       setNewHabitName("");
       setShowAddForm(false);
@@ -173,6 +185,7 @@ export function HabitTracker() {
     </h2>
     <Button
       onClick={() => setShowAddForm(!showAddForm)}
+      data-testid="habit-add-toggle"
       size="lg"
       className="flex items-center space-x-2 rounded-full shadow-lg hover:shadow-xl transition-shadow duration-300"
     >
@@ -189,12 +202,14 @@ export function HabitTracker() {
           value={newHabitName}
           onChange={(e) => setNewHabitName(e.target.value)}
           placeholder="e.g., Drink 8 glasses of water"
+          aria-label="Habit name"
+          data-testid="habit-name-input"
           className="h-12 text-lg rounded-lg"
           onKeyPress={(e) => e.key === 'Enter' && handleAddHabit()}
         />
         <div className="flex items-center justify-between">
           <div className="flex space-x-2">
-            <Button onClick={handleAddHabit} size="lg" className="rounded-full">
+            <Button onClick={handleAddHabit} size="lg" className="rounded-full" data-testid="habit-add-submit">
               Add Habit
             </Button>
             <Button 
@@ -220,8 +235,7 @@ export function HabitTracker() {
               size="sm"
               className="rounded-full"
               onClick={() => {
-                addHabit(suggestion, "health");
-                playTaskCompleteSound();
+                if (tryAddHabit(suggestion)) playTaskCompleteSound();
               }}
             >
               {suggestion}
@@ -235,7 +249,7 @@ export function HabitTracker() {
   {/* Habits */}
   <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-5">
     {(habits || []).map((habit) => (
-      <Card key={habit.id} className="p-5 hover:shadow-2xl transition-all duration-300 group rounded-2xl border-2 hover:border-primary/60">
+      <Card key={habit.id} data-testid="habit-item" className="p-5 hover:shadow-2xl transition-all duration-300 group rounded-2xl border-2 hover:border-primary/60">
         <div className="flex flex-col h-full">
           {/* Header with checkbox and delete */}
           <div className="flex items-start justify-between mb-4">
@@ -249,10 +263,14 @@ export function HabitTracker() {
                 }
                 toggleHabit(habit.id);
               }}
+              aria-label={`Complete ${habit.name}`}
+              data-testid="habit-toggle"
               className="w-7 h-7 rounded-full border-2 border-gray-300 group-hover:border-primary/80 transition-colors duration-300"
             />
             <Button
               onClick={() => deleteHabit(habit.id)}
+              aria-label={`Delete ${habit.name}`}
+              data-testid="habit-delete"
               variant="ghost"
               size="icon"
               className="opacity-0 group-hover:opacity-100 transition-opacity text-red-400 hover:text-red-600 hover:bg-red-100/50 rounded-full h-9 w-9 duration-300"
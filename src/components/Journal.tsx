@@ -4,7 +4,7 @@ import { Button } from "@/components/ui/button";
 import { Textarea } from "@/components/ui/textarea";
 import { Input } from "@/components/ui/input";
 import { PenTool, Save, Settings, RotateCcw, ZoomIn, ZoomOut, Network, X } from "lucide-react";
-import { useWellness } from "@/hooks/wellness-context";
+import { useCollections, useWellness } from "@/hooks/wellness-context";
 import { playClickSound, playTaskCompleteSound } from "@/lib/audio";
 import * as d3 from 'd3';
 
@@ -40,6 +40,7 @@ export function Journal() {
     journalEntries = [],
     addJournalEntry,
   } = useWellness();
+  useCollections('journalEntries');
 
   // Quick Entry Modal State
   const [showEntryModal, setShowEntryModal] = useState(false);
@@ -372,12 +373,16 @@ export function Journal() {
                 value={currentTitle}
                 onChange={(e) => setCurrentTitle(e.target.value)}
                 placeholder="Entry title..."
+                aria-label="Entry title"
+                data-testid="journal-title-input"
                 className="text-lg rounded-xl border-2 focus:border-primary/50"
               />
               <Textarea
                 value={currentEntry}
                 onChange={e => setCurrentEntry(e.target.value)}
                 placeholder="What's on your mind? How was your day? What are you feeling?"
+                aria-label="Entry content"
+                data-testid="journal-content-input"
                 className="min-h-[200px] text-base leading-relaxed rounded-xl border-2 focus:border-primary/50 resize-none"
               />
             </div>
@@ -397,6 +402,7 @@ export function Journal() {
               </Button>
               <Button
                 onClick={saveEntry}
+                data-testid="journal-save"
                 disabled={!currentEntry.trim() || !currentTitle.trim()}
                 className="flex items-center space-x-2 rounded-xl bg-gradient-to-r from-primary to-accent"
               >
@@ -411,7 +417,7 @@ export function Journal() {
             <h3 className="text-lg font-semibold mb-4">Recent Entries</h3>
             <div className="space-y-3">
               {journalEntries.slice(0, 3).map(entry => (
-                <Card key={entry.id} className="p-4 rounded-xl border hover:shadow-md transition-shadow">
+                <Card key={entry.id} data-testid="journal-entry" className="p-4 rounded-xl border hover:shadow-md transition-shadow">
                   <div className="flex justify-between items-start mb-2">
                     <h4 className="font-medium text-sm">{entry.title}</h4>
                     <span className="text-xs text-muted-foreground">{entry.date}</span>
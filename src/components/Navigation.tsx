@@ -15,6 +15,7 @@ import {
 } from "lucide-react";
 import { Settings as SettingsPanel } from "./Settings";
 import { playClickSound } from "@/lib/audio";
+import { prefetchSection } from "@/lib/sections";
 
 interface NavigationProps {
   activeSection: string;
@@ -47,6 +48,8 @@ export function Navigation({ activeSection, onSectionChange }: NavigationProps)
       {/* Mobile menu button - now positioned at top right for mobile */}
       <button
         onClick={() => setIsMenuOpen(!isMenuOpen)}
+        aria-label="Open menu"
+        data-testid="mobile-menu-button"
         className="fixed top-4 right-4 z-50 p-2 bg-card/80 backdrop-blur-sm rounded-full shadow-soft md:hidden"
       >
         <Menu className="h-5 w-5" />
@@ -67,6 +70,7 @@ export function Navigation({ activeSection, onSectionChange }: NavigationProps)
         {/* Settings Button */}
         <button
           onClick={() => setIsSettingsOpen(true)}
+          data-testid="settings-button"
           className="fab group relative flex flex-col items-center justify-center w-full h-14 transition-all duration-500 ease-out hover:scale-110 active:scale-95"
           title="Settings"
         >
@@ -84,6 +88,9 @@ export function Navigation({ activeSection, onSectionChange }: NavigationProps)
               return (
                 <button
                   key={item.id}
+                  data-testid={`nav-${item.id}`}
+                  onMouseEnter={() => prefetchSection(item.id)}
+                  onFocus={() => prefetchSection(item.id)}
                   onClick={() => {
                     playClickSound();
                     onSectionChange(item.id);
@@ -143,6 +150,9 @@ export function Navigation({ activeSection, onSectionChange }: NavigationProps)
                 return (
                   <button
                     key={item.id}
+                    data-testid={`mobile-nav-${item.id}`}
+                    onTouchStart={() => prefetchSection(item.id)}
+                    onFocus={() => prefetchSection(item.id)}
                     onClick={() => {
                       playClickSound();
                       onSectionChange(item.id);
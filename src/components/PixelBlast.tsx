@@ -2,6 +2,7 @@ import React, { useEffect, useRef } from 'react';
 import * as THREE from 'three';
 import { EffectComposer, EffectPass, RenderPass, Effect } from 'postprocessing';
 import './PixelBlast.css';
+import { testHook } from '@/lib/test-hooks';
 
 type PixelBlastVariant = 'square' | 'circle' | 'triangle' | 'diamond';
 
@@ -24,6 +25,7 @@ type PixelBlastProps = {
   rippleSpeed?: number;
   liquidWobbleSpeed?: number;
   autoPauseOffscreen?: boolean;
+  adaptive?: boolean;
   speed?: number;
   transparent?: boolean;
   edgeFade?: number;
@@ -327,6 +329,26 @@ void main(){
 
 const MAX_CLICKS = 10;
 
+// Adaptive quality steps: render scale relative to the device pixel ratio,
+// and the shortest interval between rendered frames (0 = every frame).
+const QUALITY_LEVELS = [
+  { scale: 1, minFrameMs: 0 },
+  { scale: 0.75, minFrameMs: 0 },
+  { scale: 0.5, minFrameMs: 1000 / 30 },
+  { scale: 0.5, minFrameMs: 1000 / 15 }
+];
+// Step down when the smoothed rAF interval exceeds the budget (under ~45 fps),
+// step back up after a sustained stretch comfortably within it.
+const FRAME_BUDGET_MS = 22;
+const FRAME_RECOVER_MS = 18;
+const STEP_DOWN_AFTER_MS = 1000;
+const STEP_UP_AFTER_MS = 8000;
+
+// Test-only override set by an init script: 'off' skips the background
+// entirely, 'full' disables the adaptive mode. When it is set, frame
+// statistics are published on window.__pixelBlastStats.
+const readModeOverride = () => testHook<'off' | 'full' | 'adaptive'>('__PIXELBLAST_MODE__');
+
 const PixelBlast: React.FC<PixelBlastProps> = ({
   variant = 'square',
   pixelSize = 3,
@@ -346,6 +368,7 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
   rippleSpeed = 0.3,
   liquidWobbleSpeed = 4.5,
   autoPauseOffscreen = true,
+  adaptive = true,
   speed = 0.5,
   transparent = true,
   edgeFade = 0.5,
@@ -380,6 +403,8 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
       uEdgeFade: { value: number };
     };
     resizeObserver?: ResizeObserver;
+    intersectionObserver?: IntersectionObserver;
+    onVisibilityChange?: () => void;
     raf?: number;
     quad?: THREE.Mesh<THREE.PlaneGeometry, THREE.ShaderMaterial>;
     timeOffset?: number;
@@ -391,9 +416,11 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
   useEffect(() => {
     const container = containerRef.current;
     if (!container) return;
+    const modeOverride = readModeOverride();
+    if (modeOverride === 'off') return;
     speedRef.current = speed;
-    const needsReinitKeys = ['antialias', 'liquid', 'noiseAmount'];
-    const cfg = { antialias, liquid, noiseAmount };
+    const needsReinitKeys = ['antialias', 'liquid', 'noiseAmount', 'adaptive', 'autoPauseOffscreen'];
+    const cfg = { antialias, liquid, noiseAmount, adaptive, autoPauseOffscreen };
     let mustReinit = false;
     if (!threeRef.current) mustReinit = true;
     else if (prevConfigRef.current) {
@@ -407,6 +434,8 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
       if (threeRef.current) {
         const t = threeRef.current;
         t.resizeObserver?.disconnect();
+        t.intersectionObserver?.disconnect();
+        if (t.onVisibilityChange) document.removeEventListener('visibilitychange', t.onVisibilityChange);
         cancelAnimationFrame(t.raf!);
         t.quad?.geometry.dispose();
         t.material.dispose();
@@ -426,7 +455,8 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
       });
       renderer.domElement.style.width = '100%';
       renderer.domElement.style.height = '100%';
-      renderer.setPixelRatio(Math.min(window.devicePixelRatio || 1, 2));
+      const basePixelRatio = Math.min(window.devicePixelRatio || 1, 2);
+      renderer.setPixelRatio(basePixelRatio);
       container.appendChild(renderer.domElement);
       const uniforms = {
         uResolution: { value: new THREE.Vector2(0, 0) },
@@ -552,12 +582,65 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
       renderer.domElement.addEventListener('pointermove', onPointerMove, {
         passive: true
       });
+      // Pause while the tab is hidden or (with autoPauseOffscreen) the canvas is scrolled away.
+      let onScreen = true;
+      const updateVisibility = () => {
+        visibilityRef.current.visible = !document.hidden && (!autoPauseOffscreen || onScreen);
+      };
+      const onVisibilityChange = () => updateVisibility();
+      document.addEventListener('visibilitychange', onVisibilityChange);
+      let intersectionObserver: IntersectionObserver | undefined;
+      if (autoPauseOffscreen && typeof IntersectionObserver !== 'undefined') {
+        intersectionObserver = new IntersectionObserver(entries => {
+          onScreen = entries.some(entry => entry.isIntersecting);
+          updateVisibility();
+        });
+        intersectionObserver.observe(container);
+      }
+      updateVisibility();
+
+      const adaptiveQuality = adaptive && modeOverride !== 'full';
+      const stats = { level: 0, rendered: 0, skipped: 0, paused: 0 };
+      if (modeOverride) (window as any).__pixelBlastStats = stats;
+      let frameEma = 1000 / 60;
+      let lastFrame = 0;
+      let lastRender = 0;
+      let lastLevelChange = 0;
+      const setLevel = (level: number, now: number) => {
+        stats.level = level;
+        lastLevelChange = now;
+        renderer.setPixelRatio(basePixelRatio * QUALITY_LEVELS[level].scale);
+        setSize();
+      };
+      // Returns false when this frame should be skipped to stay within the budget.
+      const adaptFrame = (now: number) => {
+        if (lastFrame) {
+          frameEma += (now - lastFrame - frameEma) * 0.1;
+          const sinceChange = now - lastLevelChange;
+          if (frameEma > FRAME_BUDGET_MS && stats.level < QUALITY_LEVELS.length - 1 && sinceChange > STEP_DOWN_AFTER_MS)
+            setLevel(stats.level + 1, now);
+          else if (frameEma < FRAME_RECOVER_MS && stats.level > 0 && sinceChange > STEP_UP_AFTER_MS)
+            setLevel(stats.level - 1, now);
+        }
+        lastFrame = now;
+        return now - lastRender >= QUALITY_LEVELS[stats.level].minFrameMs;
+      };
+
       let raf = 0;
-      const animate = () => {
-        if (autoPauseOffscreen && !visibilityRef.current.visible) {
-          raf = requestAnimationFrame(animate);
+      const animate = (now: number) => {
+        raf = requestAnimationFrame(animate);
+        if (threeRef.current) threeRef.current.raf = raf;
+        if (!visibilityRef.current.visible) {
+          stats.paused++;
+          lastFrame = 0;
           return;
         }
+        if (adaptiveQuality && !adaptFrame(now)) {
+          stats.skipped++;
+          return;
+        }
+        lastRender = now;
+        stats.rendered++;
         uniforms.uTime.value = timeOffset + clock.getElapsedTime() * speedRef.current;
         if (liquidEffect) (liquidEffect as any).uniforms.get('uTime').value = uniforms.uTime.value;
         if (composer) {
@@ -572,7 +655,6 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
           });
           composer.render();
         } else renderer.render(scene, camera);
-        raf = requestAnimationFrame(animate);
       };
       raf = requestAnimationFrame(animate);
       threeRef.current = {
@@ -584,6 +666,8 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
         clickIx: 0,
         uniforms,
         resizeObserver: ro,
+        intersectionObserver,
+        onVisibilityChange,
         raf,
         quad,
         timeOffset,
@@ -620,6 +704,8 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
       if (!threeRef.current) return;
       const t = threeRef.current;
       t.resizeObserver?.disconnect();
+      t.intersectionObserver?.disconnect();
+      if (t.onVisibilityChange) document.removeEventListener('visibilitychange', t.onVisibilityChange);
       cancelAnimationFrame(t.raf!);
       t.quad?.geometry.dispose();
       t.material.dispose();
@@ -646,6 +732,7 @@ const PixelBlast: React.FC<PixelBlastProps> = ({
     liquidRadius,
     liquidWobbleSpeed,
     autoPauseOffscreen,
+    adaptive,
     variant,
     color,
     speed
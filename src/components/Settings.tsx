@@ -44,7 +44,11 @@ export function Settings({ isOpen, onClose }: SettingsProps) {
       />
       
       {/* Settings Panel */}
-      <div className="fixed right-4 top-4 w-80 bg-card/95 backdrop-blur-xl border border-border/50 rounded-2xl shadow-2xl z-50 animate-in slide-in-from-top-2 duration-300">
+      <div
+        role="dialog"
+        aria-label="Settings"
+        data-testid="settings-panel"
+        className="fixed right-4 top-4 w-80 bg-card/95 backdrop-blur-xl border border-border/50 rounded-2xl shadow-2xl z-50 animate-in slide-in-from-top-2 duration-300">
         <Card className="border-0 bg-transparent">
           <CardHeader className="pb-4">
             <div className="flex items-center justify-between">
@@ -61,6 +65,8 @@ export function Settings({ isOpen, onClose }: SettingsProps) {
                 variant="ghost"
                 size="sm"
                 onClick={onClose}
+                aria-label="Close settings"
+                data-testid="settings-close"
                 className="h-8 w-8 p-0 hover:bg-muted/50"
               >
                 <X className="h-4 w-4" />
@@ -81,6 +87,7 @@ export function Settings({ isOpen, onClose }: SettingsProps) {
                     <button
                       key={option.id}
                       onClick={() => setTheme(option.id)}
+                      data-testid={`theme-${option.id}`}
                       className={cn(
                         "flex flex-col items-center p-3 rounded-xl border transition-all duration-200",
                         isActive
@@ -111,6 +118,8 @@ export function Settings({ isOpen, onClose }: SettingsProps) {
                 <Switch
                   checked={notifications}
                   onCheckedChange={setNotifications}
+                  aria-label="Notifications"
+                  data-testid="settings-notifications"
                 />
               </div>
               
@@ -124,6 +133,8 @@ export function Settings({ isOpen, onClose }: SettingsProps) {
                 <Switch
                   checked={sound}
                   onCheckedChange={handleSoundChange}
+                  aria-label="Sound effects"
+                  data-testid="settings-sound"
                 />
               </div>
             </div>
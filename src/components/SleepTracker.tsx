@@ -4,7 +4,7 @@ import { Button } from "@/components/ui/button";
 import { Label } from "@/components/ui/label";
 import { Moon, Sun, Clock, TrendingUp, Smile, Frown, Meh, Star } from "lucide-react";
 import { TimePicker } from "@/components/TimePicker";
-import { useWellness } from "@/hooks/wellness-context";
+import { useCollections, useWellness } from "@/hooks/wellness-context";
 import { playClickSound, playTaskCompleteSound } from "@/lib/audio";
 import {
   ChartContainer,
@@ -26,6 +26,7 @@ export function SleepTracker() {
   const [wakeupTime, setWakeupTime] = useState("");
   const [quality, setQuality] = useState("");
   const { addSleepEntry, sleepEntries = [] } = useWellness();
+  useCollections("sleepEntries");
 
   const qualityOptions = [
     { value: "excellent", label: "Excellent", emoji: "🤩", icon: <Star className="h-5 w-5 text-yellow-400" /> },
@@ -146,6 +147,8 @@ export function SleepTracker() {
                 {qualityOptions.map((option) => (
                   <button
                     key={option.value}
+                    data-testid={`sleep-quality-${option.value}`}
+                    aria-pressed={quality === option.value}
                     onClick={() => {
                       playClickSound();
                       setQuality(option.value);
@@ -167,6 +170,7 @@ export function SleepTracker() {
 
             <Button 
               onClick={handleSubmit}
+              data-testid="sleep-save"
               disabled={!bedtime || !wakeupTime || !quality}
               className="w-full h-14 text-lg font-semibold transition-transform duration-200 hover:scale-105"
             >
@@ -189,6 +193,7 @@ export function SleepTracker() {
                   return (
                     <div 
                       key={entry.id} 
+                      data-testid="sleep-entry"
                       className="flex items-center justify-between p-4 rounded-xl bg-muted/50 animate-in slide-in-from-bottom-4 duration-500"
                       style={{ animationDelay: `${index * 50}ms`, animationFillMode: 'backwards' }}
                     >
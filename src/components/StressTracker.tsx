@@ -169,6 +169,8 @@ export function StressTracker() {
           {stressOptions.map((stress) => (
             <button
               key={stress.id}
+              data-testid={`stress-level-${stress.id}`}
+              aria-pressed={selectedStressLevel === stress.id}
               onClick={() => handleStressSelect(stress.id)}
               className={`
                 group p-4 rounded-2xl text-center border-2 transition-all duration-300 ease-in-out
@@ -200,10 +202,13 @@ export function StressTracker() {
               value={note}
               onChange={(e) => setNote(e.target.value)}
               placeholder="What's on your mind? What might be contributing to this feeling?"
+              aria-label="Stress note"
+              data-testid="stress-note"
               className="min-h-[100px] resize-none text-base"
             />
             <Button 
               onClick={handleSubmit}
+              data-testid="stress-save"
               disabled={!selectedStressLevel}
               className="w-full text-lg py-6"
             >
@@ -311,7 +316,7 @@ export function StressTracker() {
             const isAutoDetected = entry.note && entry.note.includes('Auto-detected from chat');
             
             return (
-              <div key={index} className={`flex items-start space-x-4 p-4 rounded-xl border transition-colors duration-200 ${
+              <div key={index} data-testid="stress-entry" className={`flex items-start space-x-4 p-4 rounded-xl border transition-colors duration-200 ${
                 isAutoDetected 
                   ? 'border-primary/50 bg-primary/5 hover:bg-primary/10 hover:border-primary/70' 
                   : 'border-border/50 bg-background/30 hover:bg-muted/50 hover:border-primary/50'
@@ -5,6 +5,7 @@ import { Input } from "@/components/ui/input";
 import { Checkbox } from "@/components/ui/checkbox";
 import { Target, Plus, Trash2, Flame, Calendar, Trophy, Pin } from "lucide-react";
 import { useWellness } from "@/hooks/wellness-context";
+import { useToast } from "@/hooks/use-toast";
 import { playClickSound, playTaskCompleteSound } from "@/lib/audio";
 
 export function TaskTracker() {
@@ -13,7 +14,8 @@ export function TaskTracker() {
     { id: "compulsory-2", name: "Breathing", completed: false, category: "mindfulness", isCompulsory: true, streak: 0 },
     { id: "compulsory-3", name: "Journaling", completed: false, category: "reflection", isCompulsory: true, streak: 0 },
   ]);
-  const { habits, addHabit, toggleHabit, deleteHabit, getDailyHabitCompletions, todos, toggleTodo, deleteTodo, chatSuggestions, setChatSuggestions, clearChatSuggestions, removeChatSuggestion, toggleChatSuggestion } = useWellness();
+  const { toast } = useToast();
+  const { habits, addHabit, findDuplicateHabit, toggleHabit, deleteHabit, getDailyHabitCompletions, todos, toggleTodo, deleteTodo, chatSuggestions, setChatSuggestions, clearChatSuggestions, removeChatSuggestion, toggleChatSuggestion } = useWellness();
   const [newTask, setNewTask] = useState("");
   const [showAdd, setShowAdd] = useState(false);
 
@@ -33,12 +35,18 @@ export function TaskTracker() {
 
   const handleAdd = () => {
     if (!newTask.trim()) return;
-    const added = addHabit(newTask.trim(), "health");
-    if (added) {
+    const name = newTask.trim();
+    if (addHabit(name, "health")) {
       playTaskCompleteSound();
       setNewTask("");
       setShowAdd(false);
+      return;
     }
+    const existing = findDuplicateHabit(name);
+    toast({
+      title: "Task already exists",
+      description: existing ? `"${name}" is too similar to "${existing}".` : `"${name}" is already on your list.`,
+    });
   };
 
   const toggleCompulsoryTask = (id) => {
@@ -1,17 +1,128 @@
-import { createContext, useContext, useState } from 'react';
+import { createContext, useContext, useEffect, useRef, useState } from 'react';
+import { TitleIndex, normalizeTitle } from '@/lib/title-index';
+import { COLLECTIONS, wellnessStore } from '@/lib/wellness-store';
+import { testHook } from '@/lib/test-hooks';
 
 const WellnessContext = createContext(null);
 
+// Initial data the browser tests can inject (via an init script) before the
+// first render, so a case can start from a known dataset instead of building
+// it through the UI. Absent in normal use, and ignored by normal production
+// builds (src/lib/test-hooks.ts).
+const readSeed = () => {
+  const seed = testHook('__WELLNESS_SEED__');
+  return seed && typeof seed === 'object' ? seed : null;
+};
+
+const seeded = (seed, key) => (Array.isArray(seed?.[key]) ? seed[key] : []);
+
+// Lists loaded from IndexedDB as soon as the provider mounts, because the
+// dashboard shows them. The others are loaded when a section that shows them
+// mounts and calls useCollections, so a large journal costs nothing until the
+// Journal tab is opened.
+const EAGER_COLLECTIONS = ['habits', 'todos', 'chatSuggestions', 'stressEntries'];
+
+// Lists kept newest first; the rest are oldest first.
+const NEWEST_FIRST = new Set(['stressEntries']);
+
+// The title field of each list that has a TitleIndex.
+const TITLE_FIELDS = { habits: 'name', todos: 'title', chatSuggestions: 'name' };
+
 export function WellnessProvider({ children }) {
-  const [habits, setHabits] = useState([]);
-  const [chatMessages, setChatMessages] = useState([]);
-  const [stressEntries, setStressEntries] = useState([]);
-  const [todos, setTodos] = useState([]);
-  const [sleepEntries, setSleepEntries] = useState([]);
-  const [journalEntries, setJournalEntries] = useState([]);
-  const [chatSuggestions, setChatSuggestions] = useState([]);
+  const [seed] = useState(readSeed);
+  const [habits, setHabits] = useState(() => seeded(seed, 'habits'));
+  const [chatMessages, setChatMessages] = useState(() => seeded(seed, 'chatMessages'));
+  const [stressEntries, setStressEntries] = useState(() => seeded(seed, 'stressEntries'));
+  const [todos, setTodos] = useState(() => seeded(seed, 'todos'));
+  const [sleepEntries, setSleepEntries] = useState(() => seeded(seed, 'sleepEntries'));
+  const [journalEntries, setJournalEntries] = useState(() => seeded(seed, 'journalEntries'));
+  const [chatSuggestions, setChatSuggestions] = useState(() => seeded(seed, 'chatSuggestions'));
+  const lists = { habits, chatMessages, stressEntries, todos, sleepEntries, journalEntries, chatSuggestions };
+  const setters = {
+    habits: setHabits,
+    chatMessages: setChatMessages,
+    stressEntries: setStressEntries,
+    todos: setTodos,
+    sleepEntries: setSleepEntries,
+    journalEntries: setJournalEntries,
+    chatSuggestions: setChatSuggestions,
+  };
+
+  // Title indexes of the three task lists, updated by every operation below
+  // that adds, renames or removes an item, so that duplicate checks are
+  // lookups instead of rescans of the lists.
+  const indexes = useRef(null);
+  if (indexes.current === null) {
+    indexes.current = {
+      habits: new TitleIndex(habits.map((habit) => habit.name)),
+      todos: new TitleIndex(todos.map((todo) => todo.title)),
+      chatSuggestions: new TitleIndex(chatSuggestions.map((suggestion) => suggestion.name)),
+    };
+  }
+  const { habits: habitIndex, todos: todoIndex, chatSuggestions: suggestionIndex } = indexes.current;
+
+  // Lists are persisted to IndexedDB (src/lib/wellness-store.ts) unless the
+  // tests seeded the provider, so seeded runs neither read nor overwrite
+  // stored data. A list is saved only once it has been loaded, and whatever
+  // was added to it before then is kept alongside the stored items.
+  const persist = seed === null;
+  const [hydrated, setHydrated] = useState({});
+  const persistence = useRef({ requested: new Set(), loaded: new Set(), ready: false });
+
+  const markLoaded = (name) => {
+    persistence.current.loaded.add(name);
+    setHydrated((prev) => ({ ...prev, [name]: true }));
+  };
+
+  const hydrate = (name) => {
+    const { requested, loaded } = persistence.current;
+    if (!persist || requested.has(name)) return;
+    requested.add(name);
+    wellnessStore[name].load().then((stored) => {
+      if (loaded.has(name)) return; // replaced while loading
+      const field = TITLE_FIELDS[name];
+      if (field) stored.forEach((item) => indexes.current[name].add(item[field]));
+      if (stored.length > 0) {
+        setters[name]((current) => (NEWEST_FIRST.has(name) ? [...current, ...stored] : [...stored, ...current]));
+      }
+      markLoaded(name);
+    });
+  };
+
+  // Replaces a list and everything stored for it.
+  const replaceCollection = (name, items) => {
+    persistence.current.requested.add(name);
+    if (persist) wellnessStore[name].reset();
+    const field = TITLE_FIELDS[name];
+    if (field) {
+      indexes.current[name].clear();
+      items.forEach((item) => indexes.current[name].add(item[field]));
+    }
+    setters[name](items);
+    markLoaded(name);
+  };
+
+  useEffect(() => {
+    EAGER_COLLECTIONS.forEach(hydrate);
+  }, []);
+
+  useEffect(() => {
+    if (!persist) return;
+    COLLECTIONS.forEach((name) => {
+      if (hydrated[name]) wellnessStore[name].save(lists[name]);
+    });
+  });
+
+  // "wellness:ready" marks when the dashboard's lists have been loaded.
+  useEffect(() => {
+    if (persistence.current.ready || !EAGER_COLLECTIONS.every((name) => !persist || hydrated[name])) return;
+    persistence.current.ready = true;
+    performance.mark('wellness:ready');
+  }, [hydrated]);
 
   const addHabit = (name, category) => {
+    if (habitIndex.findDuplicate(name)) return false;
+    habitIndex.add(name);
     const newHabit = {
       id: Date.now().toString(),
       name,
@@ -24,6 +135,14 @@ export function WellnessProvider({ children }) {
     return true;
   };
 
+  // The name of the habit that `name` duplicates, or null; lets the UI explain
+  // why addHabit or addPinnedTask returned false.
+  const findDuplicateHabit = (name) => {
+    const key = habitIndex.findDuplicate(name);
+    if (key === null) return null;
+    return habits.find((habit) => normalizeTitle(habit.name) === key)?.name ?? null;
+  };
+
   const toggleHabit = (id) => {
     setHabits(
       habits.map((habit) =>
@@ -33,6 +152,8 @@ export function WellnessProvider({ children }) {
   };
 
   const deleteHabit = (id) => {
+    const habit = habits.find((h) => h.id === id);
+    if (habit) habitIndex.remove(habit.name);
     setHabits(habits.filter((habit) => habit.id !== id));
   };
 
@@ -47,6 +168,8 @@ export function WellnessProvider({ children }) {
   };
 
   const addPinnedTask = (name) => {
+    if (habitIndex.findDuplicate(name)) return false;
+    habitIndex.add(name);
     const newHabit = {
       id: Date.now().toString(),
       name,
@@ -60,6 +183,11 @@ export function WellnessProvider({ children }) {
   };
 
   const updateTaskName = (id, name) => {
+    const habit = habits.find((h) => h.id === id);
+    if (habit) {
+      habitIndex.remove(habit.name);
+      habitIndex.add(name);
+    }
     setHabits(
       habits.map((habit) => (habit.id === id ? { ...habit, name } : habit))
     );
@@ -101,10 +229,10 @@ export function WellnessProvider({ children }) {
   const addTodos = (newTodos) => {
     const addedTodos = [];
     newTodos.forEach((todo, index) => {
-      const exists = todos.some(existing => 
-        existing.title.toLowerCase().trim() === todo.title.toLowerCase().trim()
-      );
+      // Exact or near-duplicate of a todo, including one added earlier in this call
+      const exists = todoIndex.findDuplicate(todo.title) !== null;
       if (!exists) {
+        todoIndex.add(todo.title);
         // Generate unique ID with timestamp and index to avoid duplicates
         const uniqueId = `todo-${Date.now()}-${index}-${Math.random().toString(36).substr(2, 9)}`;
         
@@ -126,25 +254,14 @@ export function WellnessProvider({ children }) {
     const addedTodos = [];
     
     tasks.forEach((task, index) => {
-      // Normalize task title for comparison
-      const normalizedTitle = task.title.toLowerCase().trim().replace(/[^a-z0-9\s]/g, '');
-      
-      // Check if task already exists in chat suggestions
-      const existsInSuggestions = chatSuggestions.some(existing => 
-        existing.name && existing.name.toLowerCase().trim().replace(/[^a-z0-9\s]/g, '') === normalizedTitle
-      );
-      
-      // Check if task already exists in habits
-      const existsInHabits = habits.some(existing => 
-        existing.name && existing.name.toLowerCase().trim().replace(/[^a-z0-9\s]/g, '') === normalizedTitle
-      );
-      
-      // Check if task already exists in todos
-      const existsInTodos = todos.some(existing => 
-        existing.title && existing.title.toLowerCase().trim().replace(/[^a-z0-9\s]/g, '') === normalizedTitle
-      );
+      // Skip exact and near-duplicates of chat suggestions, habits and todos
+      const exists =
+        suggestionIndex.findDuplicate(task.title) !== null ||
+        habitIndex.findDuplicate(task.title) !== null ||
+        todoIndex.findDuplicate(task.title) !== null;
       
-      if (!existsInSuggestions && !existsInHabits && !existsInTodos) {
+      if (!exists) {
+        suggestionIndex.add(task.title);
         // Generate unique ID with timestamp and index to avoid duplicates
         const uniqueId = `chatbot-${Date.now()}-${index}-${Math.random().toString(36).substr(2, 9)}`;
         
@@ -167,10 +284,21 @@ export function WellnessProvider({ children }) {
   };
 
   const clearChatSuggestions = () => {
+    suggestionIndex.clear();
     setChatSuggestions([]);
   };
 
+  // Replaces the whole list, so its index is rebuilt.
+  const replaceChatSuggestions = (next) => {
+    const list = typeof next === 'function' ? next(chatSuggestions) : next;
+    suggestionIndex.clear();
+    list.forEach((suggestion) => suggestionIndex.add(suggestion.name));
+    setChatSuggestions(list);
+  };
+
   const removeChatSuggestion = (id) => {
+    const suggestion = chatSuggestions.find((s) => s.id === id);
+    if (suggestion) suggestionIndex.remove(suggestion.name);
     setChatSuggestions(prev => prev.filter(suggestion => suggestion.id !== id));
   };
   
@@ -199,6 +327,8 @@ export function WellnessProvider({ children }) {
   };
 
   const deleteTodo = (id) => {
+    const todo = todos.find((t) => t.id === id);
+    if (todo) todoIndex.remove(todo.title);
     setTodos(prev => prev.filter(todo => todo.id !== id));
   };
 
@@ -225,11 +355,26 @@ export function WellnessProvider({ children }) {
     );
   };
 
+  // Test hook for the browser benchmarks: when an init script sets
+  // window.__WELLNESS_TEST_HOOK__ (in a build that honours test hooks), the
+  // current operations are published on window.__wellness after every render
+  // so they can be called directly.
+  useEffect(() => {
+    if (!testHook('__WELLNESS_TEST_HOOK__')) return;
+    (window as any).__wellness = {
+      registerChatSuggestions,
+      addTodos,
+      replace: replaceCollection,
+      sizes: () => Object.fromEntries(COLLECTIONS.map((name) => [name, lists[name].length])),
+    };
+  });
+
   return (
     <WellnessContext.Provider
       value={{
         habits,
         addHabit,
+        findDuplicateHabit,
         toggleHabit,
         deleteHabit,
         getDailyHabitCompletions,
@@ -247,7 +392,7 @@ export function WellnessProvider({ children }) {
         toggleTodo,
         deleteTodo,
         chatSuggestions,
-        setChatSuggestions,
+        setChatSuggestions: replaceChatSuggestions,
         registerChatSuggestions,
         clearChatSuggestions,
         removeChatSuggestion,
@@ -258,6 +403,7 @@ export function WellnessProvider({ children }) {
         addJournalEntry,
         updateJournalEntry,
         deleteJournalEntry,
+        hydrate,
       }}
     >
       {children}
@@ -271,4 +417,12 @@ export function useWellness() {
     throw new Error('useWellness must be used within a WellnessProvider');
   }
   return context;
-}
\ No newline at end of file
+}
+
+// Loads the given lists from storage when the calling component mounts.
+export function useCollections(...names) {
+  const { hydrate } = useWellness();
+  useEffect(() => {
+    names.forEach(hydrate);
+  }, [names.join()]);
+}
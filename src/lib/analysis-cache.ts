@@ -0,0 +1,121 @@
+import { openStore, type KeyValueStore } from "@/lib/idb";
+import { testHooksEnabled } from "@/lib/test-hooks";
+
+// Bounded cache for the model's analyses of chat messages. Entries are keyed
+// on a prompt version and the normalized message text, so sending the same
+// message again costs no model call, while a changed prompt never reuses old
+// answers. Entries expire after `ttlMs`; past `maxEntries` the least recently
+// used one is evicted. With `persist` the entries are mirrored to IndexedDB
+// and survive reloads. In builds that honour test hooks, the hit/miss
+// counters of the chat's cache are exposed on window.__analysisCache for the
+// browser tests.
+
+type Entry = { value: unknown; expiresAt: number };
+
+export type AnalysisCacheOptions = {
+  name: string;
+  maxEntries: number;
+  ttlMs: number;
+  persist?: boolean;
+};
+
+export type AnalysisCacheStats = { hits: number; misses: number; size: number };
+
+export function normalizeMessage(text: string) {
+  return text.normalize("NFKC").toLowerCase().replace(/\s+/g, " ").trim();
+}
+
+export class AnalysisCache {
+  private entries = new Map<string, Entry>();
+  private store: KeyValueStore<Entry> | null;
+  private hydrated: Promise<void>;
+  private hits = 0;
+  private misses = 0;
+
+  constructor(private options: AnalysisCacheOptions) {
+    this.store = options.persist ? openStore<Entry>(`wellness-${options.name}`) : null;
+    this.hydrated = this.hydrate();
+  }
+
+  private async hydrate() {
+    if (!this.store) return;
+    const now = Date.now();
+    // Oldest first, so that the Map's insertion order stays least recently used first.
+    const stored = (await this.store.entries()).sort((a, b) => a[1].expiresAt - b[1].expiresAt);
+    const fresh = new Map<string, Entry>();
+    for (const [key, entry] of stored) {
+      if (entry.expiresAt > now) fresh.set(key, entry);
+      else void this.store.delete(key);
+    }
+    // Anything cached while hydrating is newer than what was stored.
+    for (const [key, entry] of this.entries) {
+      fresh.delete(key);
+      fresh.set(key, entry);
+    }
+    this.entries = fresh;
+    this.evict();
+  }
+
+  private key(promptVersion: string, text: string) {
+    return `${promptVersion}\u0000${normalizeMessage(text)}`;
+  }
+
+  private evict() {
+    while (this.entries.size > this.options.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+      void this.store?.delete(oldest);
+    }
+  }
+
+  async get<T>(promptVersion: string, text: string): Promise<T | undefined> {
+    await this.hydrated;
+    const key = this.key(promptVersion, text);
+    const entry = this.entries.get(key);
+    if (entry && entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      void this.store?.delete(key);
+    } else if (entry) {
+      this.entries.delete(key);
+      this.entries.set(key, entry); // most recently used
+      this.hits += 1;
+      return structuredClone(entry.value) as T;
+    }
+    this.misses += 1;
+    return undefined;
+  }
+
+  set<T>(promptVersion: string, text: string, value: T) {
+    const key = this.key(promptVersion, text);
+    const entry = { value: structuredClone(value), expiresAt: Date.now() + this.options.ttlMs };
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    void this.store?.put(key, entry);
+    this.evict();
+  }
+
+  stats(): AnalysisCacheStats {
+    return { hits: this.hits, misses: this.misses, size: this.entries.size };
+  }
+
+  async clear() {
+    this.entries.clear();
+    this.hits = 0;
+    this.misses = 0;
+    await this.store?.clear();
+  }
+}
+
+export const chatAnalysisCache = new AnalysisCache({
+  name: "chat-analyses",
+  maxEntries: 200,
+  ttlMs: 12 * 60 * 60 * 1000,
+  persist: true,
+});
+
+if (testHooksEnabled && typeof window !== "undefined") {
+  (window as any).__analysisCache = {
+    stats: () => chatAnalysisCache.stats(),
+    clear: () => chatAnalysisCache.clear(),
+  };
+}
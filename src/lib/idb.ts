@@ -0,0 +1,78 @@
+// Small promise wrapper over a single IndexedDB object store. Persistence is
+// best effort: when IndexedDB is missing or fails (private browsing, a
+// blocked upgrade, quota), reads resolve empty and writes are dropped
+// instead of rejecting.
+
+export type KeyValueStore<T> = {
+  get(key: string): Promise<T | undefined>;
+  entries(): Promise<[string, T][]>;
+  put(key: string, value: T): Promise<void>;
+  delete(key: string): Promise<void>;
+  clear(): Promise<void>;
+  // Applies every change in one transaction. Resolves true once it has
+  // committed, false when it failed and nothing was changed.
+  write(batch: WriteBatch<T>): Promise<boolean>;
+};
+
+export type WriteBatch<T> = { clear?: boolean; put?: [string, T][]; delete?: string[] };
+
+const STORE = "kv";
+
+function request<R>(req: IDBRequest<R>): Promise<R> {
+  return new Promise((resolve, reject) => {
+    req.onsuccess = () => resolve(req.result);
+    req.onerror = () => reject(req.error);
+  });
+}
+
+export function openStore<T>(name: string): KeyValueStore<T> {
+  let connection: Promise<IDBDatabase | null> | null = null;
+
+  const connect = () =>
+    (connection ??= new Promise((resolve) => {
+      if (typeof indexedDB === "undefined") return resolve(null);
+      const req = indexedDB.open(name, 1);
+      req.onupgradeneeded = () => req.result.createObjectStore(STORE);
+      req.onsuccess = () => resolve(req.result);
+      req.onerror = () => resolve(null);
+      req.onblocked = () => resolve(null);
+    }));
+
+  const run = async <R>(mode: IDBTransactionMode, empty: R, body: (store: IDBObjectStore) => Promise<R>) => {
+    const db = await connect();
+    if (!db) return empty;
+    try {
+      return await body(db.transaction(STORE, mode).objectStore(STORE));
+    } catch (err) {
+      console.warn(`IndexedDB store "${name}" failed:`, err);
+      return empty;
+    }
+  };
+
+  const commit = (tx: IDBTransaction) =>
+    new Promise<void>((resolve, reject) => {
+      tx.oncomplete = () => resolve();
+      tx.onerror = () => reject(tx.error);
+      tx.onabort = () => reject(tx.error);
+    });
+
+  return {
+    get: (key) => run("readonly", undefined, (store) => request(store.get(key))),
+    entries: () =>
+      run("readonly", [] as [string, T][], async (store) => {
+        const [keys, values] = await Promise.all([request(store.getAllKeys()), request(store.getAll())]);
+        return keys.map((key, i) => [String(key), values[i]] as [string, T]);
+      }),
+    put: (key, value) => run("readwrite", undefined, async (store) => void (await request(store.put(value, key)))),
+    delete: (key) => run("readwrite", undefined, async (store) => void (await request(store.delete(key)))),
+    clear: () => run("readwrite", undefined, async (store) => void (await request(store.clear()))),
+    write: (batch) =>
+      run("readwrite", false, async (store) => {
+        if (batch.clear) store.clear();
+        for (const key of batch.delete ?? []) store.delete(key);
+        for (const [key, value] of batch.put ?? []) store.put(value, key);
+        await commit(store.transaction);
+        return true;
+      }),
+  };
+}
@@ -0,0 +1,57 @@
+import { Profiler, type ProfilerOnRenderCallback, type ReactNode } from "react";
+import { testHook } from "@/lib/test-hooks";
+
+// Opt-in render instrumentation for the browser tests. It is requested by a
+// `--mode profile` build (see vite.config.ts) or by an init script setting
+// window.__RENDER_PROFILE__ before the app loads. Every <RenderProfile> then
+// reports its commits to window.__renderRegistry; otherwise it renders its
+// children untouched. A plain production react-dom never calls a Profiler's
+// onRender, so there the registry is published with `supported: false`
+// instead of staying silently empty.
+
+type RenderStats = {
+  commits: number;
+  mounts: number;
+  updates: number;
+  actualMs: number;
+  maxActualMs: number;
+};
+
+const requested =
+  import.meta.env.MODE === "profile" ||
+  testHook("__RENDER_PROFILE__") === true;
+
+// react-dom reports Profiler commits in development and in its profiling build.
+const supported = import.meta.env.DEV || import.meta.env.MODE === "profile";
+
+const enabled = requested && supported;
+
+const registry: Record<string, RenderStats> = {};
+
+if (requested) {
+  (window as any).__renderRegistry = {
+    supported,
+    snapshot: () => JSON.parse(JSON.stringify(registry)),
+    reset: () => {
+      for (const id of Object.keys(registry)) delete registry[id];
+    },
+  };
+}
+
+const onRender: ProfilerOnRenderCallback = (id, phase, actualDuration) => {
+  const stats = (registry[id] ??= { commits: 0, mounts: 0, updates: 0, actualMs: 0, maxActualMs: 0 });
+  stats.commits += 1;
+  if (phase === "mount") stats.mounts += 1;
+  else stats.updates += 1;
+  stats.actualMs += actualDuration;
+  stats.maxActualMs = Math.max(stats.maxActualMs, actualDuration);
+};
+
+export function RenderProfile({ id, children }: { id: string; children: ReactNode }) {
+  if (!enabled) return <>{children}</>;
+  return (
+    <Profiler id={id} onRender={onRender}>
+      {children}
+    </Profiler>
+  );
+}
@@ -0,0 +1,42 @@
+import { lazy } from "react";
+import { testHook } from "@/lib/test-hooks";
+
+// Every section but the dashboard is split into its own chunk and loaded the
+// first time it is shown. Navigation prefetches a section when its button is
+// hovered or focused, and Index prefetches the rest once the browser is idle;
+// tests that measure what each tab downloads turn the idle prefetch off with
+// window.__SECTION_PREFETCH__ = false.
+const loaders = {
+  habit: () => import("@/components/HabitTracker"),
+  stress: () => import("@/components/StressTracker"),
+  sleep: () => import("@/components/SleepTracker"),
+  tasks: () => import("@/components/TaskTracker"),
+  journal: () => import("@/components/Journal"),
+  calendar: () => import("@/components/CalendarView"),
+  chat: () => import("@/components/ChatBot"),
+};
+
+export const HabitTracker = lazy(() => loaders.habit().then((m) => ({ default: m.HabitTracker })));
+export const StressTracker = lazy(() => loaders.stress().then((m) => ({ default: m.StressTracker })));
+export const SleepTracker = lazy(() => loaders.sleep().then((m) => ({ default: m.SleepTracker })));
+export const TaskTracker = lazy(() => loaders.tasks().then((m) => ({ default: m.TaskTracker })));
+export const Journal = lazy(() => loaders.journal().then((m) => ({ default: m.Journal })));
+export const CalendarView = lazy(() => loaders.calendar().then((m) => ({ default: m.CalendarView })));
+export const ChatBot = lazy(() => loaders.chat().then((m) => ({ default: m.ChatBot })));
+
+export function prefetchSection(id: string) {
+  const load = loaders[id as keyof typeof loaders];
+  // A failed prefetch is not an error; the section retries when it renders.
+  load?.().catch(() => {});
+}
+
+export function prefetchSectionsWhenIdle() {
+  if (testHook("__SECTION_PREFETCH__") === false) return () => {};
+  const prefetchAll = () => Object.keys(loaders).forEach(prefetchSection);
+  if ("requestIdleCallback" in window) {
+    const handle = window.requestIdleCallback(prefetchAll, { timeout: 5000 });
+    return () => window.cancelIdleCallback(handle);
+  }
+  const handle = window.setTimeout(prefetchAll, 2000);
+  return () => window.clearTimeout(handle);
+}
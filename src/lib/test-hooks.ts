@@ -0,0 +1,12 @@
+// Window globals the browser tests set from an init script before the app
+// loads (window.__GEMINI_BASE_URL__, window.__WELLNESS_SEED__, ...). They are
+// only honoured by the dev server and by builds made with VITE_TEST_HOOKS=1,
+// as the test harness's builds are; a normal production build ignores them,
+// so no other script on the page can redirect the chat or rewrite the data.
+
+export const testHooksEnabled = import.meta.env.DEV || import.meta.env.VITE_TEST_HOOKS === "1";
+
+export function testHook<T = unknown>(name: string): T | undefined {
+  if (!testHooksEnabled || typeof window === "undefined") return undefined;
+  return (window as any)[name] as T | undefined;
+}
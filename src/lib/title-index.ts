@@ -0,0 +1,140 @@
+// Duplicate detection for habit, todo and suggestion titles.
+//
+// A TitleIndex keeps two maps up to date as titles are added and removed:
+// the normalized title ("Read a book!" -> "read a book", "Читать книгу!" ->
+// "читать книгу") for exact matches in any script, and an inverted index
+// from word stems to titles for near-duplicates ("Reading books" has the
+// same stems, {read, book}, as "Read a book"; stemming is English only). A
+// lookup only visits titles that share one of the query's rarest stems, so
+// it stays cheap however many titles are indexed. Titles with different
+// numbers are never near-duplicates ("Walk 10 minutes", "Walk 20 minutes").
+
+// Stem-set Jaccard similarity at or above which two titles are duplicates.
+export const SIMILARITY_THRESHOLD = 0.75;
+
+const STOPWORDS = new Set([
+  "a", "an", "the", "to", "of", "for", "and", "or", "with", "my", "your", "in", "on", "at", "some", "do", "go",
+]);
+
+// Light suffix stripping, enough to fold plurals and common verb forms
+// together; not a full Porter stemmer. Checked in order, first match wins.
+const SUFFIXES: [suffix: string, replacement: string, minLength: number][] = [
+  ["ations", "", 7],
+  ["ation", "", 6],
+  ["ings", "", 6],
+  ["ing", "", 5],
+  ["ies", "y", 5],
+  ["ied", "y", 5],
+  ["ness", "", 6],
+  ["ful", "", 6],
+  ["ly", "", 6],
+  ["ed", "", 5],
+  ["es", "", 5],
+  ["ate", "", 7],
+  ["s", "", 4],
+];
+
+export function normalizeTitle(title: string) {
+  // Letters (with their combining marks) and digits of any script; everything else separates words.
+  return title.normalize("NFKC").toLowerCase().replace(/[^\p{L}\p{M}\p{N}]+/gu, " ").trim();
+}
+
+export function stem(word: string) {
+  for (const [suffix, replacement, minLength] of SUFFIXES) {
+    if (word.length < minLength || !word.endsWith(suffix)) continue;
+    if (suffix === "s" && word.endsWith("ss")) return word;
+    if (suffix === "es" && !/(s|x|z|ch|sh)es$/.test(word)) continue;
+    let stemmed = word.slice(0, word.length - suffix.length) + replacement;
+    // running -> runn -> run, stopped -> stopp -> stop
+    if (/([^aeiouls])\1$/.test(stemmed)) stemmed = stemmed.slice(0, -1);
+    return stemmed;
+  }
+  return word;
+}
+
+export function titleStems(normalized: string) {
+  const words = normalized.split(" ").filter((word) => word && !STOPWORDS.has(word));
+  return [...new Set(words.map(stem))];
+}
+
+const numbersOf = (stems: string[]) => stems.filter((s) => /^\p{N}+$/u.test(s)).sort().join(" ");
+
+type Indexed = { stems: string[]; numbers: string; count: number };
+
+export class TitleIndex {
+  // normalized title -> its stems and how many indexed items have that title
+  private titles = new Map<string, Indexed>();
+  // stem -> normalized titles containing it
+  private postings = new Map<string, Set<string>>();
+
+  constructor(titles: Iterable<string> = []) {
+    for (const title of titles) this.add(title);
+  }
+
+  get size() {
+    return this.titles.size;
+  }
+
+  add(title: string) {
+    const key = normalizeTitle(title ?? "");
+    if (!key) return;
+    const existing = this.titles.get(key);
+    if (existing) {
+      existing.count += 1;
+      return;
+    }
+    const stems = titleStems(key);
+    this.titles.set(key, { stems, numbers: numbersOf(stems), count: 1 });
+    for (const s of stems) {
+      let titles = this.postings.get(s);
+      if (!titles) this.postings.set(s, (titles = new Set()));
+      titles.add(key);
+    }
+  }
+
+  remove(title: string) {
+    const key = normalizeTitle(title ?? "");
+    const existing = this.titles.get(key);
+    if (!existing) return;
+    if (--existing.count > 0) return;
+    this.titles.delete(key);
+    for (const s of existing.stems) {
+      const titles = this.postings.get(s);
+      titles?.delete(key);
+      if (titles && titles.size === 0) this.postings.delete(s);
+    }
+  }
+
+  clear() {
+    this.titles.clear();
+    this.postings.clear();
+  }
+
+  // The indexed normalized title that `title` duplicates, or null.
+  findDuplicate(title: string, threshold = SIMILARITY_THRESHOLD): string | null {
+    const key = normalizeTitle(title ?? "");
+    if (!key) return null;
+    if (this.titles.has(key)) return key;
+    const stems = titleStems(key);
+    if (stems.length === 0) return null;
+
+    // A title with Jaccard similarity >= threshold shares at least
+    // ceil(threshold * |stems|) stems with the query, so it must contain one
+    // of the query's |stems| - ceil(threshold * |stems|) + 1 rarest stems.
+    const byRarity = [...stems].sort((a, b) => (this.postings.get(a)?.size ?? 0) - (this.postings.get(b)?.size ?? 0));
+    const prefix = byRarity.slice(0, stems.length - Math.ceil(threshold * stems.length) + 1);
+    const query = new Set(stems);
+    const numbers = numbersOf(stems);
+    for (const s of prefix) {
+      for (const candidate of this.postings.get(s) ?? []) {
+        const indexed = this.titles.get(candidate)!;
+        if (indexed.numbers !== numbers) continue;
+        const other = indexed.stems;
+        if (other.length < threshold * stems.length || stems.length < threshold * other.length) continue;
+        const shared = other.filter((o) => query.has(o)).length;
+        if (shared / (stems.length + other.length - shared) >= threshold) return candidate;
+      }
+    }
+    return null;
+  }
+}
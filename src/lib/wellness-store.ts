@@ -0,0 +1,152 @@
+import { openStore, type KeyValueStore } from "@/lib/idb";
+import { testHooksEnabled } from "@/lib/test-hooks";
+
+// IndexedDB persistence for the WellnessProvider lists. Every list lives in
+// its own database as chunks of CHUNK_SIZE items under ordered keys, so a
+// list is read back with one getAll and a change rewrites only the chunks
+// whose items changed: appending a journal entry to 10k rewrites the last
+// chunk, not the whole list. Saves are debounced, and everything saved to a
+// list within FLUSH_DELAY_MS is written in a single transaction. Pending
+// writes are flushed when the page is hidden. A write that fails (quota, a
+// closed connection) changes nothing, so its chunks are written again with
+// the next save.
+//
+// How long each list took to load is recorded (performance measures
+// "wellness:hydrate:<list>") and, in builds that honour test hooks, exposed
+// with the write counters on window.__wellnessStore for the browser tests.
+
+export const COLLECTIONS = [
+  "habits",
+  "todos",
+  "chatSuggestions",
+  "stressEntries",
+  "sleepEntries",
+  "journalEntries",
+  "chatMessages",
+] as const;
+
+export type Collection = (typeof COLLECTIONS)[number];
+
+export type HydrationTiming = { items: number; chunks: number; startMs: number; ms: number };
+
+export type WriteStats = { transactions: number; chunksWritten: number; chunksDeleted: number; failed: number };
+
+const CHUNK_SIZE = 500;
+const FLUSH_DELAY_MS = 300;
+
+const chunkKey = (index: number) => `chunk-${String(index).padStart(6, "0")}`;
+
+const hydration: Partial<Record<Collection, HydrationTiming>> = {};
+const writes: WriteStats = { transactions: 0, chunksWritten: 0, chunksDeleted: 0, failed: 0 };
+
+class CollectionStore {
+  private store: KeyValueStore<unknown[]>;
+  // The list as last successfully written, compared item by item with the next one.
+  private saved: unknown[] = [];
+  private storedChunks = 0;
+  private clearOnFlush = false;
+  private replaced = false;
+  private pending: unknown[] | null = null;
+  private timer: ReturnType<typeof setTimeout> | null = null;
+  private writing: Promise<void> = Promise.resolve();
+  private loading: Promise<unknown[]> | null = null;
+
+  constructor(private name: Collection) {
+    this.store = openStore<unknown[]>(`wellness-${name}`);
+  }
+
+  // The stored list; read once, later calls share the first read.
+  load() {
+    return (this.loading ??= this.read());
+  }
+
+  private async read() {
+    const startMs = performance.now();
+    const chunks = await this.store.entries(); // in key order
+    const items = chunks.flatMap(([, chunk]) => chunk);
+    if (!this.replaced) {
+      this.saved = items;
+      this.storedChunks = chunks.length;
+    }
+    hydration[this.name] = { items: items.length, chunks: chunks.length, startMs, ms: performance.now() - startMs };
+    performance.measure?.(`wellness:hydrate:${this.name}`, { start: startMs });
+    return items;
+  }
+
+  // Drops whatever is stored; the next save writes its list in full.
+  reset() {
+    this.replaced = true;
+    this.loading = Promise.resolve([]);
+    this.saved = [];
+    this.clearOnFlush = true;
+  }
+
+  save(list: unknown[]) {
+    if (list === (this.pending ?? this.saved)) return;
+    this.pending = list;
+    if (this.timer === null) this.timer = setTimeout(() => void this.flush(), FLUSH_DELAY_MS);
+  }
+
+  flush() {
+    if (this.timer !== null) clearTimeout(this.timer);
+    this.timer = null;
+    const list = this.pending;
+    this.pending = null;
+    if (list !== null) this.writing = this.writing.then(() => this.write(list));
+    return this.writing;
+  }
+
+  private async write(list: unknown[]) {
+    const previous = this.saved;
+    const chunks = Math.ceil(list.length / CHUNK_SIZE);
+    const put: [string, unknown[]][] = [];
+    for (let i = 0; i < chunks; i++) {
+      const start = i * CHUNK_SIZE;
+      const end = Math.min(start + CHUNK_SIZE, list.length);
+      // A chunk is rewritten when it is new, changed length or holds a changed item.
+      const previousEnd = Math.min(start + CHUNK_SIZE, previous.length);
+      let changed = this.clearOnFlush || i >= this.storedChunks || previousEnd !== end;
+      for (let j = start; !changed && j < end; j++) changed = list[j] !== previous[j];
+      if (changed) put.push([chunkKey(i), list.slice(start, end)]);
+    }
+    const stale: string[] = [];
+    for (let i = chunks; !this.clearOnFlush && i < this.storedChunks; i++) stale.push(chunkKey(i));
+    if (put.length === 0 && stale.length === 0 && !this.clearOnFlush) {
+      this.saved = list;
+      return;
+    }
+    if (!(await this.store.write({ clear: this.clearOnFlush, put, delete: stale }))) {
+      writes.failed += 1;
+      return;
+    }
+    this.saved = list;
+    writes.transactions += 1;
+    writes.chunksWritten += put.length;
+    writes.chunksDeleted += stale.length;
+    this.storedChunks = chunks;
+    this.clearOnFlush = false;
+  }
+}
+
+export const wellnessStore = Object.fromEntries(
+  COLLECTIONS.map((name) => [name, new CollectionStore(name)])
+) as Record<Collection, CollectionStore>;
+
+export function flushWellnessStore() {
+  return Promise.all(COLLECTIONS.map((name) => wellnessStore[name].flush())).then(() => undefined);
+}
+
+if (typeof window !== "undefined") {
+  const flushWhenHidden = () => void flushWellnessStore();
+  window.addEventListener("pagehide", flushWhenHidden);
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") flushWhenHidden();
+  });
+  if (testHooksEnabled) {
+    (window as any).__wellnessStore = {
+      hydration: () => ({ ...hydration }),
+      writes: () => ({ ...writes }),
+      flush: flushWellnessStore,
+    };
+  }
+}
@@ -1,37 +1,47 @@
-import { useState } from "react";
+import { Suspense, useEffect, useState } from "react";
 import { Navigation } from "@/components/Navigation";
 import { Dashboard } from "@/components/Dashboard";
-import { StressTracker } from "@/components/StressTracker";
-import { SleepTracker } from "@/components/SleepTracker";
-import { TaskTracker } from "@/components/TaskTracker";
-import { Journal } from "@/components/Journal";
-import { CalendarView } from "@/components/CalendarView";
-import { ChatBot } from "@/components/ChatBot";
-import { HabitTracker } from "@/components/HabitTracker";
+import {
+  StressTracker,
+  SleepTracker,
+  TaskTracker,
+  Journal,
+  CalendarView,
+  ChatBot,
+  HabitTracker,
+  prefetchSectionsWhenIdle,
+} from "@/lib/sections";
+import { RenderProfile } from "@/lib/render-profile";
+
+const SectionFallback = () => (
+  <div data-testid="section-loading" aria-busy="true" className="min-h-[50vh]" />
+);
 
 const Index = () => {
   const [activeSection, setActiveSection] = useState("dashboard");
 
+  useEffect(() => prefetchSectionsWhenIdle(), []);
+
   const renderSection = () => {
     switch (activeSection) {
       case "dashboard":
         return <Dashboard onSectionChange={setActiveSection} />;
         case "habit":
-        return <HabitTracker />;
+        return <RenderProfile id="HabitTracker"><HabitTracker /></RenderProfile>;
       case "stress":
-        return <StressTracker />;
+        return <RenderProfile id="StressTracker"><StressTracker /></RenderProfile>;
       case "sleep":
-        return <SleepTracker />;
+        return <RenderProfile id="SleepTracker"><SleepTracker /></RenderProfile>;
       case "tasks":
-        return <TaskTracker />;
+        return <RenderProfile id="TaskTracker"><TaskTracker /></RenderProfile>;
       case "journal":
-        return <Journal />;
+        return <RenderProfile id="Journal"><Journal /></RenderProfile>;
       case "calendar":
-        return <CalendarView />;
+        return <RenderProfile id="CalendarView"><CalendarView /></RenderProfile>;
       case "chat":
-        return <ChatBot context="tab" />;
+        return <RenderProfile id="ChatBot"><ChatBot context="tab" /></RenderProfile>;
       default:
-        return <ChatBot context="tab" />;
+        return <RenderProfile id="ChatBot"><ChatBot context="tab" /></RenderProfile>;
     }
   };
 
@@ -41,8 +51,10 @@ const Index = () => {
         activeSection={activeSection} 
         onSectionChange={setActiveSection} 
       />
-      <main className="relative z-10 p-4 md:p-6 lg:p-12 pt-24 md:pt-28 pb-[7rem] md:pb-[8rem] [padding-top:calc(env(safe-area-inset-top)+6rem)] [padding-bottom:calc(env(safe-area-inset-bottom)+8rem)]">
-        {renderSection()}
+      <main data-testid={`section-${activeSection}`} className="relative z-10 p-4 md:p-6 lg:p-12 pt-24 md:pt-28 pb-[7rem] md:pb-[8rem] [padding-top:calc(env(safe-area-inset-top)+6rem)] [padding-bottom:calc(env(safe-area-inset-bottom)+8rem)]">
+        <RenderProfile id="Index.renderSection">
+          <Suspense fallback={<SectionFallback />}>{renderSection()}</Suspense>
+        </RenderProfile>
       </main>
     </div>
   );
@@ -1,83 +1,79 @@
-import asyncio
-from playwright import async_api
+from harness import ChatBot, click, fill, open_app, run_standalone, settle
+from harness.gemini import analysis_cache_stats, habit_request, install_gemini_stub
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Send a general mental wellness query to the ChatBot input field.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill("I'm feeling a bit stressed lately, can you help me?")
-        
+HABIT_REQUEST = 'Please add a habit: drink water every morning.'
+
+# Records whether a streamed reply is shown at any point until it is asked.
+_WATCH_STREAMING = """() => {
+  window.__streamingSeen = false;
+  const observer = new MutationObserver(() => {
+    if (document.querySelector('[data-testid="chat-streaming"]')) window.__streamingSeen = true;
+  });
+  observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+  window.__streamingWatched = () => {
+    observer.disconnect();
+    return window.__streamingSeen;
+  };
+}"""
 
-        # Send a message containing crisis-related keywords (e.g., 'suicide', 'harm') to verify crisis detection and resource suggestion.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('I have been thinking about suicide and feeling like I might harm myself.')
-        
+async def run_test(context):
+    # Answer Gemini calls with the local stand-in so replies are deterministic and offline;
+    # HABIT_REQUEST is analysed as a request to add a habit
+    gemini = await install_gemini_stub(
+        context, answers={'message': habit_request(HABIT_REQUEST, ['Drink water every morning'])}
+    )
 
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Open the app in a fresh page of the browser context provided by the runner
+    page = await open_app(context)
+    
+    # Interact with the page elements to simulate user flow
+    # Send a general mental wellness query to the ChatBot input field.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
+    await fill(elem, "I'm feeling a bit stressed lately, can you help me?")
+    
 
-        # Engage in multiple conversational exchanges to trigger AI habit suggestion.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill("Lately, I've been struggling to maintain a healthy routine.")
-        
+    # Send a message containing crisis-related keywords (e.g., 'suicide', 'harm') to verify crisis detection and resource suggestion.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
+    await fill(elem, 'I have been thinking about suicide and feeling like I might harm myself.')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button').nth(0)
+    await click(elem)
+    
 
-        assert False, "Test failed: Expected result unknown, forcing failure as per instructions."
-        await asyncio.sleep(5)
+    # Engage in multiple conversational exchanges to trigger AI habit suggestion.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
+    await fill(elem, "Lately, I've been struggling to maintain a healthy routine.")
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Assert the crisis message was answered by the model with crisis support resources prepended.
+    await page.get_by_text('immediate support').first.wait_for(state='visible', timeout=15000)
+    assert gemini.count('reply') >= 1, 'Expected the chat reply to come from the Gemini stand-in'
+
+
+    # Send a message twice, the second time with different case and spacing, and assert the repeat
+    # is analysed from the cache without any analysis call to the model.
+    chat = ChatBot(page)
+    await chat.wait_for_reply(await chat.send('I feel stressed about my work deadline.'))
+    analyses = gemini.count() - gemini.count('reply')
+    before = await analysis_cache_stats(page)
+    await chat.wait_for_reply(await chat.send('  i feel STRESSED about my work   deadline. '))
+    after = await analysis_cache_stats(page)
+    assert gemini.count() - gemini.count('reply') == analyses, gemini.calls
+    assert after['hits'] > before['hits'], f'Expected analysis cache hits: {before} -> {after}'
+
+
+    # Send a habit request: in fused mode its reply is requested alongside the analysis and must be
+    # dropped unseen, leaving only the habit confirmation.
+    await page.evaluate(_WATCH_STREAMING)
+    confirmation = await chat.wait_for_reply(await chat.send(HABIT_REQUEST))
+    await settle(page)
+    assert not await page.evaluate('() => window.__streamingWatched()'), 'A reply to the habit request was streamed'
+    assert "I've added 1 habit" in await confirmation.inner_text(), await confirmation.inner_text()
+
+if __name__ == "__main__":
+    run_standalone(run_test)
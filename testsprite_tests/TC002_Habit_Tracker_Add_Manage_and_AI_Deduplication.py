@@ -1,110 +1,98 @@
-import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Look for any navigation or menu elements to access the Habit Tracker screen.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Click the 'Habits' button to navigate to the Habit Tracker screen.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Add Habit' button to start adding a new habit.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Enter a new habit name in the input field and click 'Add' to add the habit.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Read a book')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Mark the habit 'Read a book' as completed for today by clicking its checkbox.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div[4]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click 'Add Habit' button to add a new habit similar to 'Read a book' to test duplicate prevention.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Enter a semantically similar habit name to 'Read a book' such as 'Reading books' and click 'Add' to test duplicate prevention.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Reading books')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+from harness import click, fill, open_app, run_standalone
+
+async def run_test(context):
+    # Open the app in a fresh page of the browser context provided by the runner
+    page = await open_app(context)
+    
+    # Interact with the page elements to simulate user flow
+    # Look for any navigation or menu elements to access the Habit Tracker screen.
+    await page.mouse.wheel(0, await page.evaluate("window.innerHeight"))
+    
+
+    # Click the 'Habits' button to navigate to the Habit Tracker screen.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[5]').nth(0)
+    await click(elem)
+    
+
+    # Click the 'Add Habit' button to start adding a new habit.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Enter a new habit name in the input field and click 'Add' to add the habit.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
+    await fill(elem, 'Read a book')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Mark the habit 'Read a book' as completed for today by clicking its checkbox.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div[4]/div/div/button').nth(0)
+    await click(elem)
+    
+
+    # Click 'Add Habit' button to add a new habit similar to 'Read a book' to test duplicate prevention.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Enter a semantically similar habit name to 'Read a book' such as 'Reading books' and click 'Add' to test duplicate prevention.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
+    await fill(elem, 'Reading books')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Assert the near-duplicate 'Reading books' was rejected and 'Read a book' is listed once.
+    main = page.locator('main')
+    assert await main.get_by_text('Reading books', exact=True).count() == 0, "Near-duplicate 'Reading books' was added"
+    assert await main.get_by_text('Read a book', exact=True).count() == 1, "Expected 'Read a book' exactly once"
+    # The rejection is explained by a toast naming the habit it matched.
+    await page.get_by_text('"Reading books" is too similar to "Read a book".').wait_for()
+    
+
+    # The add form stays open after a rejection; add a habit with a non-Latin title.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
+    await fill(elem, 'Читать книгу')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Open the add form again and enter the same title with different case and punctuation.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
+    await click(elem)
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
+    await fill(elem, 'читать книгу!')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Assert the non-Latin duplicate was rejected too.
+    assert await main.get_by_text('Читать книгу', exact=True).count() == 1, "Expected 'Читать книгу' exactly once"
+    assert await main.get_by_text('читать книгу!', exact=True).count() == 0, "Duplicate 'читать книгу!' was added"
+
+if __name__ == "__main__":
+    run_standalone(run_test)
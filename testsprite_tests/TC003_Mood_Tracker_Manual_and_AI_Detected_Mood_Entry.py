@@ -1,146 +1,97 @@
-import asyncio
-from playwright import async_api
+from harness import click, fill, open_app, run_standalone
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+async def run_test(context):
+    # Open the app in a fresh page of the browser context provided by the runner
+    page = await open_app(context)
+    
+    # Interact with the page elements to simulate user flow
+    # Scroll down or try to find navigation or link to Mood Tracker component.
+    await page.mouse.wheel(0, await page.evaluate("window.innerHeight"))
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Scroll down or try to find navigation or link to Mood Tracker component.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to open a menu or sidebar if available to find Mood Tracker or related components.
-        await page.mouse.wheel(0, window.innerHeight)
-        
 
-        # Try to reload the page to see if UI components load properly or if there is an error causing empty page.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
+    # Try to open a menu or sidebar if available to find Mood Tracker or related components.
+    await page.mouse.wheel(0, await page.evaluate("window.innerHeight"))
+    
 
-        # Click the 'Mood' button to navigate to the Mood Tracker component.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Try to reload the page to see if UI components load properly or if there is an error causing empty page.
+    await page.goto('/', timeout=10000)
+    
 
-        # Select a mood on the 5-point scale (e.g., 'Okay'), enter a note, and save the mood entry.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click the 'Mood' button to navigate to the Mood Tracker component.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[3]').nth(0)
+    await click(elem)
+    
 
-        # Enter a note in the text area and click 'Save Mood Entry' to save the manual mood entry.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Feeling neutral today, just an average day.')
-        
+    # Select a mood on the 5-point scale (e.g., 'Okay'), enter a note, and save the mood entry.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/button[3]').nth(0)
+    await click(elem)
+    
 
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Enter a note in the text area and click 'Save Mood Entry' to save the manual mood entry.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[2]/textarea').nth(0)
+    await fill(elem, 'Feeling neutral today, just an average day.')
+    
 
-        # Navigate to Chat component to engage with AI ChatBot and trigger mood analysis for automatic mood entry.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/button').nth(0)
+    await click(elem)
+    
 
-        # Send a chat message to the AI ChatBot to trigger mood analysis and automatic mood entry.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('I am feeling a bit stressed and overwhelmed today.')
-        
+    # Navigate to Chat component to engage with AI ChatBot and trigger mood analysis for automatic mood entry.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button').nth(0)
+    await click(elem)
+    
 
-        # Click the send button to submit the chat message and wait for AI response and mood detection.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Send a chat message to the AI ChatBot to trigger mood analysis and automatic mood entry.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
+    await fill(elem, 'I am feeling a bit stressed and overwhelmed today.')
+    
 
-        # Navigate back to the Mood Tracker component to verify if the AI-detected mood entry was automatically added with correct data.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click the send button to submit the chat message and wait for AI response and mood detection.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button').nth(0)
+    await click(elem)
+    
 
-        # Assertion: Check that the manual mood entry is saved with timestamp and appears in history.
-        recent_moods_section = await frame.locator('text=Recent Moods').nth(0)
-        entries = await recent_moods_section.locator('xpath=..//div[contains(@class, "entry")]').all()
-        assert len(entries) >= 2, 'Expected at least two mood entries in history'
-        # Verify the most recent manual entry matches the one just added
-        latest_entry_text = await entries[1].inner_text()
-        assert 'Okay' in latest_entry_text, 'Manual mood entry "Okay" not found in recent moods'
-        assert 'Feeling neutral today, just an average day.' in latest_entry_text, 'Manual mood note not found in recent moods'
-        assert any(char.isdigit() for char in latest_entry_text), 'Timestamp missing in manual mood entry'
-          
-        # Assertion: Verify that the AI detected mood is automatically added to the Mood Tracker with correct data
-        ai_entry_text = await entries[0].inner_text()
-        assert 'Poor' in ai_entry_text, 'AI detected mood "Poor" not found in recent moods'
-        assert 'Auto-detected from chat' in ai_entry_text, 'AI mood auto-detection note missing'
-        assert any(char.isdigit() for char in ai_entry_text), 'Timestamp missing in AI mood entry'
-          
-        # Assertion: Confirm mood representations and notes are accurately displayed in chronological order
-        dates = []
-        for i in range(len(entries)):
-            text = await entries[i].inner_text()
-            # Extract date_time from the entry text
-            import re
-            match = re.search(r'\d{1,2}/\d{1,2}/\d{4}, \d{1,2}:\d{2}:\d{2} [AP]M', text)
-            assert match, f'Date/time not found in entry {i}'
-            dates.append(match.group(0))
-        from datetime import datetime
-        date_objs = [datetime.strptime(d, '%m/%d/%Y, %I:%M:%S %p') for d in dates]
-        assert date_objs == sorted(date_objs, reverse=True), 'Mood entries are not in chronological order (most recent first)'
-        await asyncio.sleep(5)
+    # Navigate back to the Mood Tracker component to verify if the AI-detected mood entry was automatically added with correct data.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[3]').nth(0)
+    await click(elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Assertion: Check that the manual mood entry is saved with timestamp and appears in history.
+    recent_moods_section = await frame.locator('text=Recent Moods').nth(0)
+    entries = await recent_moods_section.locator('xpath=..//div[contains(@class, "entry")]').all()
+    assert len(entries) >= 2, 'Expected at least two mood entries in history'
+    # Verify the most recent manual entry matches the one just added
+    latest_entry_text = await entries[1].inner_text()
+    assert 'Okay' in latest_entry_text, 'Manual mood entry "Okay" not found in recent moods'
+    assert 'Feeling neutral today, just an average day.' in latest_entry_text, 'Manual mood note not found in recent moods'
+    assert any(char.isdigit() for char in latest_entry_text), 'Timestamp missing in manual mood entry'
+      
+    # Assertion: Verify that the AI detected mood is automatically added to the Mood Tracker with correct data
+    ai_entry_text = await entries[0].inner_text()
+    assert 'Poor' in ai_entry_text, 'AI detected mood "Poor" not found in recent moods'
+    assert 'Auto-detected from chat' in ai_entry_text, 'AI mood auto-detection note missing'
+    assert any(char.isdigit() for char in ai_entry_text), 'Timestamp missing in AI mood entry'
+      
+    # Assertion: Confirm mood representations and notes are accurately displayed in chronological order
+    dates = []
+    for i in range(len(entries)):
+        text = await entries[i].inner_text()
+        # Extract date_time from the entry text
+        import re
+        match = re.search(r'\d{1,2}/\d{1,2}/\d{4}, \d{1,2}:\d{2}:\d{2} [AP]M', text)
+        assert match, f'Date/time not found in entry {i}'
+        dates.append(match.group(0))
+    from datetime import datetime
+    date_objs = [datetime.strptime(d, '%m/%d/%Y, %I:%M:%S %p') for d in dates]
+    assert date_objs == sorted(date_objs, reverse=True), 'Mood entries are not in chronological order (most recent first)'
+
+if __name__ == "__main__":
+    run_standalone(run_test)
@@ -1,153 +1,104 @@
-import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Open the Sleep Tracker component.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Enter bedtime and wake-up time for the current day.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('22:30')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('06:30')
-        
-
-        # Select a sleep quality rating and verify it is assessed and displayed correctly.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Save Sleep Entry' button to save the current sleep log.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Enter and save multiple days of sleep data with varying times and quality ratings.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('23:00')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('07:00')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click 'Save Sleep Entry' to log the second sleep entry.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Verify sleep patterns and trends visualization correctness over time.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Log additional days of sleep data with varied times and quality ratings to enrich the dataset and verify trend visualization.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('22:45')
-        
-
-        # Enter wake-up time and select sleep quality to enable saving the sleep entry.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('06:15')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Save Sleep Entry' button to save the third sleep entry.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Complete the test by confirming the sleep pattern visualization is accurate and then stop.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Assertion: Confirm that the sleep duration is calculated accurately for the last entered sleep entry.
-        sleep_duration_text = await frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[4]/div/span').inner_text()
-        assert '7h 30m' in sleep_duration_text.lower(), f"Expected sleep duration '7h 30m' but got {sleep_duration_text}"
-          
-        # Assertion: Check that sleep quality is assessed and displayed based on predefined criteria.
-        sleep_quality_text = await frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[4]/div/span[2]').inner_text()
-        assert sleep_quality_text.lower() in ['excellent', 'good', 'fair', 'poor'], f"Unexpected sleep quality value: {sleep_quality_text}"
-          
-        # Assertion: Verify sleep patterns and trends are visualized correctly over time.
-        sleep_history_entries = await frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/div').all_inner_texts()
-        assert any('7h 30m' in entry.lower() for entry in sleep_history_entries), 'Sleep duration 7h 30m not found in sleep history visualization'
-        assert any(q in ''.join(sleep_history_entries).lower() for q in ['excellent', 'good', 'fair', 'poor']), 'Sleep quality not found in sleep history visualization'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+from harness import click, fill, open_app, run_standalone
+
+async def run_test(context):
+    # Open the app in a fresh page of the browser context provided by the runner
+    page = await open_app(context)
+    
+    # Interact with the page elements to simulate user flow
+    # Open the Sleep Tracker component.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[4]').nth(0)
+    await click(elem)
+    
+
+    # Enter bedtime and wake-up time for the current day.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div/input').nth(0)
+    await fill(elem, '22:30')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div[2]/input').nth(0)
+    await fill(elem, '06:30')
+    
+
+    # Select a sleep quality rating and verify it is assessed and displayed correctly.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Click the 'Save Sleep Entry' button to save the current sleep log.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/button').nth(0)
+    await click(elem)
+    
+
+    # Enter and save multiple days of sleep data with varying times and quality ratings.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div/input').nth(0)
+    await fill(elem, '23:00')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div[2]/input').nth(0)
+    await fill(elem, '07:00')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button[2]').nth(0)
+    await click(elem)
+    
+
+    # Click 'Save Sleep Entry' to log the second sleep entry.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/button').nth(0)
+    await click(elem)
+    
+
+    # Verify sleep patterns and trends visualization correctness over time.
+    await page.mouse.wheel(0, await page.evaluate("window.innerHeight"))
+    
+
+    # Log additional days of sleep data with varied times and quality ratings to enrich the dataset and verify trend visualization.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div/input').nth(0)
+    await fill(elem, '22:45')
+    
+
+    # Enter wake-up time and select sleep quality to enable saving the sleep entry.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div/div[2]/input').nth(0)
+    await fill(elem, '06:15')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/button[3]').nth(0)
+    await click(elem)
+    
+
+    # Click the 'Save Sleep Entry' button to save the third sleep entry.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/button').nth(0)
+    await click(elem)
+    
+
+    # Complete the test by confirming the sleep pattern visualization is accurate and then stop.
+    await page.mouse.wheel(0, await page.evaluate("window.innerHeight"))
+    
+
+    # Assertion: Confirm that the sleep duration is calculated accurately for the last entered sleep entry.
+    sleep_duration_text = await frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[4]/div/span').inner_text()
+    assert '7h 30m' in sleep_duration_text.lower(), f"Expected sleep duration '7h 30m' but got {sleep_duration_text}"
+      
+    # Assertion: Check that sleep quality is assessed and displayed based on predefined criteria.
+    sleep_quality_text = await frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[4]/div/span[2]').inner_text()
+    assert sleep_quality_text.lower() in ['excellent', 'good', 'fair', 'poor'], f"Unexpected sleep quality value: {sleep_quality_text}"
+      
+    # Assertion: Verify sleep patterns and trends are visualized correctly over time.
+    sleep_history_entries = await frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/div').all_inner_texts()
+    assert any('7h 30m' in entry.lower() for entry in sleep_history_entries), 'Sleep duration 7h 30m not found in sleep history visualization'
+    assert any(q in ''.join(sleep_history_entries).lower() for q in ['excellent', 'good', 'fair', 'poor']), 'Sleep quality not found in sleep history visualization'
+
+if __name__ == "__main__":
+    run_standalone(run_test)
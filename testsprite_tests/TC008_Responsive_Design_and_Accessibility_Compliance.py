@@ -1,149 +1,68 @@
-import asyncio
-from playwright import async_api
+from harness import click, open_app, run_standalone, settle
+from harness.a11y import audit
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+async def run_test(context):
+    # Open the app in a fresh page of the browser context provided by the runner
+    page = await open_app(context)
+    
+    # Interact with the page elements to simulate user flow
+    # Test keyboard navigation through the app to ensure all interactive elements are reachable and usable with visible focus states.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/div/button').nth(0)
+    await click(elem)
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Test keyboard navigation through the app to ensure all interactive elements are reachable and usable with visible focus states.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Hover or focus on elements with tooltips to ensure they appear correctly with descriptive text.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div[3]/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div[3]/div/div[2]/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Hover or focus on elements with tooltips to ensure they appear correctly with descriptive text.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/div[3]/div/div[2]/div/div/button').nth(0)
+    await click(elem)
+    
 
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div[3]/div/div[2]/div/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/div[3]/div/div[2]/div/div/button[2]').nth(0)
+    await click(elem)
+    
 
-        # Resize the application window to mobile screen size and verify UI layout adjustment without loss of functionality or data.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/div[3]/div/div[2]/div/div/button[3]').nth(0)
+    await click(elem)
+    
 
-        # Assert UI elements adjust layout appropriately without loss of functionality or data after resizing to mobile, tablet, and desktop sizes
-        for width, height in [(375, 667), (768, 1024), (1440, 900)]:
-            await page.set_viewport_size({'width': width, 'height': height})
-            await page.wait_for_timeout(1000)  # wait for layout to adjust
-            # Check that navigation items are visible and not overlapping
-            for nav_item in ['Chat', 'Dashboard', 'Mood', 'Sleep', 'Habits', 'Journal', 'Calendar'] :
-                nav_locator = page.locator(f'text="{nav_item}"')
-                assert await nav_locator.is_visible()
-            # Check that the wellness assistant greeting is visible
-            greeting_locator = page.locator('text="Hello! I\'m here to support you on your wellness journey. How are you feeling today?"')
-            assert await greeting_locator.is_visible()
-            # Check that quick topics are visible
-            for topic in ['I\'m feeling anxious', 'Help with sleep', 'Stress management', 'Daily motivation'] :
-                topic_locator = page.locator(f'text="{topic}"')
-                assert await topic_locator.is_visible()
-        # Assert keyboard navigation: all interactive elements reachable with visible focus states
-        interactive_elements = await page.locator('button, a, input, textarea, select').all()
-        assert len(interactive_elements) > 0
-        for i in range(len(interactive_elements)):
-            await interactive_elements[i].focus()
-            # Check that the element has a visible focus state
-            focused = await interactive_elements[i].evaluate('el => document.activeElement === el')
-            assert focused
-            # Optionally check for visible focus outline or style
-            has_focus_style = await interactive_elements[i].evaluate("el => window.getComputedStyle(el).outlineStyle !== 'none' && window.getComputedStyle(el).outlineWidth !== '0px'")
-            assert has_focus_style
-        # Assert color contrast ratios meet WCAG guidelines (simplified check)
-        # We check that text color and background color have sufficient contrast
-        def luminance(r, g, b):
-            a = [v / 255.0 for v in (r, g, b)]
-            a = [v / 12.92 if v <= 0.03928 else ((v + 0.055) / 1.055) ** 2.4 for v in a]
-            return 0.2126 * a[0] + 0.7152 * a[1] + 0.0722 * a[2]
-        async def get_rgb(color_str):
-            # Extract rgb values from color string like 'rgb(255, 255, 255)'
-            import re
-            m = re.match(r'rgb\((\d+), (\d+), (\d+)\)', color_str)
-            if m:
-                return tuple(map(int, m.groups()))
-            return (0, 0, 0)
-        async def contrast_ratio(rgb1, rgb2):
-            lum1 = luminance(*rgb1)
-            lum2 = luminance(*rgb2)
-            lighter = max(lum1, lum2)
-            darker = min(lum1, lum2)
-            return (lighter + 0.05) / (darker + 0.05)
-        text_elements = await page.locator('text').all()
-        for elem in text_elements:
-            color = await elem.evaluate('el => window.getComputedStyle(el).color')
-            bg_color = await elem.evaluate('el => window.getComputedStyle(el).backgroundColor')
-            rgb_color = await get_rgb(color)
-            rgb_bg = await get_rgb(bg_color)
-            ratio = await contrast_ratio(rgb_color, rgb_bg)
-            # WCAG AA requires at least 4.5:1 for normal text
-            assert ratio >= 4.5
-        # Assert tooltips appear correctly with descriptive text on hover or focus
-        tooltip_elements = await page.locator('[aria-describedby]').all()
-        for elem in tooltip_elements:
-            await elem.hover()
-            await page.wait_for_timeout(500)
-            tooltip_id = await elem.get_attribute('aria-describedby')
-            tooltip = page.locator(f'#{tooltip_id}')
-            assert await tooltip.is_visible()
-            tooltip_text = await tooltip.text_content()
-            assert tooltip_text and tooltip_text.strip() != ''
-        await asyncio.sleep(5)
+    # Resize the application window to mobile screen size and verify UI layout adjustment without loss of functionality or data.
+    await page.goto('/', timeout=10000)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Assert UI elements adjust layout appropriately without loss of functionality or data after resizing to mobile, tablet, and desktop sizes
+    problems = []
+    for width, height in [(375, 667), (768, 1024), (1440, 900)]:
+        await page.set_viewport_size({'width': width, 'height': height})
+        await settle(page)  # wait for layout to adjust
+        # Check that navigation items are visible and not overlapping
+        for nav_item in ['Chat', 'Dashboard', 'Mood', 'Sleep', 'Habits', 'Journal', 'Calendar'] :
+            nav_locator = page.locator(f'text="{nav_item}"')
+            assert await nav_locator.is_visible()
+        # Check that the wellness assistant greeting is visible
+        greeting_locator = page.locator('text="Hello! I\'m here to support you on your wellness journey. How are you feeling today?"')
+        assert await greeting_locator.is_visible()
+        # Check that quick topics are visible
+        for topic in ['I\'m feeling anxious', 'Help with sleep', 'Stress management', 'Daily motivation'] :
+            topic_locator = page.locator(f'text="{topic}"')
+            assert await topic_locator.is_visible()
+        # Audit keyboard focus states and WCAG AA colour contrast in one round trip
+        report = await audit(page)
+        assert report.controls > 0
+        problems += report.problems()
+    assert not problems, "\n".join(problems)
+    # Assert tooltips appear correctly with descriptive text on hover or focus
+    tooltip_elements = await page.locator('[aria-describedby]').all()
+    for elem in tooltip_elements:
+        await elem.hover()
+        await settle(page)
+        tooltip_id = await elem.get_attribute('aria-describedby')
+        tooltip = page.locator(f'#{tooltip_id}')
+        assert await tooltip.is_visible()
+        tooltip_text = await tooltip.text_content()
+        assert tooltip_text and tooltip_text.strip() != ''
+
+if __name__ == "__main__":
+    run_standalone(run_test)
@@ -1,198 +1,149 @@
-import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
+from harness import click, fill, open_app, run_standalone
+
+async def run_test(context):
+    # Open the app in a fresh page of the browser context provided by the runner
+    page = await open_app(context)
+    
+    # Interact with the page elements to simulate user flow
+    # Locate and navigate to a section or feature that triggers toast notifications, such as adding a habit or AI habit suggestions.
+    await page.mouse.wheel(0, await page.evaluate("window.innerHeight"))
+    
+
+    # Try to open the main menu or sidebar if available to find features that trigger toast notifications.
+    await page.mouse.wheel(0, -await page.evaluate("window.innerHeight"))
+    
+
+    # Try to navigate directly to a common feature URL such as /habits or /dashboard to find toast notification triggers or login page.
+    await page.goto('/habits', timeout=10000)
+    
+
+    # Click on 'Return to Home' link to go back to the home page and look for other navigation options or features that trigger toast notifications.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/div/a').nth(0)
+    await click(elem)
+    
+
+    # Trigger toast notifications by interacting with the Habits button and Quick Topics buttons to generate success, info, and error toasts.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[5]').nth(0)
+    await click(elem)
+    
+
+    # Click the 'Add Habit' button to trigger a toast notification and validate its appearance and auto-dismiss behavior.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Enter a valid habit name in the input field and click 'Add' to trigger a success toast notification and validate its appearance and auto-dismiss behavior.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
+    await fill(elem, 'Test Habit Success')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Trigger an error toast notification by attempting to add a habit with invalid input (e.g., empty name) and validate the toast's color and auto-dismiss behavior.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Trigger an info toast notification by performing an action that generates an informational message, such as AI habit suggestions or similar, then validate the toast's color and auto-dismiss behavior.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
+    await fill(elem, ' ')
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Trigger an info toast notification by performing an action that generates an informational message, such as AI habit suggestions or similar, then validate the toast's color and auto-dismiss behavior.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button').nth(0)
+    await click(elem)
+    
+
+    # Click multiple quick topic buttons in quick succession to trigger multiple toast notifications and validate their color coding, stacking, and auto-dismiss after 5 seconds.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
+    await click(elem)
+    
+
+    # Click multiple quick topic buttons in quick succession to trigger multiple toast notifications and validate their color coding, stacking, and auto-dismiss after 5 seconds.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button[2]').nth(0)
+    await click(elem)
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button[3]').nth(0)
+    await click(elem)
+    
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button[4]').nth(0)
+    await click(elem)
+    
+
+    # Complete the task by summarizing the results of the toast notification tests including color coding, message correctness, stacking, and auto-dismiss behavior.
+    await page.goto('/', timeout=10000)
+    
+
+    # Assertion: Validate toast notifications for success, info, and error with correct color coding and auto-dismiss after 5 seconds
+    toast_selector = 'div.toast-notification'  # Assuming this is the class for toast notifications
+    success_color = 'rgb(40, 167, 69)'  # Bootstrap success green
+    info_color = 'rgb(23, 162, 184)'  # Bootstrap info blue
+    error_color = 'rgb(220, 53, 69)'  # Bootstrap danger red
+    
+    # Helper function to get toast background color and text
+    async def get_toast_info(toast):
+        bg_color = await toast.evaluate('(el) => window.getComputedStyle(el).backgroundColor')
+        text = await toast.inner_text()
+        return bg_color, text
+    
+    # Validate each toast notification's color and message text
+    toasts = await page.locator(toast_selector).all()
+    assert len(toasts) > 0, 'No toast notifications found'
+    for toast in toasts:
+        bg_color, text = await get_toast_info(toast)
+        # Check color coding based on message content keywords
+        if 'success' in text.lower():
+            assert bg_color == success_color, f"Expected success color {success_color}, got {bg_color}"
+        elif 'info' in text.lower() or 'suggestion' in text.lower():
+            assert bg_color == info_color, f"Expected info color {info_color}, got {bg_color}"
+        elif 'error' in text.lower() or 'invalid' in text.lower():
+            assert bg_color == error_color, f"Expected error color {error_color}, got {bg_color}"
+        else:
+            # If message doesn't match known types, just log or pass
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Locate and navigate to a section or feature that triggers toast notifications, such as adding a habit or AI habit suggestions.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to open the main menu or sidebar if available to find features that trigger toast notifications.
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        # Try to navigate directly to a common feature URL such as /habits or /dashboard to find toast notification triggers or login page.
-        await page.goto('http://localhost:8080/habits', timeout=10000)
-        
-
-        # Click on 'Return to Home' link to go back to the home page and look for other navigation options or features that trigger toast notifications.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Trigger toast notifications by interacting with the Habits button and Quick Topics buttons to generate success, info, and error toasts.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Add Habit' button to trigger a toast notification and validate its appearance and auto-dismiss behavior.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Enter a valid habit name in the input field and click 'Add' to trigger a success toast notification and validate its appearance and auto-dismiss behavior.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Habit Success')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Trigger an error toast notification by attempting to add a habit with invalid input (e.g., empty name) and validate the toast's color and auto-dismiss behavior.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Trigger an info toast notification by performing an action that generates an informational message, such as AI habit suggestions or similar, then validate the toast's color and auto-dismiss behavior.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill(' ')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Trigger an info toast notification by performing an action that generates an informational message, such as AI habit suggestions or similar, then validate the toast's color and auto-dismiss behavior.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click multiple quick topic buttons in quick succession to trigger multiple toast notifications and validate their color coding, stacking, and auto-dismiss after 5 seconds.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click multiple quick topic buttons in quick succession to trigger multiple toast notifications and validate their color coding, stacking, and auto-dismiss after 5 seconds.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[3]/div/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Complete the task by summarizing the results of the toast notification tests including color coding, message correctness, stacking, and auto-dismiss behavior.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Assertion: Validate toast notifications for success, info, and error with correct color coding and auto-dismiss after 5 seconds
-        toast_selector = 'div.toast-notification'  # Assuming this is the class for toast notifications
-        success_color = 'rgb(40, 167, 69)'  # Bootstrap success green
-        info_color = 'rgb(23, 162, 184)'  # Bootstrap info blue
-        error_color = 'rgb(220, 53, 69)'  # Bootstrap danger red
-        
-        # Helper function to get toast background color and text
-        async def get_toast_info(toast):
-            bg_color = await toast.evaluate('(el) => window.getComputedStyle(el).backgroundColor')
-            text = await toast.inner_text()
-            return bg_color, text
-        
-        # Validate each toast notification's color and message text
-        toasts = await page.locator(toast_selector).all()
-        assert len(toasts) > 0, 'No toast notifications found'
-        for toast in toasts:
-            bg_color, text = await get_toast_info(toast)
-            # Check color coding based on message content keywords
-            if 'success' in text.lower():
-                assert bg_color == success_color, f"Expected success color {success_color}, got {bg_color}"
-            elif 'info' in text.lower() or 'suggestion' in text.lower():
-                assert bg_color == info_color, f"Expected info color {info_color}, got {bg_color}"
-            elif 'error' in text.lower() or 'invalid' in text.lower():
-                assert bg_color == error_color, f"Expected error color {error_color}, got {bg_color}"
-            else:
-                # If message doesn't match known types, just log or pass
-                pass
-        
-        # Confirm toasts auto-dismiss after 5 seconds
-        import time
-        start_time = time.time()
-        while True:
-            toasts = await page.locator(toast_selector).all()
-            if len(toasts) == 0:
-                break
-            if time.time() - start_time > 7:  # Allow some buffer over 5 seconds
-                assert False, 'Toast notifications did not auto-dismiss after 5 seconds'
-            await page.wait_for_timeout(500)
-        
-        # Trigger multiple toast notifications in quick succession already done in previous steps
-        # Check stacking or queuing gracefully without UI glitches
+    
+    # Confirm toasts auto-dismiss after 5 seconds
+    import time
+    start_time = time.time()
+    while True:
         toasts = await page.locator(toast_selector).all()
-        assert len(toasts) <= 5, 'Too many toast notifications displayed at once, possible UI glitch'
-        # Optionally check vertical stacking by comparing y positions
-        positions = []
-        for toast in toasts:
-            box = await toast.bounding_box()
-            positions.append(box['y'])
-        assert positions == sorted(positions), 'Toast notifications are not stacked vertically in order'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        if len(toasts) == 0:
+            break
+        if time.time() - start_time > 7:  # Allow some buffer over 5 seconds
+            assert False, 'Toast notifications did not auto-dismiss after 5 seconds'
+        await page.wait_for_timeout(500)
+    
+    # Trigger multiple toast notifications in quick succession already done in previous steps
+    # Check stacking or queuing gracefully without UI glitches
+    toasts = await page.locator(toast_selector).all()
+    assert len(toasts) <= 5, 'Too many toast notifications displayed at once, possible UI glitch'
+    # Optionally check vertical stacking by comparing y positions
+    positions = []
+    for toast in toasts:
+        box = await toast.bounding_box()
+        positions.append(box['y'])
+    assert positions == sorted(positions), 'Toast notifications are not stacked vertically in order'
+
+if __name__ == "__main__":
+    run_standalone(run_test)
@@ -1,108 +1,65 @@
-import asyncio
-from playwright import async_api
+from harness import click, fill, open_app, run_standalone
+from harness.bundles import TabTraffic, disable_idle_prefetch
+from harness.perf import NAV_TABS, PerfCollector
+from harness.renders import enable_render_profiling, render_profiling_supported, track_renders
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click on Chat button to start testing ChatBot component.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Send a test message in the chat input to verify message sending and AI response.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Hello, I am testing the chat functionality.')
-        
+# Budgets for a single tab switch (deltas) and for the page as a whole (heap, vitals).
+BUDGETS = {
+    "heap_mb": 150,
+    "script_ms": 300,
+    "long_task_ms": 250,
+    "layouts": 60,
+    "cls": 0.1,
+    "inp_ms": 200,
+}
 
-        # Navigate to the Habits component to test rendering performance and lazy loading readiness.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_test(context):
+    # Open the app in a fresh page of the browser context provided by the runner, with React render counting on
+    await enable_render_profiling(context)
+    await disable_idle_prefetch(context)
+    traffic = TabTraffic(context)
+    page = await open_app(context)
+    perf = await PerfCollector.attach(page)
+    await perf.snapshot("load")
+    load = await traffic.snapshot("load")
+    
+    # Interact with the page elements to simulate user flow
+    # Click on Chat button to start testing ChatBot component.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button').nth(0)
+    await click(elem)
+    chat = await traffic.snapshot("Chat")
+    
 
-        # Navigate to Mood Tracker component to continue performance and lazy loading testing.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Assert the ChatBot code is fetched by the first switch to Chat, not with the dashboard.
+    assert not any('ChatBot' in script for script in load['scripts']), load
+    assert any('ChatBot' in script for script in chat['scripts']), chat
+    
 
-        # Navigate to Journal component to continue performance and lazy loading testing.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+    # Send a test message in the chat input to verify message sending and AI response.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div[2]/main/div/div[2]/div[3]/div/input').nth(0)
+    # A plain production build (--app prod) cannot count renders; those checks need the dev server or build:profile.
+    if await render_profiling_supported(page):
+        async with track_renders(page) as renders:
+            await fill(elem, 'Hello, I am testing the chat functionality.')
         
 
-        # Navigate to Sleep Tracker component to continue performance and lazy loading testing.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        # Assert typing into the chat input only re-renders the ChatBot subtree, and only a few times.
+        assert set(renders.rendered()) <= {'ChatBot', 'Index.renderSection'}, renders
+        assert renders.commits('ChatBot') <= 3, renders
+    else:
+        await fill(elem, 'Hello, I am testing the chat functionality.')
+    
 
-        # Inspect React Profiler to verify efficient React hooks usage (useMemo, useCallback) and confirm state updates do not cause unnecessary re-renders.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Switch through every navigation tab, sampling runtime metrics after each switch.
+    for tab in NAV_TABS:
+        await perf.switch_tab(tab)
+    
 
-        # Click on the first relevant search result link to learn about React Profiler usage and how to apply it for performance analysis in the app.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[3]/div/div[11]/div/div/div[2]/div[2]/div/div/div/div/div/div/div/div/span/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Assert each tab switch stays within the performance budgets; the per-tab table goes with the failure.
+    violations = perf.over_budget(BUDGETS)
+    assert not violations, 'Performance budgets exceeded:\n' + '\n'.join(violations) + '\n\n' + perf.table()
 
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    run_standalone(run_test)
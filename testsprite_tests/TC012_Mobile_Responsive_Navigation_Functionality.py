@@ -1,119 +1,66 @@
-import asyncio
-from playwright import async_api
+from harness import Navigation, click, open_app, run_standalone
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+async def run_test(context):
+    # Open the app in a fresh page of the browser context provided by the runner
+    page = await open_app(context)
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8080", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Simulate mobile portrait screen size and check if navigation menus collapse or expand appropriately.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to reload the page and check for navigation elements again, then simulate mobile portrait screen size to check navigation behavior.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately, then test navigation controls for functionality on mobile devices.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately, then test navigation controls for functionality on mobile devices.
-        await page.goto('http://localhost:8080/', timeout=10000)
-        
-
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
+    # Interact with the page elements to simulate user flow
+    # Simulate mobile portrait screen size and check if navigation menus collapse or expand appropriately.
+    await page.goto('/', timeout=10000)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    await page.mouse.wheel(0, await page.evaluate("window.innerHeight"))
+    
+
+    # Try to reload the page and check for navigation elements again, then simulate mobile portrait screen size to check navigation behavior.
+    await page.goto('/', timeout=10000)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await page.goto('/', timeout=10000)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await page.goto('/', timeout=10000)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await page.goto('/', timeout=10000)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await page.goto('/', timeout=10000)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await page.goto('/', timeout=10000)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await click(Navigation(page).settings_button)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await page.goto('/', timeout=10000)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await page.goto('/', timeout=10000)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately.
+    await page.mouse.wheel(0, await page.evaluate("window.innerHeight"))
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately, then test navigation controls for functionality on mobile devices.
+    await click(Navigation(page).settings_button)
+    
+
+    # Simulate mobile portrait screen size and verify navigation menus collapse or expand appropriately, then test navigation controls for functionality on mobile devices.
+    await page.goto('/', timeout=10000)
+    
+
+    assert False, 'Test plan execution failed: generic failure assertion.'
+
+if __name__ == "__main__":
+    run_standalone(run_test)
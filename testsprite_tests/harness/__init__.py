@@ -0,0 +1,26 @@
+"""Shared Playwright harness for the TestSprite TC scripts."""
+
+from .browser import launch_browser, new_context, open_app, run_standalone
+from .pages import ChatBot, HabitTracker, Journal, Navigation, Settings, SleepTracker, StressTracker
+from .runner import TestResult, discover, run_suite
+from .steps import click, fill, settle
+
+__all__ = [
+    "ChatBot",
+    "HabitTracker",
+    "Journal",
+    "Navigation",
+    "Settings",
+    "SleepTracker",
+    "StressTracker",
+    "TestResult",
+    "click",
+    "discover",
+    "fill",
+    "launch_browser",
+    "new_context",
+    "open_app",
+    "run_standalone",
+    "run_suite",
+    "settle",
+]
@@ -0,0 +1,104 @@
+"""Accessibility audit that costs one page round trip per viewport.
+
+:func:`audit` collects focusability, focus styling, bounding boxes and
+computed colours for every candidate element with a single
+``page.evaluate`` (``js/audit.js``); WCAG contrast ratios are then computed
+for all text elements at once with NumPy.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .browser import read_js
+
+# Elements whose keyboard focus is audited.
+INTERACTIVE = "button, a, input, textarea, select"
+
+# WCAG 2.x AA minimum contrast for normal and for large text.
+AA_NORMAL = 4.5
+AA_LARGE = 3.0
+
+_AUDIT_JS = read_js("audit.js")
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+
+def relative_luminance(rgb):
+    """WCAG relative luminance of an ``(n, 3)`` array of 0-255 sRGB colours."""
+    channels = np.asarray(rgb, dtype=float) / 255.0
+    linear = np.where(
+        channels <= 0.03928,
+        channels / 12.92,
+        ((channels + 0.055) / 1.055) ** 2.4,
+    )
+    return linear @ _LUMINANCE_WEIGHTS
+
+
+def contrast_ratios(fg, bg):
+    """Contrast ratio of each ``fg`` RGBA colour drawn over the matching ``bg`` colour."""
+    fg = np.asarray(fg, dtype=float).reshape(-1, 4)
+    bg = np.asarray(bg, dtype=float).reshape(-1, 4)[:, :3]
+    alpha = fg[:, 3:4]
+    fg_rgb = fg[:, :3] * alpha + bg * (1 - alpha)
+    lum = np.stack([relative_luminance(fg_rgb), relative_luminance(bg)])
+    return (lum.max(axis=0) + 0.05) / (lum.min(axis=0) + 0.05)
+
+
+def required_ratios(font_size_px, font_weight):
+    """AA threshold per element: large text is >= 24px, or >= 18.66px and bold."""
+    size = np.asarray(font_size_px, dtype=float)
+    weight = np.asarray(font_weight, dtype=float)
+    large = (size >= 24) | ((size >= 18.66) & (weight >= 700))
+    return np.where(large, AA_LARGE, AA_NORMAL)
+
+
+@dataclass
+class AuditReport:
+    viewport: tuple
+    controls: int = 0
+    texts: int = 0
+    unfocusable: list = field(default_factory=list)
+    missing_focus_style: list = field(default_factory=list)
+    low_contrast: list = field(default_factory=list)
+
+    def problems(self):
+        """One line per failed check, prefixed with the viewport size."""
+        width, height = self.viewport
+        prefix = f"{width}x{height}"
+        lines = [f"{prefix}: not focusable: {label}" for label in self.unfocusable]
+        lines += [f"{prefix}: no visible focus state: {label}" for label in self.missing_focus_style]
+        lines += [
+            f"{prefix}: contrast {ratio:.2f} < {required}: {label}"
+            for label, ratio, required in self.low_contrast
+        ]
+        return lines
+
+
+async def audit(page, interactive=INTERACTIVE):
+    """Audit keyboard focus and text contrast of ``page`` at its current viewport.
+
+    One Tab press first puts Chromium in keyboard modality, so the
+    ``:focus-visible`` styles a keyboard user would see are the ones checked.
+    """
+    await page.keyboard.press("Tab")
+    data = await page.evaluate(_AUDIT_JS, {"interactive": interactive})
+    controls = data["controls"]
+    text = data["text"]
+
+    report = AuditReport(
+        viewport=tuple(data["viewport"]),
+        controls=len(controls["labels"]),
+        texts=len(text["labels"]),
+    )
+    for label, focused, styled in zip(controls["labels"], controls["focused"], controls["focusStyle"]):
+        if not focused:
+            report.unfocusable.append(label)
+        elif not styled:
+            report.missing_focus_style.append(label)
+
+    if text["labels"]:
+        ratios = contrast_ratios(text["fg"], text["bg"])
+        required = required_ratios(text["fontSize"], text["fontWeight"])
+        for index in np.flatnonzero(ratios < required):
+            report.low_contrast.append((text["labels"][index], float(ratios[index]), float(required[index])))
+    return report
@@ -0,0 +1,80 @@
+"""Browser lifecycle helpers shared by the TC scripts and the suite runner."""
+
+import asyncio
+from pathlib import Path
+
+from playwright import async_api
+
+from .config import CHROMIUM_ARGS, DEFAULT_TIMEOUT_MS, base_url
+
+JS_DIR = Path(__file__).resolve().parent / "js"
+
+
+def read_js(name):
+    """Return the source of ``harness/js/<name>``."""
+    return (JS_DIR / name).read_text(encoding="utf-8")
+
+
+async def launch_browser(pw, headless=True):
+    """Launch the Chromium instance used for one standalone script or a whole suite run."""
+    return await pw.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
+
+
+async def new_context(browser, app_url=None):
+    """Create a fresh, isolated browser context (like an incognito window).
+
+    Relative URLs such as ``page.goto('/')`` resolve against ``app_url``,
+    which defaults to the endpoint in ``tmp/config.json``.
+    """
+    context = await browser.new_context(base_url=app_url or base_url())
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    await context.add_init_script(read_js("settle.js"))
+    await context.add_init_script(read_js("vitals.js"))
+    return context
+
+
+async def open_app(context, url="/"):
+    """Open a new page in ``context`` and navigate it to the app.
+
+    Waits for DOMContentLoaded on the page and all of its frames, ignoring
+    timeouts, the same way the generated scripts always did.
+    """
+    page = await context.new_page()
+    await page.goto(url, wait_until="commit", timeout=10000)
+
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    for frame in page.frames:
+        try:
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
+        except async_api.Error:
+            pass
+
+    return page
+
+
+async def _run_with_own_browser(run_test):
+    pw = None
+    browser = None
+    context = None
+
+    try:
+        pw = await async_api.async_playwright().start()
+        browser = await launch_browser(pw)
+        context = await new_context(browser)
+        await run_test(context)
+    finally:
+        if context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+
+
+def run_standalone(run_test):
+    """Run a single TC flow in its own browser, for ``python TCxxx_*.py``."""
+    asyncio.run(_run_with_own_browser(run_test))
@@ -0,0 +1,162 @@
+"""JavaScript downloaded per navigation tab, checked against per-tab budgets.
+
+Every section but the dashboard is its own chunk (``src/lib/sections.ts``).
+With the app's idle prefetch turned off, so that each chunk is fetched by the
+switch that first needs it, the app is opened and every navigation tab is
+visited in turn. :class:`TabTraffic` records what each switch requested: the
+number of requests and the JS bytes transferred. The first row is the
+initial load of the dashboard.
+
+The budgets are for a production build, which is what this tool serves
+unless ``--port`` points it at a running server; the dev server sends every
+module separately and unminified.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.bundles
+    python -m harness.bundles --port 4173    # e.g. a `python -m harness.server` already running
+"""
+
+import argparse
+import asyncio
+import json
+from contextlib import nullcontext
+from urllib.parse import urlsplit
+
+from playwright import async_api
+
+from .browser import launch_browser, new_context, open_app
+from .config import TMP_DIR, url_for_port
+from .perf import NAV_TABS
+from .server import prod_server
+from .steps import click, settle
+
+BUNDLES_REPORT_PATH = TMP_DIR / "bundles.json"
+
+# Budgets per row label, in KB transferred (gzip) and requests. The load
+# includes the Spline runtime the dashboard hero fetches after first render.
+BUDGETS = {
+    "load": {"js_kb": 1500, "requests": 40},
+    "Dashboard": {"js_kb": 0, "requests": 5},
+}
+TAB_BUDGET = {"js_kb": 150, "requests": 15}
+
+
+async def disable_idle_prefetch(context):
+    """Stop pages later opened in ``context`` from prefetching sections while idle."""
+    await context.add_init_script("window.__SECTION_PREFETCH__ = false;")
+
+
+class TabTraffic:
+    """Requests made by the pages of ``context``, one row per labelled snapshot.
+
+    Create it before ``open_app`` so that the initial load is recorded.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.rows = []
+        self._requests = []
+        self._pending = []
+        context.on("requestfinished", self._finished)
+
+    def _finished(self, request):
+        self._pending.append(asyncio.ensure_future(self._record(request)))
+
+    async def _record(self, request):
+        try:
+            sizes = await request.sizes()
+        except async_api.Error:
+            return  # the page went away first
+        self._requests.append(
+            {
+                "url": request.url,
+                "script": request.resource_type == "script",
+                "bytes": sizes["responseBodySize"] + sizes["responseHeadersSize"],
+            }
+        )
+
+    async def snapshot(self, label):
+        """Wait for the app to settle and record a row for the requests made since the last one."""
+        await settle(self.context.pages[-1])
+        pending, self._pending = self._pending, []
+        await asyncio.gather(*pending)
+        requests, self._requests = self._requests, []
+        scripts = [request for request in requests if request["script"]]
+        row = {
+            "label": label,
+            "requests": len(requests),
+            "js_requests": len(scripts),
+            "js_kb": sum(request["bytes"] for request in scripts) / 1024,
+            "scripts": [urlsplit(request["url"]).path.rsplit("/", 1)[-1] for request in scripts],
+        }
+        self.rows.append(row)
+        return row
+
+    async def switch_tab(self, label):
+        """Click the ``label`` navigation tab, wait for the section's code to load and snapshot."""
+        page = self.context.pages[-1]
+        await click(page.locator(f'nav button[title="{label}"]').first)
+        await page.get_by_test_id("section-loading").wait_for(state="detached")
+        return await self.snapshot(label)
+
+    def table(self):
+        header = f"{'label':<12}{'requests':>10}{'js':>6}{'js KB':>10}"
+        lines = [header, "-" * len(header)]
+        for row in self.rows:
+            lines.append(f"{row['label']:<12}{row['requests']:>10}{row['js_requests']:>6}{row['js_kb']:>10.1f}")
+        return "\n".join(lines)
+
+    def over_budget(self, budgets=BUDGETS, default=TAB_BUDGET):
+        """Describe every row over its budget in ``budgets`` (``default`` for unlisted tabs)."""
+        violations = []
+        for row in self.rows:
+            for column, limit in budgets.get(row["label"], default).items():
+                if row[column] > limit:
+                    violations.append(f"{row['label']}: {column} {row[column]:.1f} > {limit}")
+        return violations
+
+
+async def run_bundles(app_url, headless=True):
+    """Open the app at ``app_url``, visit every tab and return the :class:`TabTraffic`."""
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=headless)
+        try:
+            context = await new_context(browser, app_url)
+            await disable_idle_prefetch(context)
+            traffic = TabTraffic(context)
+            await open_app(context)
+            await traffic.snapshot("load")
+            for tab in NAV_TABS:
+                await traffic.switch_tab(tab)
+            await context.close()
+            return traffic
+        finally:
+            await browser.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.bundles", description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, help="app port (default: build and serve the production build)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = nullcontext(url_for_port(args.port)) if args.port else prod_server(offline_gemini=True)
+    with server as app_url:
+        traffic = asyncio.run(run_bundles(app_url, headless=not args.headed))
+    BUNDLES_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with BUNDLES_REPORT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(traffic.rows, fh, indent=2)
+    print(traffic.table())
+    violations = traffic.over_budget()
+    if violations:
+        print("Bundle budgets exceeded:\n" + "\n".join(violations))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
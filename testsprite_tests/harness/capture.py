@@ -0,0 +1,107 @@
+"""Failure forensics from a bounded in-memory ring buffer of step captures.
+
+With ``--capture N`` the runner keeps a JPEG screenshot and the DOM of the
+page after each of the last ``N`` page-changing steps of a test (clicks,
+fills, navigations, ...) and after any step that failed. Nothing is
+written while the test passes; when it fails or times out the buffer is
+flushed to ``tmp/failures/<test_id>/steps/``, next to the watchdog's dump.
+"""
+
+import asyncio
+import json
+import shutil
+from collections import deque
+from dataclasses import asdict, dataclass, field
+
+# Traced actions after which the page is captured; reads are skipped.
+CAPTURED_ACTIONS = {
+    "goto",
+    "reload",
+    "go_back",
+    "go_forward",
+    "click",
+    "dblclick",
+    "tap",
+    "hover",
+    "fill",
+    "type",
+    "press",
+    "check",
+    "uncheck",
+    "set_checked",
+    "select_option",
+    "set_input_files",
+    "drag_to",
+    "dispatch_event",
+    "set_viewport_size",
+}
+
+# Upper bound for one capture; a page that cannot be captured in time is skipped.
+CAPTURE_STEP_TIMEOUT_S = 2
+
+JPEG_QUALITY = 50
+
+
+@dataclass
+class Capture:
+    index: int
+    step: dict
+    url: str
+    screenshot: bytes = field(repr=False, default=None)
+    dom: str = field(repr=False, default=None)
+
+
+def _page_of(target):
+    """The page a traced call acted on, or ``None``."""
+    if hasattr(target, "screenshot") and hasattr(target, "content"):
+        return target
+    page = getattr(target, "page", None)
+    if page is not None and not callable(page):
+        return page
+    pages = getattr(target, "pages", None)
+    return pages[-1] if pages else None
+
+
+class StepCapture:
+    """Ring buffer of the last ``limit`` captures of one test; pass :meth:`record` to the tracer."""
+
+    def __init__(self, limit):
+        self.buffer = deque(maxlen=limit)
+        self._count = 0
+
+    async def record(self, target, step):
+        if step.action not in CAPTURED_ACTIONS and not step.error:
+            return
+        page = _page_of(target)
+        if page is None or page.is_closed():
+            return
+        self._count += 1
+        capture = Capture(self._count, asdict(step), page.url)
+        try:
+            capture.screenshot = await asyncio.wait_for(
+                page.screenshot(type="jpeg", quality=JPEG_QUALITY), CAPTURE_STEP_TIMEOUT_S
+            )
+            capture.dom = await asyncio.wait_for(page.content(), CAPTURE_STEP_TIMEOUT_S)
+        except Exception:
+            pass  # keep whatever was captured; a capture must never fail the test
+        self.buffer.append(capture)
+
+    def flush(self, directory):
+        """Write the buffered captures to ``directory/steps/`` and return that path."""
+        target = directory / "steps"
+        shutil.rmtree(target, ignore_errors=True)
+        target.mkdir(parents=True)
+        index = []
+        for capture in self.buffer:
+            stem = f"{capture.index:03d}-{capture.step['action']}"
+            entry = {"step": capture.step, "url": capture.url, "screenshot": None, "dom": None}
+            if capture.screenshot is not None:
+                (target / f"{stem}.jpg").write_bytes(capture.screenshot)
+                entry["screenshot"] = f"{stem}.jpg"
+            if capture.dom is not None:
+                (target / f"{stem}.html").write_text(capture.dom, encoding="utf-8")
+                entry["dom"] = f"{stem}.html"
+            index.append(entry)
+        with (target / "steps.json").open("w", encoding="utf-8") as fh:
+            json.dump(index, fh, indent=2)
+        return target
@@ -0,0 +1,183 @@
+"""Cold start with a large stored dataset: time until the dashboard's lists are loaded.
+
+WellnessProvider persists its lists to IndexedDB
+(``src/lib/wellness-store.ts``). The dashboard's lists (habits, todos, chat
+suggestions, stress entries) load when the app starts; the journal, sleep
+entries and chat history wait until a section that shows them is opened.
+
+A first page stores :func:`~harness.seed.dataset` through the provider's test
+hook and flushes it. Every run then opens a new page in the same context and
+records the time from navigation start to the first frame in which the
+``wellness:ready`` mark exists and the navigation is shown, how long each list
+took to load, and how long the journal takes to load once its tab is opened.
+The run fails when the median time to ready is over ``--max-ready-ms``, when
+the journal was loaded before its tab was opened, or when a list comes back
+with a different number of items than was stored.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.coldstart
+    python -m harness.coldstart --journal-entries 50000 --runs 3 --max-ready-ms 2500
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+from contextlib import nullcontext
+
+from playwright import async_api
+
+from .browser import launch_browser, new_context, open_app
+from .config import TMP_DIR, url_for_port
+from .pages import Navigation
+from .seed import dataset, enable_test_hook
+from .server import prod_server
+
+COLDSTART_REPORT_PATH = TMP_DIR / "coldstart.json"
+
+EAGER = ["habits", "todos", "chatSuggestions", "stressEntries"]
+
+# Replaces every list (and what is stored for it), waits for the provider to
+# render the new lists, which queues their saves, and writes them at once.
+_STORE = """async (state) => {
+  for (const [name, items] of Object.entries(state)) window.__wellness.replace(name, items);
+  const rendered = () =>
+    Object.entries(state).every(([name, items]) => window.__wellness.sizes()[name] === items.length);
+  while (!rendered()) await new Promise((resolve) => requestAnimationFrame(resolve));
+  await window.__wellnessStore.flush();
+  return window.__wellnessStore.writes();
+}"""
+
+# Resolves with performance.now() at the first frame in which the dashboard's
+# lists are loaded and the navigation is on screen.
+_READY = """() => new Promise((resolve) => {
+  const check = () => {
+    const ready = performance.getEntriesByName('wellness:ready').length > 0;
+    if (ready && document.querySelector('[data-testid="nav-dashboard"]')) resolve(performance.now());
+    else requestAnimationFrame(check);
+  };
+  check();
+})"""
+
+# True once the stored journal has been read and rendered.
+_JOURNAL_LOADED = """() => {
+  const timing = window.__wellnessStore.hydration().journalEntries;
+  return timing !== undefined && window.__wellness.sizes().journalEntries >= timing.items;
+}"""
+
+
+async def store_dataset(context, state):
+    """Store ``state`` through a first page; the write counters after the flush."""
+    page = await open_app(context)
+    await page.wait_for_function("() => window.__wellness !== undefined")
+    writes = await page.evaluate(_STORE, state)
+    await page.close()
+    return writes
+
+
+async def cold_start(context):
+    """One run: ``{"ready_ms", "hydration", "journal_before_tab", "journal", "sizes"}``."""
+    page = await open_app(context)
+    try:
+        ready_ms = await page.evaluate(_READY)
+        hydration = await page.evaluate("() => window.__wellnessStore.hydration()")
+        await Navigation(page).open("journal")
+        await page.wait_for_function(_JOURNAL_LOADED)
+        journal = await page.evaluate("() => window.__wellnessStore.hydration().journalEntries")
+        sizes = await page.evaluate("() => window.__wellness.sizes()")
+        return {
+            "ready_ms": ready_ms,
+            "hydration": hydration,
+            "journal_before_tab": "journalEntries" in hydration,
+            "journal": journal,
+            "sizes": sizes,
+        }
+    finally:
+        await page.close()
+
+
+async def run_coldstart(app_url, state, runs, headless=True):
+    """``{"writes": {...}, "runs": [result of cold_start, ...]}``."""
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=headless)
+        try:
+            context = await new_context(browser, app_url)
+            await enable_test_hook(context)
+            writes = await store_dataset(context, state)
+            results = [await cold_start(context) for _ in range(runs)]
+            await context.close()
+            return {"writes": writes, "runs": results}
+        finally:
+            await browser.close()
+
+
+def print_report(report, stored):
+    header = f"{'run':>4}{'ready ms':>10}  {'list':<16}{'items':>8}{'load ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for number, run in enumerate(report["runs"], 1):
+        loads = [(name, run["hydration"][name]) for name in EAGER if name in run["hydration"]]
+        loads.append(("journalEntries", run["journal"]))
+        for i, (name, timing) in enumerate(loads):
+            prefix = f"{number:>4}{run['ready_ms']:>10.0f}" if i == 0 else " " * 14
+            print(f"{prefix}  {name:<16}{timing['items']:>8}{timing['ms']:>9.1f}")
+    writes = report["writes"]
+    print(
+        f"stored {sum(stored.values())} items in {writes['transactions']} transactions "
+        f"({writes['chunksWritten']} chunks)"
+    )
+
+
+def problems(report, stored, max_ready_ms):
+    found = []
+    ready = statistics.median(run["ready_ms"] for run in report["runs"])
+    if max_ready_ms is not None and ready > max_ready_ms:
+        found.append(f"median time to ready {ready:.0f} ms is over {max_ready_ms:g} ms")
+    for number, run in enumerate(report["runs"], 1):
+        if run["journal_before_tab"]:
+            found.append(f"run {number}: the journal was loaded before its tab was opened")
+        for name in [*EAGER, "journalEntries"]:
+            if run["sizes"][name] != stored[name]:
+                found.append(f"run {number}: {name} has {run['sizes'][name]} items, {stored[name]} were stored")
+    return found
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.coldstart", description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, help="app port (default: build and serve the production build)")
+    parser.add_argument("--journal-entries", type=int, default=10_000, help="stored journal entries (default: 10000)")
+    parser.add_argument("--todos", type=int, default=2_000, help="stored todos (default: 2000)")
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to measure (default: 5)")
+    parser.add_argument("--max-ready-ms", type=float, default=1500, help="median time to ready limit (default: 1500)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    state = dataset(
+        habits=50,
+        todos=args.todos,
+        sleep_entries=1_000,
+        journal_entries=args.journal_entries,
+        stress_entries=1_000,
+        chat_suggestions=200,
+    )
+    stored = {name: len(items) for name, items in state.items()}
+    server = nullcontext(url_for_port(args.port)) if args.port else prod_server(offline_gemini=True)
+    with server as app_url:
+        report = asyncio.run(run_coldstart(app_url, state, args.runs, headless=not args.headed))
+    COLDSTART_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with COLDSTART_REPORT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump({"stored": stored, **report}, fh, indent=2)
+    print_report(report, stored)
+    found = problems(report, stored, args.max_ready_ms)
+    if found:
+        print("\n".join(found))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+"""Shared settings for the TestSprite harness, read from ``tmp/config.json``."""
+
+import json
+import os
+from pathlib import Path
+
+SUITE_DIR = Path(__file__).resolve().parent.parent
+APP_DIR = SUITE_DIR.parent
+TMP_DIR = SUITE_DIR / "tmp"
+FAILURES_DIR = TMP_DIR / "failures"
+
+DEFAULT_BASE_URL = "http://localhost:8080"
+
+# "dev" runs against the server at DEFAULT_BASE_URL/tmp/config.json; "prod"
+# against a production build served by the harness (see harness.server).
+APP_MODE = os.environ.get("TESTSPRITE_APP", "dev")
+
+# Files, relative to APP_DIR, that go into ``vite build`` besides ``src/``
+# (fnmatch patterns: ``*`` also matches ``/``).
+BUILD_INPUTS = [
+    "index.html",
+    "public/*",
+    "package.json",
+    "package-lock.json",
+    "bun.lockb",
+    "vite.config.ts",
+    "tsconfig*.json",
+    "tailwind.config.ts",
+    "postcss.config.js",
+    "components.json",
+]
+
+# Per-action timeout applied to every browser context (matches the generated scripts).
+DEFAULT_TIMEOUT_MS = 5000
+
+# How long the DOM must stay unchanged, with no request in flight, before the
+# app counts as settled, and the most a step will wait for that to happen.
+SETTLE_QUIET_MS = int(os.environ.get("TESTSPRITE_SETTLE_QUIET_MS", "150"))
+SETTLE_CEILING_MS = int(os.environ.get("TESTSPRITE_SETTLE_CEILING_MS", "3000"))
+
+# Wall-time budgets, in seconds, for a whole test and for any single
+# Playwright call in it; a test over budget is cancelled and dumped.
+TEST_BUDGET_S = float(os.environ.get("TESTSPRITE_TEST_BUDGET_S", "180"))
+STEP_BUDGET_S = float(os.environ.get("TESTSPRITE_STEP_BUDGET_S", "30"))
+
+# Steps kept in memory per test by ``--capture`` (see harness.capture) when
+# no count is given.
+CAPTURE_STEPS = int(os.environ.get("TESTSPRITE_CAPTURE_STEPS", "10"))
+
+# Defaults for the offline Gemini stand-in (see harness.gemini).
+GEMINI_LATENCY_MS = float(os.environ.get("TESTSPRITE_GEMINI_LATENCY_MS", "200"))
+GEMINI_ERROR_RATE = float(os.environ.get("TESTSPRITE_GEMINI_ERROR_RATE", "0"))
+GEMINI_TIMEOUT_RATE = float(os.environ.get("TESTSPRITE_GEMINI_TIMEOUT_RATE", "0"))
+
+# "--single-process" is deliberately absent: it is unstable once several
+# contexts share one browser, and was the main source of launch flakiness.
+CHROMIUM_ARGS = [
+    "--window-size=1280,720",   # Set the browser window size
+    "--disable-dev-shm-usage",  # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",               # Use host-level IPC for better stability
+]
+
+
+def load_config():
+    """Return the parsed ``tmp/config.json``, or an empty dict when it is missing."""
+    path = TMP_DIR / "config.json"
+    if not path.exists():
+        return {}
+    with path.open(encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def base_url():
+    """Return the app URL the suite should run against."""
+    return load_config().get("localEndpoint", DEFAULT_BASE_URL)
+
+
+def url_for_port(port):
+    """Return the app URL when it is served on ``port`` instead of the configured one."""
+    return f"http://localhost:{port}"
@@ -0,0 +1,166 @@
+"""Frame-budget benchmark for the PixelBlast background.
+
+For each viewport used by TC008/TC012 the app is opened three times, with
+the background off, at full quality and in its adaptive mode (selected with
+``window.__PIXELBLAST_MODE__``, see ``src/components/PixelBlast.tsx``). After
+a warm-up, the page's rAF intervals and the main-thread time reported over
+CDP are sampled for a fixed duration.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.frames
+    python -m harness.frames --duration 10 --require-saving 30
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+
+from playwright import async_api
+
+from .browser import launch_browser, new_context, open_app
+from .config import TMP_DIR, url_for_port
+from .steps import settle
+
+FRAMES_REPORT_PATH = TMP_DIR / "frames.json"
+
+VIEWPORTS = [(375, 667), (768, 1024), (1440, 900)]
+MODES = ["off", "full", "adaptive"]
+
+FRAME_MS = 1000 / 60
+
+# Long enough for the adaptive mode to settle on a quality level.
+WARMUP_S = 3
+
+_SAMPLE_FRAMES = """async (durationMs) => {
+  const intervals = [];
+  let last = null;
+  const end = performance.now() + durationMs;
+  await new Promise((resolve) => {
+    const tick = (now) => {
+      if (last !== null) intervals.push(now - last);
+      last = now;
+      if (now < end) requestAnimationFrame(tick);
+      else resolve();
+    };
+    requestAnimationFrame(tick);
+  });
+  return { intervals, stats: window.__pixelBlastStats || null };
+}"""
+
+
+def dropped_frames(intervals):
+    """Frames missed at 60 Hz: an interval of ~3 frame periods drops 2."""
+    return sum(max(0, round(interval / FRAME_MS) - 1) for interval in intervals)
+
+
+def summarize(intervals, task_s, duration_s):
+    ordered = sorted(intervals)
+    return {
+        "frames": len(ordered),
+        "mean_frame_ms": statistics.fmean(ordered) if ordered else 0.0,
+        "p95_frame_ms": ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0.0,
+        "dropped_frames": dropped_frames(ordered),
+        "main_thread_ms_per_s": task_s * 1000 / duration_s,
+    }
+
+
+async def _task_seconds(cdp):
+    metrics = (await cdp.send("Performance.getMetrics"))["metrics"]
+    return next((metric["value"] for metric in metrics if metric["name"] == "TaskDuration"), 0.0)
+
+
+async def measure(browser, mode, viewport, duration_s, app_url=None):
+    """Frame and main-thread statistics for one background ``mode`` at ``viewport``."""
+    context = await new_context(browser, app_url)
+    try:
+        await context.add_init_script(f"window.__PIXELBLAST_MODE__ = {json.dumps(mode)};")
+        page = await open_app(context)
+        width, height = viewport
+        await page.set_viewport_size({"width": width, "height": height})
+        await settle(page)
+        await page.wait_for_timeout(WARMUP_S * 1000)
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Performance.enable")
+        before = await _task_seconds(cdp)
+        sample = await page.evaluate(_SAMPLE_FRAMES, duration_s * 1000)
+        task_s = await _task_seconds(cdp) - before
+        row = summarize(sample["intervals"], task_s, duration_s)
+        row["quality_level"] = sample["stats"]["level"] if sample["stats"] else None
+        return row
+    finally:
+        await context.close()
+
+
+async def run_frames(duration_s, app_url=None, headless=True):
+    """``{"<w>x<h>": {mode: row}}`` for every viewport and background mode."""
+    results = {}
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=headless)
+        try:
+            for viewport in VIEWPORTS:
+                key = f"{viewport[0]}x{viewport[1]}"
+                results[key] = {}
+                for mode in MODES:
+                    results[key][mode] = await measure(browser, mode, viewport, duration_s, app_url)
+        finally:
+            await browser.close()
+    return results
+
+
+def saving(rows, column="main_thread_ms_per_s"):
+    """Percentage of the background's own cost (full minus off) that the adaptive mode saves."""
+    cost_full = rows["full"][column] - rows["off"][column]
+    cost_adaptive = rows["adaptive"][column] - rows["off"][column]
+    if cost_full <= 0:
+        return 0.0
+    return 100 * (cost_full - cost_adaptive) / cost_full
+
+
+def print_report(results):
+    header = f"{'viewport':<10}{'mode':<10}{'mean ms':>9}{'p95 ms':>9}{'dropped':>9}{'main ms/s':>11}{'level':>7}"
+    print(header)
+    print("-" * len(header))
+    for viewport, rows in results.items():
+        for mode, row in rows.items():
+            level = "-" if row["quality_level"] is None else row["quality_level"]
+            print(
+                f"{viewport:<10}{mode:<10}{row['mean_frame_ms']:>9.1f}{row['p95_frame_ms']:>9.1f}"
+                f"{row['dropped_frames']:>9}{row['main_thread_ms_per_s']:>11.1f}{level:>7}"
+            )
+        print(f"{'':<10}adaptive saves {saving(rows):.0f}% of the background's main-thread cost")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.frames", description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5, help="seconds sampled per mode and viewport (default: 5)")
+    parser.add_argument("--port", type=int, help="app port (default: the endpoint in tmp/config.json)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument(
+        "--require-saving",
+        type=float,
+        metavar="PCT",
+        help="exit non-zero unless adaptive saves at least PCT%% of the background's cost at every viewport",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    app_url = url_for_port(args.port) if args.port else None
+    results = asyncio.run(run_frames(args.duration, app_url, headless=not args.headed))
+    FRAMES_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with FRAMES_REPORT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    print_report(results)
+    if args.require_saving is not None:
+        short = [viewport for viewport, rows in results.items() if saving(rows) < args.require_saving]
+        if short:
+            print(f"Adaptive mode saved less than {args.require_saving:g}% at: {', '.join(short)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
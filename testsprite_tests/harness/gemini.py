@@ -0,0 +1,327 @@
+"""Offline stand-in for the Gemini API used by ``src/components/ChatBot.tsx``.
+
+:class:`GeminiStub` answers ``generateContent`` and ``streamGenerateContent``
+requests through ``context.route`` with canned but schema-correct responses,
+so the chat flows run without a key or network. Latency, hung requests and
+errors can be injected per call to see how the chat UI behaves under a slow
+or failing model. A routed stream arrives in one piece; :class:`GeminiServer`
+serves the same answers from a local HTTP server that sends a stream's
+chunks with real gaps between them, for measuring time to first token.
+
+The app only calls Gemini when it was built with ``VITE_GEMINI_API_KEY``
+set; any value works against the stub. The chat caches the model's analyses
+of a message (``src/lib/analysis-cache.ts``); :func:`analysis_cache_stats`
+reads that cache's hit and miss counts.
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .config import GEMINI_ERROR_RATE, GEMINI_LATENCY_MS, GEMINI_TIMEOUT_RATE
+
+GEMINI_URL = re.compile(
+    r"^https://generativelanguage\.googleapis\.com/[^/]+/models/[^:]+:(?:generateContent|streamGenerateContent)"
+)
+
+# Chunks a streamed reply is split into.
+STREAM_CHUNKS = 8
+
+# How long a request picked for a timeout is held before it is aborted.
+HANG_SECONDS = 30
+
+_USER_MESSAGE = re.compile(r'User message: "(.*)"\s*$', re.S)
+
+REPLY = (
+    "• Thank you for sharing that with me. It's *okay* to feel this way.\n"
+    "→ Try *box breathing* for two minutes: inhale 4, hold 4, exhale 4, hold 4.\n"
+    "• What usually helps you feel more *grounded*?"
+)
+
+
+def _prompt_text(body):
+    parts = []
+    for content in body.get("contents", []):
+        parts.extend(part.get("text", "") for part in content.get("parts", []))
+    return "\n".join(parts)
+
+
+def classify_request(body):
+    """Which ChatBot call a request body belongs to: ``message``, ``analysis``, ``habit`` or ``reply``.
+
+    ``message`` is the fused analysis (stress, todos and habit intent in one
+    structured answer); ``analysis`` and ``habit`` are the separate calls.
+    """
+    prompt = _prompt_text(body)
+    if "Analyze the user's message for a wellness app" in prompt:
+        return "message"
+    if "Classify the user's message for a wellness app" in prompt:
+        return "analysis"
+    if "Analyze this user message for habit management requests" in prompt:
+        return "habit"
+    return "reply"
+
+
+def analysis_for(message):
+    """A plausible stress analysis for ``message``, matching the app's JSON contract."""
+    text = message.lower()
+    if re.search(r"(great|happy|calm|relaxed|grateful)", text):
+        return {"stressLevel": "very-low", "todos": []}
+    if re.search(r"(stress|anxious|worried|overwhelmed)", text):
+        level = "high" if re.search(r"(work|deadline|exam|money|family)", text) else "moderate"
+        return {
+            "stressLevel": level,
+            "todos": [
+                {"title": "5-minute box breathing (4-4-4-4)", "category": "mindfulness"},
+                {"title": "Take a 10-minute walk outside", "category": "exercise"},
+                {"title": "Write down three things going well today", "category": "reflection"},
+            ],
+        }
+    return {"stressLevel": "low", "todos": []}
+
+
+NO_HABIT_REQUEST = {"action": "none", "confidence": 0.9}
+
+
+def _user_message(prompt):
+    match = _USER_MESSAGE.search(prompt)
+    return match.group(1) if match else prompt
+
+
+def default_answer(kind, prompt):
+    message = _user_message(prompt)
+    if kind == "analysis":
+        return json.dumps(analysis_for(message))
+    if kind == "habit":
+        return json.dumps(NO_HABIT_REQUEST)
+    if kind == "message":
+        return json.dumps({**analysis_for(message), "habit": NO_HABIT_REQUEST})
+    return REPLY
+
+
+def habit_request(trigger, titles, category="health"):
+    """A ``message`` answer that reads user messages containing ``trigger`` as asking to add ``titles`` as habits.
+
+    Pass it as ``answers={"message": habit_request(...)}``; other messages get the default answer.
+    """
+
+    def answer(prompt):
+        result = json.loads(default_answer("message", prompt))
+        if trigger.lower() in _user_message(prompt).lower():
+            habits = [{"title": title, "category": category} for title in titles]
+            result["habit"] = {"action": "add", "habits": habits, "confidence": 0.95}
+        return json.dumps(result)
+
+    return answer
+
+
+def generate_content_response(text, final=True):
+    """A ``GenerateContentResponse`` body carrying ``text``.
+
+    Only the ``final`` chunk of a stream carries a finish reason.
+    """
+    candidate = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0, "safetyRatings": []}
+    if final:
+        candidate["finishReason"] = "STOP"
+    return {
+        "candidates": [candidate],
+        "usageMetadata": {
+            "promptTokenCount": 0,
+            "candidatesTokenCount": len(text.split()),
+            "totalTokenCount": len(text.split()),
+        },
+        "modelVersion": "gemini-1.5-flash",
+    }
+
+
+def chunk_text(text, chunks=STREAM_CHUNKS):
+    """``text`` split at word boundaries into at most ``chunks`` pieces that join back to it."""
+    words = re.findall(r"\s*\S+\s*", text) or [text]
+    size = -(-len(words) // chunks)
+    return ["".join(words[i : i + size]) for i in range(0, len(words), size)]
+
+
+def sse_events(pieces):
+    """Server-sent events of a ``streamGenerateContent?alt=sse`` response, one per piece."""
+    return [
+        f"data: {json.dumps(generate_content_response(piece, final=i == len(pieces) - 1))}\r\n\r\n"
+        for i, piece in enumerate(pieces)
+    ]
+
+
+def is_stream(url):
+    return ":streamGenerateContent" in url
+
+
+OVERLOADED = {
+    "error": {
+        "code": 503,
+        "message": "The model is overloaded. Please try again later.",
+        "status": "UNAVAILABLE",
+    }
+}
+
+
+@dataclass
+class GeminiCall:
+    kind: str
+    outcome: str
+    latency_ms: float
+
+
+@dataclass
+class GeminiStub:
+    """Routes Gemini requests of a context or page to canned answers.
+
+    ``answers`` maps a request kind (``reply``, ``message``, ``analysis``, ``habit``) to a
+    string or to a callable taking the prompt text, overriding the defaults.
+    """
+
+    latency_ms: float = GEMINI_LATENCY_MS
+    jitter_ms: float = 0.0
+    error_rate: float = GEMINI_ERROR_RATE
+    timeout_rate: float = GEMINI_TIMEOUT_RATE
+    answers: dict = field(default_factory=dict)
+    seed: int = 0
+    calls: list = field(default_factory=list)
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+
+    async def install(self, target):
+        """Start answering Gemini requests made from ``target`` (a context or page)."""
+        await target.route(GEMINI_URL, self._handle)
+        return self
+
+    def count(self, kind=None):
+        return sum(1 for call in self.calls if kind is None or call.kind == kind)
+
+    def answer(self, kind, prompt):
+        custom = self.answers.get(kind)
+        if custom is None:
+            return default_answer(kind, prompt)
+        return custom(prompt) if callable(custom) else custom
+
+    async def _handle(self, route):
+        body = route.request.post_data_json or {}
+        kind = classify_request(body)
+        latency = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms))
+        roll = self._rng.random()
+        try:
+            if roll < self.timeout_rate:
+                self.calls.append(GeminiCall(kind, "timeout", HANG_SECONDS * 1000))
+                await asyncio.sleep(HANG_SECONDS)
+                await route.abort("timedout")
+                return
+            await asyncio.sleep(latency / 1000)
+            if roll < self.timeout_rate + self.error_rate:
+                self.calls.append(GeminiCall(kind, "error", latency))
+                await route.fulfill(status=503, json=OVERLOADED)
+                return
+            self.calls.append(GeminiCall(kind, "ok", latency))
+            text = self.answer(kind, _prompt_text(body))
+            if is_stream(route.request.url):
+                events = "".join(sse_events(chunk_text(text)))
+                await route.fulfill(status=200, content_type="text/event-stream", body=events)
+            else:
+                await route.fulfill(status=200, json=generate_content_response(text))
+        except Exception:
+            # The page or context went away while the request was held.
+            pass
+
+
+async def analysis_cache_stats(page):
+    """``{"hits", "misses", "size"}`` of the chat's analysis cache in ``page``."""
+    return await page.evaluate("() => window.__analysisCache.stats()")
+
+
+async def install_gemini_stub(target, **options):
+    """Install a :class:`GeminiStub` on ``target`` and return it."""
+    return await GeminiStub(**options).install(target)
+
+
+@dataclass
+class GeminiServer(GeminiStub):
+    """The stand-in as a local HTTP server that streams replies in ``chunks`` pieces, ``chunk_delay_ms`` apart.
+
+    Only latency is simulated; the error and timeout rates are ignored. Use
+    :meth:`serve` and point a context at it with :func:`use_gemini_server`.
+    """
+
+    chunks: int = STREAM_CHUNKS
+    chunk_delay_ms: float = 80.0
+    url: str = None
+
+    @contextmanager
+    def serve(self):
+        """Run the server for the duration of the block; yields ``self`` with :attr:`url` set."""
+
+        def handler(*args, **kwargs):
+            return _GeminiHandler(self, *args, **kwargs)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            yield self
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class _GeminiHandler(BaseHTTPRequestHandler):
+    def __init__(self, stand_in, *args, **kwargs):
+        self.stand_in = stand_in
+        super().__init__(*args, **kwargs)
+
+    def _send_cors(self):
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Headers", "*")
+        self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._send_cors()
+        self.end_headers()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        kind = classify_request(body)
+        text = self.stand_in.answer(kind, _prompt_text(body))
+        time.sleep(self.stand_in.latency_ms / 1000)
+        self.stand_in.calls.append(GeminiCall(kind, "ok", self.stand_in.latency_ms))
+        try:
+            self.send_response(200)
+            self._send_cors()
+            if is_stream(self.path):
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                for i, event in enumerate(sse_events(chunk_text(text, self.stand_in.chunks))):
+                    if i:
+                        time.sleep(self.stand_in.chunk_delay_ms / 1000)
+                    self.wfile.write(event.encode())
+                    self.wfile.flush()
+            else:
+                payload = json.dumps(generate_content_response(text)).encode()
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the page went away mid-response
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def use_gemini_server(context, server):
+    """Send the Gemini calls of pages later opened in ``context`` to ``server`` (``window.__GEMINI_BASE_URL__``)."""
+    await context.add_init_script(f"window.__GEMINI_BASE_URL__ = {json.dumps(server.url)};")
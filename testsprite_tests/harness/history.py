@@ -0,0 +1,74 @@
+"""Per-test duration history, used to schedule the longest cases first.
+
+Durations and the latest result of every case are read from the results
+store (:mod:`harness.store`); a change-impact run
+(``python -m harness --changed``) reuses those results for the cases it skips.
+"""
+
+import json
+import statistics
+from datetime import datetime
+
+from .config import TMP_DIR
+from .store import ResultStore
+
+TESTSPRITE_RESULTS_PATH = TMP_DIR / "test_results.json"
+
+# Number of recent durations considered per test.
+KEEP_RUNS = 10
+
+
+def load_history():
+    """Return ``{test_id: [seconds, ...]}`` of the last ``KEEP_RUNS`` measured runs, oldest first."""
+    with ResultStore() as store:
+        return store.durations(KEEP_RUNS)
+
+
+def cached_results(test_ids):
+    """``{test_id: {"status", "duration", "error"}}`` of the latest run of each of ``test_ids``."""
+    with ResultStore() as store:
+        return store.latest_results(test_ids)
+
+
+def _parse_timestamp(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def testsprite_durations(path=TESTSPRITE_RESULTS_PATH):
+    """Durations from a TestSprite ``test_results.json`` (``modified - created``).
+
+    Only used until the harness has recorded its own history.
+    """
+    if not path.exists():
+        return {}
+    with path.open(encoding="utf-8") as fh:
+        entries = json.load(fh)
+    durations = {}
+    for entry in entries:
+        test_id = entry.get("title", "").split("-", 1)[0]
+        try:
+            elapsed = _parse_timestamp(entry["modified"]) - _parse_timestamp(entry["created"])
+        except (KeyError, ValueError):
+            continue
+        if test_id:
+            durations[test_id] = elapsed.total_seconds()
+    return durations
+
+
+def expected_durations(test_ids, history=None):
+    """Estimate a duration for each of ``test_ids``.
+
+    Uses the median of the recorded runs, falling back to the TestSprite
+    results. Tests with no data at all are assumed to be as slow as the
+    slowest known test so that they are started early.
+    """
+    history = load_history() if history is None else history
+    fallback = testsprite_durations()
+    estimates = {}
+    for test_id in test_ids:
+        if history.get(test_id):
+            estimates[test_id] = statistics.median(history[test_id])
+        elif test_id in fallback:
+            estimates[test_id] = fallback[test_id]
+    unknown = max(estimates.values(), default=0.0)
+    return {test_id: estimates.get(test_id, unknown) for test_id in test_ids}
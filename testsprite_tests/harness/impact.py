@@ -0,0 +1,175 @@
+"""Change-impact test selection.
+
+Maps the files changed since a git revision to the features listed in
+``tmp/code_summary.json`` and returns the TC cases that cover those
+features. The results of every other case are reused from the last run
+(see :mod:`harness.store`).
+
+Some changes run the whole suite: build inputs, shared code, the harness,
+source files no feature lists, and features no case covers. A change to a TC script runs that
+script. Anything else outside ``src/``, such as docs or reports, runs
+nothing.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness --changed              # working tree against HEAD
+    python -m harness --changed main -j 4
+    python -m harness.impact main            # only explain the selection
+"""
+
+import argparse
+import fnmatch
+import json
+import subprocess
+
+from .config import APP_DIR, BUILD_INPUTS, SUITE_DIR, TMP_DIR
+
+CODE_SUMMARY_PATH = TMP_DIR / "code_summary.json"
+
+# Source files missing from TestSprite's code summary.
+EXTRA_FEATURES = {
+    "Stress Tracker": ["src/components/StressTracker.tsx"],
+    "Task Tracker": ["src/components/TaskTracker.tsx"],
+    "Time Picker": ["src/components/TimePicker.tsx"],
+    "Sounds": ["src/lib/audio.ts"],
+    "Render Profiling": ["src/lib/render-profile.tsx"],
+    "Background": ["src/components/PixelBlast.tsx", "src/components/PixelBlast.css"],
+    "ChatBot": ["src/lib/analysis-cache.ts"],
+    "Wellness Context": ["src/lib/wellness-store.ts", "src/lib/idb.ts"],
+}
+
+# Features whose changes can break any case.
+SHARED_FEATURES = {"Wellness Context", "UI Components", "Utilities", "Routing"}
+
+# The features behind the navigation tabs, in tab order.
+TAB_FEATURES = [
+    "Dashboard",
+    "ChatBot",
+    "Stress Tracker",
+    "Sleep Tracker",
+    "Task Tracker",
+    "Journal",
+    "Calendar View",
+]
+
+# Features each case exercises, beyond the shared ones.
+COVERAGE = {
+    "TC001": ["ChatBot", "Navigation"],
+    "TC002": ["Task Tracker", "Navigation", "Toast Notifications", "Sounds"],
+    "TC003": ["Stress Tracker", "ChatBot", "Navigation", "Sounds"],
+    "TC004": ["Journal", "Navigation", "Sounds"],
+    "TC005": ["Sleep Tracker", "Time Picker", "Navigation", "Sounds"],
+    "TC008": ["Navigation", "ChatBot", "Journal", "Mobile Hooks", "Background"],
+    "TC009": ["Toast Notifications", "Task Tracker", "ChatBot", "Navigation"],
+    "TC010": [*TAB_FEATURES, "Navigation", "Render Profiling", "Background"],
+    "TC011": [*TAB_FEATURES, "Navigation"],
+    "TC012": ["Navigation", "Mobile Hooks"],
+    "TC013": ["Settings", "Navigation", "Sounds"],
+}
+
+HARNESS_PREFIX = SUITE_DIR.relative_to(APP_DIR).as_posix() + "/harness/"
+SUITE_PREFIX = SUITE_DIR.relative_to(APP_DIR).as_posix() + "/"
+
+
+def load_features(path=CODE_SUMMARY_PATH):
+    """``{feature name: [file pattern, ...]}`` from the code summary plus :data:`EXTRA_FEATURES`."""
+    features = {}
+    if path.exists():
+        with path.open(encoding="utf-8") as fh:
+            for feature in json.load(fh).get("features", []):
+                features[feature["name"]] = list(feature.get("files", []))
+    for name, files in EXTRA_FEATURES.items():
+        features.setdefault(name, []).extend(files)
+    return features
+
+
+def changed_files(base="HEAD"):
+    """Repository paths changed in the working tree since ``base``, untracked files included."""
+
+    def git(*args):
+        out = subprocess.run(["git", *args], cwd=APP_DIR, capture_output=True, text=True, check=True).stdout
+        return [line for line in out.splitlines() if line]
+
+    return sorted(set(git("diff", "--name-only", base, "--")) | set(git("ls-files", "--others", "--exclude-standard")))
+
+
+def features_for(path, features):
+    return [name for name, patterns in features.items() if any(fnmatch.fnmatch(path, p) for p in patterns)]
+
+
+class Selection:
+    """The cases to run for a set of changed files, and why each one was picked."""
+
+    def __init__(self, all_ids):
+        self.all_ids = sorted(all_ids)
+        self.reasons = {}
+
+    def add(self, test_ids, reason):
+        for test_id in test_ids:
+            if test_id in self.all_ids:
+                self.reasons.setdefault(test_id, []).append(reason)
+
+    @property
+    def selected(self):
+        return sorted(self.reasons)
+
+    @property
+    def skipped(self):
+        return [test_id for test_id in self.all_ids if test_id not in self.reasons]
+
+
+def select(paths, all_ids, features=None):
+    """Work out which of ``all_ids`` the changed ``paths`` affect."""
+    features = load_features() if features is None else features
+    selection = Selection(all_ids)
+    for path in paths:
+        if path.startswith(HARNESS_PREFIX):
+            selection.add(all_ids, f"{path} (harness)")
+        elif path.startswith(SUITE_PREFIX):
+            name = path[len(SUITE_PREFIX):]
+            if name.startswith("TC"):
+                selection.add([name.split("_", 1)[0]], path)
+        elif any(fnmatch.fnmatch(path, pattern) for pattern in BUILD_INPUTS):
+            selection.add(all_ids, f"{path} (build input)")
+        elif path.startswith("src/"):
+            names = features_for(path, features)
+            if not names or SHARED_FEATURES.intersection(names):
+                what = ", ".join(names) if names else "not mapped to a feature"
+                selection.add(all_ids, f"{path} ({what})")
+                continue
+            for name in names:
+                covering = [test_id for test_id, covered in COVERAGE.items() if name in covered]
+                if covering:
+                    selection.add(covering, f"{path} ({name})")
+                else:
+                    selection.add(all_ids, f"{path} ({name}, not covered by any case)")
+    return selection
+
+
+def print_selection(selection, paths):
+    print(f"{len(paths)} changed files select {len(selection.selected)}/{len(selection.all_ids)} tests")
+    for test_id in selection.selected:
+        reasons = selection.reasons[test_id]
+        more = f"; +{len(reasons) - 3} more" if len(reasons) > 3 else ""
+        print(f"  {test_id}  {'; '.join(reasons[:3])}{more}")
+    if selection.skipped:
+        print(f"  reusing cached results for {', '.join(selection.skipped)}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.impact", description=__doc__.splitlines()[0])
+    parser.add_argument("base", nargs="?", default="HEAD", help="git revision to diff against (default: HEAD)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from .runner import discover
+
+    args = parse_args(argv)
+    paths = changed_files(args.base)
+    print_selection(select(paths, [case.test_id for case in discover()]), paths)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
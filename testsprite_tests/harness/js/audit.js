@@ -0,0 +1,81 @@
+// Gathers everything the accessibility audit checks in a single evaluate():
+// focusability and focus styling of every visible control, and the computed
+// text/background colours of every element that renders text of its own.
+// Colours come back as flat [r, g, b, a] arrays so Python can vectorize them.
+({ interactive }) => {
+  const parseColor = (value) => {
+    const match = /rgba?\(([^)]+)\)/.exec(value);
+    if (!match) return null;
+    const parts = match[1].split(/[\s,/]+/).filter(Boolean).map(Number);
+    return [parts[0], parts[1], parts[2], parts.length > 3 ? parts[3] : 1];
+  };
+
+  const describe = (el) => {
+    const text = el.getAttribute('aria-label') || el.getAttribute('title')
+      || el.getAttribute('placeholder') || el.textContent || '';
+    const name = text.trim().replace(/\s+/g, ' ').slice(0, 40);
+    return `${el.tagName.toLowerCase()}${el.id ? `#${el.id}` : ''} "${name}"`;
+  };
+
+  const isVisible = (el, style) => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+  };
+
+  // The first ancestor (or the element itself) with a non-transparent background.
+  const backgroundOf = (el) => {
+    for (let node = el; node instanceof Element; node = node.parentElement) {
+      const color = parseColor(getComputedStyle(node).backgroundColor);
+      if (color && color[3] > 0) return color;
+    }
+    return [255, 255, 255, 1];
+  };
+
+  const focusLook = (style) => [
+    style.outlineStyle, style.outlineWidth, style.outlineColor,
+    style.boxShadow, style.borderColor, style.backgroundColor,
+  ].join('|');
+
+  const previous = document.activeElement;
+  const controls = { labels: [], rects: [], focused: [], focusStyle: [] };
+  for (const el of document.querySelectorAll(interactive)) {
+    const style = getComputedStyle(el);
+    if (el.disabled || !isVisible(el, style)) continue;
+    const rest = focusLook(style);
+    el.focus({ preventScroll: true });
+    // Jump the transitions the focus started to their end, so the focused
+    // style is compared rather than the value they start from.
+    for (const animation of el.getAnimations()) {
+      if (animation instanceof CSSTransition) animation.finish();
+    }
+    const focused = document.activeElement === el;
+    const outline = style.outlineStyle !== 'none' && parseFloat(style.outlineWidth) > 0;
+    const rect = el.getBoundingClientRect();
+    controls.labels.push(describe(el));
+    controls.rects.push([rect.x, rect.y, rect.width, rect.height]);
+    controls.focused.push(focused);
+    controls.focusStyle.push(focused && (outline || focusLook(style) !== rest));
+  }
+  if (previous instanceof HTMLElement) previous.focus({ preventScroll: true });
+  else if (document.activeElement instanceof HTMLElement) document.activeElement.blur();
+
+  const text = { labels: [], rects: [], fg: [], bg: [], fontSize: [], fontWeight: [] };
+  for (const el of document.body.querySelectorAll('*')) {
+    const ownText = Array.from(el.childNodes).some(
+      (node) => node.nodeType === Node.TEXT_NODE && node.textContent.trim(),
+    );
+    if (!ownText) continue;
+    const style = getComputedStyle(el);
+    const fg = parseColor(style.color);
+    if (!fg || !isVisible(el, style)) continue;
+    const rect = el.getBoundingClientRect();
+    text.labels.push(describe(el));
+    text.rects.push([rect.x, rect.y, rect.width, rect.height]);
+    text.fg.push(fg);
+    text.bg.push(backgroundOf(el));
+    text.fontSize.push(parseFloat(style.fontSize));
+    text.fontWeight.push(parseInt(style.fontWeight, 10) || 400);
+  }
+
+  return { viewport: [window.innerWidth, window.innerHeight], controls, text };
+}
@@ -0,0 +1,43 @@
+// Tracks whether the app is idle so the harness can wait for it instead of
+// sleeping: counts in-flight fetch/XHR requests and remembers the time of the
+// last DOM mutation (React commits, framer-motion style updates, ...).
+(() => {
+  if (window.__harnessSettle) return;
+
+  const state = { pending: 0, lastChange: performance.now() };
+  const done = () => {
+    state.pending--;
+    state.lastChange = performance.now();
+  };
+
+  const originalFetch = window.fetch;
+  window.fetch = function (...args) {
+    state.pending++;
+    return originalFetch.apply(this, args).finally(done);
+  };
+
+  const originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (...args) {
+    state.pending++;
+    this.addEventListener('loadend', done, { once: true });
+    return originalSend.apply(this, args);
+  };
+
+  const observe = () => {
+    new MutationObserver(() => {
+      state.lastChange = performance.now();
+    }).observe(document.documentElement, {
+      subtree: true,
+      childList: true,
+      attributes: true,
+      characterData: true,
+    });
+  };
+  if (document.documentElement) observe();
+  else document.addEventListener('DOMContentLoaded', observe, { once: true });
+
+  window.__harnessSettle = {
+    pending: () => state.pending,
+    isSettled: (quietMs) => state.pending === 0 && performance.now() - state.lastChange >= quietMs,
+  };
+})();
@@ -0,0 +1,72 @@
+// Collects long tasks, the LCP/CLS/INP web vitals, page load time, bytes
+// transferred and the JS heap peak so the harness can read cumulative totals
+// with one evaluate() call.
+(() => {
+  if (window.__harnessVitals) return;
+
+  const totals = {
+    longTaskCount: 0,
+    longTaskMs: 0,
+    lcpMs: 0,
+    cls: 0,
+    inpMs: 0,
+    loadMs: 0,
+    transferBytes: 0,
+    heapPeakBytes: 0,
+  };
+
+  const observe = (type, onEntry, options = {}) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(onEntry)).observe({
+        type,
+        buffered: true,
+        ...options,
+      });
+    } catch {
+      // Entry type not supported by this browser; leave the total at 0.
+    }
+  };
+
+  observe('longtask', (entry) => {
+    totals.longTaskCount++;
+    totals.longTaskMs += entry.duration;
+  });
+  observe('largest-contentful-paint', (entry) => {
+    totals.lcpMs = entry.renderTime || entry.loadTime || entry.startTime;
+  });
+  observe('layout-shift', (entry) => {
+    if (!entry.hadRecentInput) totals.cls += entry.value;
+  });
+  // INP is approximated as the slowest interaction seen so far.
+  observe(
+    'event',
+    (entry) => {
+      if (entry.interactionId) totals.inpMs = Math.max(totals.inpMs, entry.duration);
+    },
+    { durationThreshold: 16 },
+  );
+
+  observe('navigation', (entry) => {
+    totals.loadMs = entry.loadEventEnd || entry.domContentLoadedEventEnd;
+    totals.transferBytes += entry.transferSize || 0;
+  });
+  // Cross-origin responses without Timing-Allow-Origin report 0 bytes.
+  observe('resource', (entry) => {
+    totals.transferBytes += entry.transferSize || 0;
+  });
+
+  // performance.memory is Chromium-only; sampled because there is no observer for it.
+  const sampleHeap = () => {
+    if (performance.memory) {
+      totals.heapPeakBytes = Math.max(totals.heapPeakBytes, performance.memory.usedJSHeapSize);
+    }
+  };
+  setInterval(sampleHeap, 500);
+
+  window.__harnessVitals = {
+    snapshot: () => {
+      sampleHeap();
+      return { ...totals };
+    },
+  };
+})();
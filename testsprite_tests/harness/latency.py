@@ -0,0 +1,147 @@
+"""Chat send-to-reply latency and model calls per message, fused against separate analysis.
+
+ChatBot analyses a message either with one structured request that runs
+concurrently with the reply (``fused``) or with separate habit and stress
+calls made before the reply (``separate``); ``window.__CHAT_ANALYSIS_MODE__``
+picks one (see ``src/components/ChatBot.tsx``). For each mode the same
+messages are sent in a fresh context against the offline Gemini stand-in at
+a fixed latency, recording the time from clicking send to the reply
+appearing and the Gemini calls each message made. The run fails unless the
+fused mode makes fewer calls and has the lower median latency.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.latency
+    python -m harness.latency --gemini-latency-ms 800 --port 4173
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from contextlib import nullcontext
+
+from playwright import async_api
+
+from .browser import launch_browser, new_context, open_app
+from .config import TMP_DIR, url_for_port
+from .gemini import install_gemini_stub
+from .pages import ChatBot, Navigation
+from .server import prod_server
+from .steps import fill, settle
+
+LATENCY_REPORT_PATH = TMP_DIR / "chat_latency.json"
+
+MODES = ["separate", "fused"]
+
+# Distinct texts, so that no message is answered from the analysis cache.
+MESSAGES = [
+    "I'm stressed about a work deadline tomorrow.",
+    "I feel calm and grateful today.",
+    "I've been worried about money this month.",
+    "I slept badly and feel tired.",
+    "I'm anxious about my exam next week.",
+]
+
+REPLY_TIMEOUT_MS = 30000
+
+
+async def measure(browser, mode, app_url, gemini_latency_ms):
+    """``{"latencies_ms": [...], "calls": {kind: n}}`` for sending every message in ``mode``."""
+    context = await new_context(browser, app_url)
+    try:
+        await context.add_init_script(f"window.__CHAT_ANALYSIS_MODE__ = {json.dumps(mode)};")
+        gemini = await install_gemini_stub(context, latency_ms=gemini_latency_ms)
+        page = await open_app(context)
+        await Navigation(page).open("chat")
+        chat = ChatBot(page)
+        latencies = []
+        for message in MESSAGES:
+            await fill(chat.input, message)
+            before = await chat.bot_messages.count()
+            started = time.perf_counter()
+            await chat.send_button.click()
+            await chat.wait_for_reply(before, timeout=REPLY_TIMEOUT_MS)
+            latencies.append((time.perf_counter() - started) * 1000)
+            await settle(page)
+        calls = {}
+        for call in gemini.calls:
+            calls[call.kind] = calls.get(call.kind, 0) + 1
+        return {"latencies_ms": latencies, "calls": calls}
+    finally:
+        await context.close()
+
+
+async def run_latency(app_url, gemini_latency_ms, headless=True):
+    """``{mode: result of measure}`` for every mode in :data:`MODES`."""
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=headless)
+        try:
+            return {mode: await measure(browser, mode, app_url, gemini_latency_ms) for mode in MODES}
+        finally:
+            await browser.close()
+
+
+def summarize(result):
+    latencies = sorted(result["latencies_ms"])
+    return {
+        "median_ms": statistics.median(latencies),
+        "max_ms": latencies[-1],
+        "calls_per_message": sum(result["calls"].values()) / len(latencies),
+    }
+
+
+def print_report(results):
+    header = f"{'mode':<10}{'median ms':>11}{'max ms':>9}{'calls/msg':>11}  calls"
+    print(header)
+    print("-" * len(header))
+    for mode, result in results.items():
+        row = summarize(result)
+        calls = ", ".join(f"{kind}={count}" for kind, count in sorted(result["calls"].items()))
+        print(f"{mode:<10}{row['median_ms']:>11.0f}{row['max_ms']:>9.0f}{row['calls_per_message']:>11.1f}  {calls}")
+
+
+def problems(results):
+    """Ways in which the fused mode fails to beat the separate one."""
+    fused, separate = summarize(results["fused"]), summarize(results["separate"])
+    found = []
+    if fused["calls_per_message"] >= separate["calls_per_message"]:
+        found.append(f"fused makes {fused['calls_per_message']:.1f} calls per message, not fewer than separate")
+    if fused["median_ms"] >= separate["median_ms"]:
+        found.append(f"fused median {fused['median_ms']:.0f} ms is not below separate {separate['median_ms']:.0f} ms")
+    return found
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.latency", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="app port; the app must have a Gemini key (default: build and serve the production build)",
+    )
+    parser.add_argument(
+        "--gemini-latency-ms", type=float, default=500, help="stand-in latency per call (default: 500)"
+    )
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = nullcontext(url_for_port(args.port)) if args.port else prod_server(offline_gemini=True)
+    with server as app_url:
+        results = asyncio.run(run_latency(app_url, args.gemini_latency_ms, headless=not args.headed))
+    LATENCY_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with LATENCY_REPORT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    print_report(results)
+    found = problems(results)
+    if found:
+        print("\n".join(found))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,252 @@
+"""Concurrent user-journey load mode.
+
+N browser contexts ("users") share one browser and one app instance. For a
+fixed duration each one keeps picking a weighted journey and running it:
+
+* ``chat``   - the TC001 flow: open Chat, send a message, wait for the reply;
+* ``stress`` - the TC003 flow: open Stress, pick a level, add a note, save;
+* ``sleep``  - the TC005 flow: open Sleep, set both times, pick a quality, save.
+
+Each journey times its interactions - tab switch until the section renders,
+click until the UI shows the result, chat send until the bot message is
+rendered - and the run reports p50/p95/p99 per interaction, throughput
+and error counts.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.load --users 8 --duration 60
+    python -m harness.load --users 20 --duration 120 --offline-gemini --weights chat=1,sleep=1
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+from playwright import async_api
+
+from .browser import launch_browser, new_context, open_app
+from .config import TMP_DIR, url_for_port
+from .gemini import install_gemini_stub
+from .pages import ChatBot, Navigation, SleepTracker, StressTracker
+from .runner import RunOptions
+from .steps import click, fill, settle
+
+LOAD_REPORT_PATH = TMP_DIR / "load_report.json"
+
+# Relative frequency of each journey unless overridden with --weights.
+DEFAULT_WEIGHTS = {"chat": 3, "stress": 2, "sleep": 2}
+
+# How long a timed interaction may take before it counts as an error.
+INTERACTION_TIMEOUT_MS = 30000
+
+CHAT_MESSAGES = [
+    "I am feeling a bit stressed and overwhelmed today.",
+    "I could not sleep well last night.",
+    "Work has been hectic, any tips to unwind?",
+    "I'm feeling anxious about tomorrow.",
+]
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank ``q``-th percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    """Latencies and error counts per interaction, and completed journeys."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.journeys = defaultdict(int)
+        self.journey_errors = defaultdict(int)
+
+    @asynccontextmanager
+    async def timed(self, interaction):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[interaction] += 1
+            raise
+        self.latencies[interaction].append(time.perf_counter() - start)
+
+    def report(self, duration, users):
+        interactions = {}
+        for name in sorted(set(self.latencies) | set(self.errors)):
+            values = sorted(self.latencies[name])
+            interactions[name] = {
+                "count": len(values),
+                "errors": self.errors[name],
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "per_second": len(values) / duration,
+            }
+        completed = sum(self.journeys.values())
+        return {
+            "users": users,
+            "duration_s": duration,
+            "journeys": dict(self.journeys),
+            "journey_errors": dict(self.journey_errors),
+            "journeys_per_second": completed / duration,
+            "interactions": interactions,
+        }
+
+
+async def open_section(page, section, recorder):
+    nav = Navigation(page)
+    await settle(page)
+    async with recorder.timed("tab switch"):
+        await nav.tab(section).click()
+        await nav.wait_for_section(section, timeout=INTERACTION_TIMEOUT_MS)
+
+
+async def chat_journey(page, recorder, rng):
+    await open_section(page, "chat", recorder)
+    chat = ChatBot(page)
+    await fill(chat.input, rng.choice(CHAT_MESSAGES))
+    before = await chat.bot_messages.count()
+    async with recorder.timed("chat send -> bot message"):
+        await chat.send_button.click()
+        await chat.wait_for_reply(before, timeout=INTERACTION_TIMEOUT_MS)
+
+
+async def stress_journey(page, recorder, rng):
+    await open_section(page, "stress", recorder)
+    stress = StressTracker(page)
+    note = f"load note {rng.random():.12f}"
+    await click(stress.level(rng.choice(["very-low", "low", "moderate", "high", "very-high"])))
+    await fill(stress.note_input, note)
+    async with recorder.timed("stress save -> entry listed"):
+        await stress.save_button.click()
+        await stress.entries.filter(has_text=note).first.wait_for(timeout=INTERACTION_TIMEOUT_MS)
+
+
+async def sleep_journey(page, recorder, rng):
+    await open_section(page, "sleep", recorder)
+    sleep = SleepTracker(page)
+    await sleep.set_time_now(sleep.bedtime)
+    await sleep.set_time_now(sleep.wakeup)
+    await click(sleep.quality(rng.choice(["excellent", "good", "fair", "poor"])))
+    before = await sleep.entries.count()
+    async with recorder.timed("sleep save -> entry listed"):
+        await sleep.save_button.click()
+        await sleep.entries.nth(before).wait_for(state="attached", timeout=INTERACTION_TIMEOUT_MS)
+
+
+JOURNEYS = {"chat": chat_journey, "stress": stress_journey, "sleep": sleep_journey}
+
+
+async def user_session(browser, options, weights, deadline, recorder, seed):
+    """One simulated user: run weighted journeys in its own context until ``deadline``."""
+    rng = random.Random(seed)
+    names = list(weights)
+    context = await new_context(browser, options.app_url)
+    try:
+        if options.offline_gemini:
+            await install_gemini_stub(context, seed=seed)
+        page = await open_app(context)
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights=[weights[n] for n in names])[0]
+            try:
+                await JOURNEYS[name](page, recorder, rng)
+            except Exception:
+                recorder.journey_errors[name] += 1
+                try:
+                    await page.goto("/")
+                except Exception:
+                    pass  # the next journey will fail and be counted too
+            else:
+                recorder.journeys[name] += 1
+    finally:
+        await context.close()
+
+
+async def run_load(users, duration, options, weights=None, seed=0):
+    """Drive ``users`` concurrent sessions for ``duration`` seconds and return the report."""
+    weights = weights or DEFAULT_WEIGHTS
+    recorder = Recorder()
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=options.headless)
+        try:
+            start = time.monotonic()
+            deadline = start + duration
+            sessions = [
+                user_session(browser, options, weights, deadline, recorder, seed + user)
+                for user in range(users)
+            ]
+            await asyncio.gather(*sessions)
+            elapsed = time.monotonic() - start
+        finally:
+            await browser.close()
+    return recorder.report(elapsed, users)
+
+
+def print_report(report):
+    print(
+        f"{report['users']} users, {report['duration_s']:.0f}s: "
+        f"{sum(report['journeys'].values())} journeys ({report['journeys_per_second']:.2f}/s), "
+        f"{sum(report['journey_errors'].values())} failed"
+    )
+    header = f"{'interaction':<30}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'/s':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, row in report["interactions"].items():
+        print(
+            f"{name:<30}{row['count']:>7}{row['errors']:>8}"
+            f"{row['p50_ms']:>10.0f}{row['p95_ms']:>10.0f}{row['p99_ms']:>10.0f}{row['per_second']:>8.2f}"
+        )
+
+
+def parse_weights(value):
+    """``chat=3,sleep=1`` -> ``{"chat": 3.0, "sleep": 1.0}``."""
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in JOURNEYS:
+            raise argparse.ArgumentTypeError(f"unknown journey {name!r} (choose from {', '.join(JOURNEYS)})")
+        try:
+            weights[name] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"bad weight for {name!r}: {weight!r}") from None
+    return weights
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.load", description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=4, help="concurrent browser contexts (default: 4)")
+    parser.add_argument("--duration", type=float, default=60, help="seconds to keep the load up (default: 60)")
+    parser.add_argument("--weights", type=parse_weights, help="journey weights, e.g. chat=3,stress=2,sleep=2")
+    parser.add_argument("--seed", type=int, default=0, help="seed for journey choice and inputs")
+    parser.add_argument("--port", type=int, help="app port (default: the endpoint in tmp/config.json)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--offline-gemini", action="store_true", help="answer Gemini calls with the local stand-in")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = RunOptions(
+        headless=not args.headed,
+        app_url=url_for_port(args.port) if args.port else None,
+        offline_gemini=args.offline_gemini,
+    )
+    report = asyncio.run(run_load(args.users, args.duration, options, args.weights, args.seed))
+    LOAD_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with LOAD_REPORT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,295 @@
+"""Page objects for the app's main sections.
+
+The generated scripts locate elements by absolute XPath
+(``html/body/div/div[2]/div[3]/...``), which silently points at a different
+element whenever the layout shifts. The page objects here use the
+``data-testid`` attributes and ARIA roles/labels the components expose
+instead, so a script reads ``settings.theme("dark")`` rather than a path.
+
+Locators are built once per page and kept in a :class:`LocatorRegistry`
+until the page navigates or closes. Playwright locators resolve lazily on
+every action, so a cached locator still finds the element React re-rendered
+in place of the old one; only a navigation drops the cache.
+"""
+
+from .steps import click, fill, settle
+from .trace import unwrap
+
+# Section ids of the navigation bar (``nav-<id>`` test ids).
+SECTIONS = ["dashboard", "chat", "stress", "sleep", "tasks", "journal", "calendar"]
+
+# Registries by unwrapped page; an entry is dropped when its page closes.
+_registries = {}
+
+
+class LocatorRegistry:
+    """Named locators of one page, cleared whenever its main frame navigates."""
+
+    def __init__(self, page):
+        self._locators = {}
+        page.on("framenavigated", self._on_navigated)
+
+    def _on_navigated(self, frame):
+        if frame.parent_frame is None:
+            self.clear()
+
+    def get(self, key, build):
+        """Return the locator cached under ``key``, building it on first use."""
+        locator = self._locators.get(key)
+        if locator is None:
+            locator = self._locators[key] = build()
+        return locator
+
+    def clear(self):
+        self._locators.clear()
+
+
+def registry(page):
+    """Return the :class:`LocatorRegistry` shared by every page object of ``page``."""
+    key = unwrap(page)
+    if key not in _registries:
+        _registries[key] = LocatorRegistry(page)
+        page.on("close", lambda _: _registries.pop(key, None))
+    return _registries[key]
+
+
+class PageObject:
+    """Base class; subclasses describe their elements with :meth:`test_id` and :meth:`role`."""
+
+    def __init__(self, page):
+        self.page = page
+        self.locators = registry(page)
+
+    def test_id(self, test_id):
+        return self.locators.get(("test_id", test_id), lambda: self.page.get_by_test_id(test_id))
+
+    def role(self, role, name):
+        return self.locators.get(
+            ("role", role, name),
+            lambda: self.page.get_by_role(role, name=name, exact=True),
+        )
+
+
+class Navigation(PageObject):
+    """The vertical navigation bar, its mobile variant and the settings button."""
+
+    def tab(self, section):
+        return self.test_id(f"nav-{section}")
+
+    def mobile_tab(self, section):
+        return self.test_id(f"mobile-nav-{section}")
+
+    @property
+    def menu_button(self):
+        return self.test_id("mobile-menu-button")
+
+    @property
+    def settings_button(self):
+        return self.test_id("settings-button")
+
+    def content(self, section):
+        """The main area once ``section`` is selected; its code may still be loading."""
+        return self.test_id(f"section-{section}")
+
+    @property
+    def section_loading(self):
+        """The placeholder shown while a section's lazily loaded code is fetched."""
+        return self.test_id("section-loading")
+
+    async def wait_for_section(self, section, timeout=None):
+        """Wait until ``section`` is selected and has rendered.
+
+        The main area's test id changes in the same commit that shows the
+        loading placeholder, so once it matches, the section has rendered as
+        soon as the placeholder is gone.
+        """
+        await self.content(section).wait_for(timeout=timeout)
+        await self.section_loading.wait_for(state="detached", timeout=timeout)
+
+    async def open(self, section):
+        """Switch to ``section`` (one of :data:`SECTIONS`) and wait for it to render."""
+        await click(self.tab(section))
+        await self.wait_for_section(section)
+        await settle(self.page)
+
+    async def open_mobile(self, section):
+        await click(self.menu_button)
+        await click(self.mobile_tab(section))
+        await settle(self.page)
+
+
+class Settings(PageObject):
+    """The settings panel opened from the navigation bar."""
+
+    @property
+    def panel(self):
+        return self.test_id("settings-panel")
+
+    @property
+    def close_button(self):
+        return self.role("button", "Close settings")
+
+    @property
+    def notifications(self):
+        return self.test_id("settings-notifications")
+
+    @property
+    def sound(self):
+        return self.test_id("settings-sound")
+
+    def theme(self, theme_id):
+        return self.test_id(f"theme-{theme_id}")
+
+    async def open(self):
+        await click(Navigation(self.page).settings_button)
+        await self.panel.wait_for()
+
+    async def close(self):
+        await click(self.close_button)
+        await self.panel.wait_for(state="detached")
+
+
+class ChatBot(PageObject):
+    """The chat section."""
+
+    @property
+    def input(self):
+        return self.test_id("chat-input")
+
+    @property
+    def send_button(self):
+        return self.role("button", "Send message")
+
+    @property
+    def messages(self):
+        return self.test_id("chat-message")
+
+    @property
+    def bot_messages(self):
+        return self.locators.get(
+            "bot_messages",
+            lambda: self.page.locator('[data-testid="chat-message"][data-sender="bot"]'),
+        )
+
+    async def send(self, text):
+        """Send ``text`` and return the number of bot messages before the reply."""
+        before = await self.bot_messages.count()
+        await fill(self.input, text)
+        await click(self.send_button)
+        return before
+
+    async def wait_for_reply(self, before, timeout=15000):
+        """Wait until a bot message beyond the first ``before`` appears and return it."""
+        reply = self.bot_messages.nth(before)
+        await reply.wait_for(timeout=timeout)
+        return reply
+
+
+class HabitTracker(PageObject):
+    """The habit list of the ``habit`` section (not linked from the navigation bar)."""
+
+    @property
+    def add_toggle(self):
+        return self.test_id("habit-add-toggle")
+
+    @property
+    def name_input(self):
+        return self.test_id("habit-name-input")
+
+    @property
+    def add_button(self):
+        return self.test_id("habit-add-submit")
+
+    @property
+    def items(self):
+        return self.test_id("habit-item")
+
+    def item(self, name):
+        return self.items.filter(has_text=name)
+
+    async def add(self, name):
+        if not await self.name_input.is_visible():
+            await click(self.add_toggle)
+        await fill(self.name_input, name)
+        await click(self.add_button)
+
+    async def toggle(self, name):
+        await click(self.item(name).get_by_test_id("habit-toggle"))
+
+    async def delete(self, name):
+        item = self.item(name)
+        await item.hover()
+        await click(item.get_by_test_id("habit-delete"))
+
+
+class Journal(PageObject):
+    """The journal entry form and its recent-entries list."""
+
+    @property
+    def title_input(self):
+        return self.test_id("journal-title-input")
+
+    @property
+    def content_input(self):
+        return self.test_id("journal-content-input")
+
+    @property
+    def save_button(self):
+        return self.test_id("journal-save")
+
+    @property
+    def entries(self):
+        return self.test_id("journal-entry")
+
+    async def write(self, title, content):
+        await fill(self.title_input, title)
+        await fill(self.content_input, content)
+        await click(self.save_button)
+
+
+class StressTracker(PageObject):
+    """The stress check-in form and the stress log."""
+
+    @property
+    def note_input(self):
+        return self.test_id("stress-note")
+
+    @property
+    def save_button(self):
+        return self.test_id("stress-save")
+
+    @property
+    def entries(self):
+        return self.test_id("stress-entry")
+
+    def level(self, level_id):
+        return self.test_id(f"stress-level-{level_id}")
+
+
+class SleepTracker(PageObject):
+    """The sleep log form and its history."""
+
+    @property
+    def bedtime(self):
+        return self.locators.get("bedtime", lambda: self.page.locator("#bedtime"))
+
+    @property
+    def wakeup(self):
+        return self.locators.get("wakeup", lambda: self.page.locator("#wakeup"))
+
+    @property
+    def save_button(self):
+        return self.test_id("sleep-save")
+
+    @property
+    def entries(self):
+        return self.test_id("sleep-entry")
+
+    def quality(self, value):
+        return self.test_id(f"sleep-quality-{value}")
+
+    async def set_time_now(self, picker):
+        """Set the ``picker`` (``self.bedtime`` or ``self.wakeup``) to the current time."""
+        await click(picker)
+        await click(self.role("button", "Now"))
+        await click(self.role("button", "Confirm"))
@@ -0,0 +1,114 @@
+"""Spread the suite over worker processes, longest expected test first.
+
+Every worker owns one browser (and optionally one app server on its own
+port) and pulls test ids from a shared queue. The queue is ordered by
+expected duration, longest first, so the slow cases start immediately and
+the short ones fill the gaps; wall time ends up close to the longest test
+rather than the sum of all of them.
+"""
+
+import asyncio
+import dataclasses
+import heapq
+import multiprocessing
+import queue
+
+from playwright import async_api
+
+from .browser import launch_browser
+from .config import url_for_port
+from .history import expected_durations
+from .runner import TestResult, discover, run_case
+from .server import dev_server
+
+
+def longest_first(expected):
+    """Test ids ordered by expected duration, longest first (ties by id)."""
+    return sorted(expected, key=lambda test_id: (-expected[test_id], test_id))
+
+
+def predicted_wall_time(expected, workers):
+    """Wall time of a longest-first list schedule of ``expected`` on ``workers``."""
+    loads = [0.0] * max(1, workers)
+    for test_id in longest_first(expected):
+        heapq.heapreplace(loads, loads[0] + expected[test_id])
+    return max(loads)
+
+
+async def _drain(tasks, results, test_ids, options):
+    cases = {case.test_id: case for case in discover(only=test_ids)}
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=options.headless)
+        try:
+            while True:
+                test_id = tasks.get()
+                if test_id is None:
+                    break
+                results.put(await run_case(browser, cases[test_id], options))
+        finally:
+            await browser.close()
+
+
+def _worker(tasks, results, test_ids, options, port, serve):
+    if serve:
+        with dev_server(port, offline_gemini=options.offline_gemini) as app_url:
+            asyncio.run(_drain(tasks, results, test_ids, dataclasses.replace(options, app_url=app_url)))
+    else:
+        if port is not None:
+            options = dataclasses.replace(options, app_url=url_for_port(port))
+        asyncio.run(_drain(tasks, results, test_ids, options))
+
+
+def run_parallel(cases, workers, options, base_port=None, serve=False, on_result=None):
+    """Run ``cases`` on ``workers`` processes and return their results in run order."""
+    expected = expected_durations([case.test_id for case in cases])
+    order = longest_first(expected)
+    workers = min(workers, len(order))
+    print(
+        f"Scheduling {len(order)} tests on {workers} workers: "
+        f"expected wall time {predicted_wall_time(expected, workers):.0f}s "
+        f"(sequential {sum(expected.values()):.0f}s)",
+        flush=True,
+    )
+
+    ctx = multiprocessing.get_context("spawn")
+    tasks = ctx.Queue()
+    results = ctx.Queue()
+    for test_id in order:
+        tasks.put(test_id)
+    for _ in range(workers):
+        tasks.put(None)
+
+    procs = []
+    for index in range(workers):
+        port = base_port + index if base_port is not None else None
+        proc = ctx.Process(target=_worker, args=(tasks, results, order, options, port, serve), daemon=True)
+        proc.start()
+        procs.append(proc)
+
+    collected = []
+    try:
+        while len(collected) < len(order):
+            try:
+                result = results.get(timeout=1)
+            except queue.Empty:
+                if not any(proc.is_alive() for proc in procs):
+                    break
+                continue
+            collected.append(result)
+            if on_result:
+                on_result(result)
+    finally:
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+
+    finished = {result.test_id for result in collected}
+    for test_id in order:
+        if test_id not in finished:
+            lost = TestResult(test_id, "ERROR", 0.0, "Worker exited before the test reported a result")
+            collected.append(lost)
+            if on_result:
+                on_result(lost)
+    return collected
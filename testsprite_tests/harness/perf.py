@@ -0,0 +1,142 @@
+"""Runtime performance metrics for a page, read over CDP.
+
+:class:`PerfCollector` samples ``Performance.getMetrics`` (JS heap, layout
+and style-recalc counts, script time) together with the long-task and
+LCP/CLS/INP totals gathered by ``js/vitals.js``, and keeps one row per
+labelled snapshot, typically one per navigation-tab switch.
+
+:func:`case_metrics` reads the same totals once at the end of a case, for
+the per-test performance numbers the runner records.
+"""
+
+from playwright import async_api
+
+from .steps import click, settle
+
+# The totals js/vitals.js has gathered on the page, or null where it is not installed.
+_VITALS_JS = "() => window.__harnessVitals ? window.__harnessVitals.snapshot() : null"
+
+# Labels (the nav buttons' ``title``) of the sections reachable from the navigation bar.
+NAV_TABS = ["Chat", "Dashboard", "Stress", "Sleep", "Tasks", "Journal", "Calendar"]
+
+# Columns of a row; counters and times are deltas since the previous snapshot,
+# heap and the web vitals are the current values.
+COLUMNS = [
+    ("heap_mb", "{:8.1f}"),
+    ("layouts", "{:8d}"),
+    ("style_recalcs", "{:8d}"),
+    ("script_ms", "{:8.1f}"),
+    ("long_tasks", "{:8d}"),
+    ("long_task_ms", "{:8.1f}"),
+    ("lcp_ms", "{:8.1f}"),
+    ("cls", "{:8.3f}"),
+    ("inp_ms", "{:8.1f}"),
+]
+
+
+async def case_metrics(context):
+    """Performance totals of the pages still open in ``context`` at the end of a case.
+
+    Page load time is that of the first page; interaction latency and the JS
+    heap are the worst across pages, and bytes are summed. Documents that
+    were navigated away from are not counted.
+    """
+    snapshots = []
+    for page in context.pages:
+        try:
+            vitals = await page.evaluate(_VITALS_JS)
+        except async_api.Error:
+            continue  # closed or crashed page
+        if vitals:
+            snapshots.append(vitals)
+    if not snapshots:
+        return {}
+    return {
+        "load_ms": snapshots[0]["loadMs"],
+        "interaction_ms": max(v["inpMs"] for v in snapshots),
+        "heap_peak_mb": max(v["heapPeakBytes"] for v in snapshots) / 2**20,
+        "transfer_kb": sum(v["transferBytes"] for v in snapshots) / 1024,
+    }
+
+
+class PerfCollector:
+    """Collects a table of runtime metrics for ``page``; create it with :meth:`attach`."""
+
+    def __init__(self, page, cdp):
+        self.page = page
+        self.cdp = cdp
+        self.rows = []
+        self._last = None
+
+    @classmethod
+    async def attach(cls, page):
+        cdp = await page.context.new_cdp_session(page)
+        await cdp.send("Performance.enable")
+        return cls(page, cdp)
+
+    async def sample(self):
+        """Current cumulative metrics, without recording a row."""
+        response = await self.cdp.send("Performance.getMetrics")
+        metrics = {metric["name"]: metric["value"] for metric in response["metrics"]}
+        vitals = await self.page.evaluate(_VITALS_JS) or {}
+        return {
+            "heap_bytes": metrics.get("JSHeapUsedSize", 0),
+            "layouts": int(metrics.get("LayoutCount", 0)),
+            "style_recalcs": int(metrics.get("RecalcStyleCount", 0)),
+            "script_s": metrics.get("ScriptDuration", 0.0),
+            "long_tasks": int(vitals.get("longTaskCount", 0)),
+            "long_task_ms": vitals.get("longTaskMs", 0.0),
+            "lcp_ms": vitals.get("lcpMs", 0.0),
+            "cls": vitals.get("cls", 0.0),
+            "inp_ms": vitals.get("inpMs", 0.0),
+        }
+
+    async def snapshot(self, label):
+        """Record a row for ``label`` and return it."""
+        current = await self.sample()
+        last = self._last or {key: 0 for key in current}
+        row = {
+            "label": label,
+            "heap_mb": current["heap_bytes"] / 2**20,
+            "layouts": current["layouts"] - last["layouts"],
+            "style_recalcs": current["style_recalcs"] - last["style_recalcs"],
+            "script_ms": (current["script_s"] - last["script_s"]) * 1000,
+            "long_tasks": current["long_tasks"] - last["long_tasks"],
+            "long_task_ms": current["long_task_ms"] - last["long_task_ms"],
+            "lcp_ms": current["lcp_ms"],
+            "cls": current["cls"],
+            "inp_ms": current["inp_ms"],
+        }
+        self._last = current
+        self.rows.append(row)
+        return row
+
+    async def switch_tab(self, label):
+        """Click the ``label`` navigation tab, wait for the section to render and the app to settle, and snapshot."""
+        await click(self.page.locator(f'nav button[title="{label}"]').first)
+        await self.page.get_by_test_id("section-loading").wait_for(state="detached")
+        await settle(self.page)
+        return await self.snapshot(label)
+
+    def peak(self, column):
+        return max((row[column] for row in self.rows), default=0)
+
+    def table(self):
+        """The recorded rows as a fixed-width text table."""
+        header = f"{'label':<12}" + "".join(f"{name:>14}" for name, _ in COLUMNS)
+        lines = [header, "-" * len(header)]
+        for row in self.rows:
+            cells = "".join(f"{fmt.format(row[name]):>14}" for name, fmt in COLUMNS)
+            lines.append(f"{row['label']:<12}{cells}")
+        return "\n".join(lines)
+
+    def over_budget(self, budgets, skip=("load",)):
+        """Describe every value in the table that exceeds ``budgets[column]``."""
+        violations = []
+        for row in self.rows:
+            if row["label"] in skip:
+                continue
+            for column, limit in budgets.items():
+                if row[column] > limit:
+                    violations.append(f"{row['label']}: {column} {row[column]:.3f} > {limit}")
+        return violations
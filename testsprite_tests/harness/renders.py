@@ -0,0 +1,94 @@
+"""Read the app's render instrumentation from the Python side.
+
+With profiling enabled (``enable_render_profiling`` before ``open_app``, or
+a ``--mode profile`` build), every section rendered by ``Index`` and
+``Index.renderSection`` itself count their React commits and render time
+in ``window.__renderRegistry`` (``src/lib/render-profile.tsx``).
+:func:`track_renders` diffs that registry around an action::
+
+    async with track_renders(page) as renders:
+        await click(habit_checkbox)
+    assert renders.commits("Journal") == 0
+
+A plain production build cannot count renders (react-dom only reports
+Profiler commits in development and in ``npm run build:profile``); there
+:func:`snapshot` raises :class:`RenderProfilingUnsupported`, and
+:func:`render_profiling_supported` lets a case skip its render checks.
+"""
+
+from contextlib import asynccontextmanager
+
+from .steps import settle
+
+_SNAPSHOT = """() => window.__renderRegistry
+  ? { supported: window.__renderRegistry.supported, stats: window.__renderRegistry.snapshot() }
+  : null"""
+_SUPPORTED = "() => Boolean(window.__renderRegistry && window.__renderRegistry.supported)"
+_COUNTERS = ("commits", "mounts", "updates", "actualMs")
+
+
+async def enable_render_profiling(context):
+    """Turn on the render instrumentation for every page later opened in ``context``."""
+    await context.add_init_script("window.__RENDER_PROFILE__ = true;")
+
+
+class RenderProfilingUnsupported(RuntimeError):
+    """The app's react-dom build does not report Profiler commits."""
+
+
+async def render_profiling_supported(page):
+    """Whether ``page`` counts renders: profiling was requested and its react-dom build reports commits."""
+    return await page.evaluate(_SUPPORTED)
+
+
+async def snapshot(page):
+    """Current ``{profiler id: stats}`` of ``page``."""
+    registry = await page.evaluate(_SNAPSHOT)
+    if registry is None:
+        raise RuntimeError("render profiling is off; call enable_render_profiling(context) before open_app")
+    if not registry["supported"]:
+        raise RenderProfilingUnsupported(
+            "this build's react-dom does not report Profiler commits; use the dev server or npm run build:profile"
+        )
+    return registry["stats"]
+
+
+def diff(before, after):
+    """Per-id change of the counters between two snapshots, for ids that rendered in between."""
+    changed = {}
+    for profiler_id, stats in after.items():
+        old = before.get(profiler_id, {})
+        delta = {name: stats[name] - old.get(name, 0) for name in _COUNTERS}
+        if delta["commits"]:
+            changed[profiler_id] = delta
+    return changed
+
+
+class RenderDelta:
+    """What rendered during a :func:`track_renders` block; filled in when the block exits."""
+
+    def __init__(self):
+        self.stats = {}
+
+    def commits(self, profiler_id):
+        return self.stats.get(profiler_id, {}).get("commits", 0)
+
+    def rendered(self):
+        return sorted(self.stats)
+
+    def __repr__(self):
+        return f"RenderDelta({self.stats!r})"
+
+
+@asynccontextmanager
+async def track_renders(page):
+    """Diff the render registry around the ``async with`` body, once the app has settled."""
+    delta = RenderDelta()
+    before = await snapshot(page)
+    yield delta
+    await settle(page)
+    after = await snapshot(page)
+    if not after:
+        # Index.renderSection commits on mount, so an empty registry means nothing is being recorded.
+        raise RuntimeError("render profiling is on but recorded no commit")
+    delta.stats = diff(before, after)
@@ -0,0 +1,403 @@
+"""Produce the TestSprite JSON and Markdown reports from the results store.
+
+``tmp/test_results.json`` keeps TestSprite's entry layout (title,
+description, status, error, created/modified) but drops the embedded test
+source, which is in the ``TC*.py`` files already. The Markdown report
+follows the layout of ``testsprite-mcp-test-report.md``, with the numbers
+taken from the store: each case's duration and slowest step, the pass
+rates per requirement, a performance table per requirement against the
+baseline run, and the history sections (slowest, flaky and regressed
+cases).
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.report              # the latest run
+    python -m harness.report --run 12
+"""
+
+import argparse
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from .config import APP_DIR, SUITE_DIR, load_config
+from .history import TESTSPRITE_RESULTS_PATH
+from .store import ResultStore
+
+MARKDOWN_REPORT_PATH = SUITE_DIR / "testsprite-mcp-test-report.md"
+TEST_PLAN_PATH = SUITE_DIR / "testsprite_frontend_test_plan.json"
+
+# Runs looked at by the history sections.
+HISTORY_RUNS = 10
+
+# The report's requirement groups; cases in none of them go under "Other".
+REQUIREMENTS = [
+    (
+        "AI ChatBot Functionality",
+        "AI-powered mental wellness companion with trauma-informed responses, crisis detection, and habit suggestions.",
+        ["TC001"],
+    ),
+    (
+        "Habit Tracking System",
+        "Daily habit management with AI deduplication and streak tracking.",
+        ["TC002"],
+    ),
+    (
+        "Mood Tracking System",
+        "Manual and AI-detected mood entry with 5-point scale and history tracking.",
+        ["TC003"],
+    ),
+    (
+        "Journal System",
+        "Daily journaling with CRUD operations and mood association.",
+        ["TC004"],
+    ),
+    (
+        "Sleep Tracking System",
+        "Sleep logging, duration calculation, quality assessment, and historical tracking.",
+        ["TC005"],
+    ),
+    (
+        "Todo System Integration",
+        "Todo management with AI habit suggestions and conversion to trackable habits.",
+        ["TC006"],
+    ),
+    (
+        "Data Persistence",
+        "Local storage persistence and offline functionality for all wellness data.",
+        ["TC007"],
+    ),
+    (
+        "Responsive Design and Accessibility",
+        "Cross-device responsiveness and accessibility compliance.",
+        ["TC008"],
+    ),
+    (
+        "Toast Notification System",
+        "Status-based notifications with color coding and auto-dismissal.",
+        ["TC009"],
+    ),
+    (
+        "Performance Optimization",
+        "Efficient React hooks usage, state memoization, and lazy loading readiness.",
+        ["TC010"],
+    ),
+    (
+        "Dashboard Overview",
+        "Wellness metrics aggregation and quick navigation to core features.",
+        ["TC011"],
+    ),
+    (
+        "Mobile Navigation System",
+        "Responsive navigation with touch support and mobile-optimized UI.",
+        ["TC012"],
+    ),
+    (
+        "User Settings Management",
+        "User preferences, notification settings, theme selection, and configuration persistence.",
+        ["TC013"],
+    ),
+]
+
+# Metrics of the performance section: (key, label, unit, ratio, minimum).
+# A value is red when it is more than ``ratio`` times the baseline and at
+# least ``minimum`` worse; small absolute changes are noise.
+PERF_METRICS = [
+    ("duration_s", "Test duration", "s", 1.25, 2.0),
+    ("load_ms", "Page load", "ms", 1.25, 200),
+    ("interaction_ms", "Largest interaction latency", "ms", 1.5, 50),
+    ("heap_peak_mb", "JS heap peak", "MB", 1.25, 5),
+    ("transfer_kb", "Bytes transferred", "KB", 1.2, 100),
+]
+
+STATUS_LABELS = {
+    "PASSED": "✅ Passed",
+    "FAILED": "❌ Failed",
+    "TIMEOUT": "⚠️ Timed out",
+    "ERROR": "⚠️ Not run",
+}
+
+
+def load_plan(path=TEST_PLAN_PATH):
+    """``{test_id: plan entry}`` from the TestSprite test plan."""
+    with path.open(encoding="utf-8") as fh:
+        return {entry["id"]: entry for entry in json.load(fh)}
+
+
+def project_name():
+    path = load_config().get("executionArgs", {}).get("projectPath")
+    return Path(path).name if path else APP_DIR.name
+
+
+def project_version():
+    path = APP_DIR / "package.json"
+    if not path.exists():
+        return "N/A"
+    with path.open(encoding="utf-8") as fh:
+        return json.load(fh).get("version", "N/A")
+
+
+def _timestamp(value):
+    return value.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def results_json(store, run_id, plan):
+    """The entries of ``tmp/test_results.json`` for ``run_id``.
+
+    The store has no per-case start time, so ``created`` is the start of the
+    run and ``modified`` adds the case's duration.
+    """
+    run = store.run(run_id)
+    started = datetime.fromisoformat(run["started_at"])
+    entries = []
+    for row in store.results(run_id):
+        case = plan.get(row["test_id"], {})
+        entries.append({
+            "runId": run_id,
+            "title": f"{row['test_id']}-{case.get('title', row['test_id'])}",
+            "description": case.get("description", ""),
+            "testStatus": row["status"],
+            "testError": row["error"],
+            "testType": "FRONTEND",
+            "cached": bool(row["cached"]),
+            "created": _timestamp(started),
+            "modified": _timestamp(started + timedelta(seconds=row["duration"])),
+        })
+    return entries
+
+
+def _group(results):
+    by_id = {row["test_id"]: row for row in results}
+    grouped = []
+    for name, description, test_ids in REQUIREMENTS:
+        rows = [by_id.pop(test_id) for test_id in test_ids if test_id in by_id]
+        grouped.append((name, description, rows))
+    if by_id:
+        grouped.append(("Other", "Cases not assigned to a requirement.", list(by_id.values())))
+    return grouped
+
+
+def _slowest_step(store, run_id, test_id):
+    steps = store.steps(run_id, test_id)
+    if not steps:
+        return "N/A"
+    step = max(steps, key=lambda s: s["duration"])
+    where = f" at line {step['line']}" if step["line"] else ""
+    what = f" ({step['comment']})" if step["comment"] else ""
+    return f"Slowest of {len(steps)} steps: `{step['action']}`{where} took {step['duration']:.2f}s{what}"
+
+
+def compare_perf(current, baseline):
+    """``(label, unit, value, baseline value, delta %, red)`` per metric of one case.
+
+    Metrics missing from the case are left out; ones missing from the
+    baseline have no delta and are never red.
+    """
+    rows = []
+    for key, label, unit, ratio, minimum in PERF_METRICS:
+        if key not in current:
+            continue
+        value = current[key]
+        before = baseline.get(key)
+        if before is None:
+            rows.append((label, unit, value, None, None, False))
+            continue
+        delta = 100 * (value - before) / before if before else None
+        red = value > before * ratio and value - before >= minimum
+        rows.append((label, unit, value, before, delta, red))
+    return rows
+
+
+def _perf_section(store, run_id, grouped):
+    baseline_id = store.baseline_run_id()
+    current = store.metrics(run_id)
+    baseline = store.metrics(baseline_id) if baseline_id else {}
+    against = f"baseline run {baseline_id}" if baseline_id else "no baseline marked"
+    thresholds = ", ".join(
+        f"{label} > {ratio:g}x and +{minimum:g} {unit}" for _, label, unit, ratio, minimum in PERF_METRICS
+    )
+    lines = [
+        "## 4️⃣ Performance",
+        "",
+        f"Measured in this run, compared with {against}. 🔴 marks a regression: {thresholds}.",
+        "",
+    ]
+    for name, _, rows in grouped:
+        measured = [row for row in rows if row["test_id"] in current]
+        if not measured:
+            continue
+        lines += [
+            f"### Requirement: {name}",
+            "",
+            "| Test | Metric | Value | Baseline | Δ | |",
+            "|------|--------|-------|----------|---|---|",
+        ]
+        for row in measured:
+            test_id = row["test_id"]
+            for label, unit, value, before, delta, red in compare_perf(current[test_id], baseline.get(test_id, {})):
+                was = f"{before:.1f} {unit}" if before is not None else "N/A"
+                change = f"{delta:+.0f}%" if delta is not None else "N/A"
+                mark = "🔴" if red else ("🟢" if before is not None else "⚪")
+                lines.append(f"| {test_id} | {label} | {value:.1f} {unit} | {was} | {change} | {mark} |")
+        lines.append("")
+    return lines
+
+
+def _percent(count, total):
+    return round(100 * count / total) if total else 0
+
+
+def render_markdown(store, run_id, plan):
+    """The Markdown report for ``run_id``."""
+    run = store.run(run_id)
+    results = store.results(run_id)
+    date = run["started_at"][:10]
+    lines = [
+        "# TestSprite AI Testing Report(MCP)",
+        "",
+        "---",
+        "",
+        "## 1️⃣ Document Metadata",
+        f"- **Project Name:** {project_name()}",
+        f"- **Version:** {project_version()}",
+        f"- **Date:** {date}",
+        "- **Prepared by:** TestSprite AI Team",
+        f"- **Run:** {run_id} (revision {run['revision'] or 'N/A'})",
+        "",
+        "---",
+        "",
+        "## 2️⃣ Requirement Validation Summary",
+        "",
+    ]
+
+    grouped = _group(results)
+    number = 0
+    for name, description, rows in grouped:
+        if not rows:
+            continue
+        lines += [f"### Requirement: {name}", f"- **Description:** {description}", ""]
+        for row in rows:
+            number += 1
+            case = plan.get(row["test_id"], {})
+            scripts = sorted(SUITE_DIR.glob(f"{row['test_id']}_*.py"))
+            code = f"[code_file](./{scripts[0].name})" if scripts else "N/A"
+            cached = " (reused from an earlier run)" if row["cached"] else ""
+            lines += [
+                f"#### Test {number}",
+                f"- **Test ID:** {row['test_id']}",
+                f"- **Test Name:** {case.get('title', 'N/A')}",
+                f"- **Test Code:** {code}",
+                f"- **Test Error:** {row['error'] or 'N/A'}",
+                f"- **Status:** {STATUS_LABELS.get(row['status'], row['status'])}{cached}",
+                f"- **Duration:** {row['duration']:.2f}s",
+                f"- **Severity:** {'Low' if row['status'] == 'PASSED' else case.get('priority', 'N/A')}",
+                f"- **Analysis / Findings:** {_slowest_step(store, run_id, row['test_id'])}",
+                "",
+                "---",
+                "",
+            ]
+
+    total = len(results)
+    passed = sum(1 for row in results if row["status"] == "PASSED")
+    failed = sum(1 for row in results if row["status"] == "FAILED")
+    partial = total - passed - failed
+    lines += [
+        "## 3️⃣ Coverage & Matching Metrics",
+        "",
+        f"- **{_percent(passed, total)}% of tests passed**",
+        f"- **{_percent(failed, total)}% of tests failed**",
+        f"- **{_percent(partial, total)}% of tests timed out or did not run**",
+        "",
+        "| Requirement | Total Tests | ✅ Passed | ⚠️ Partial | ❌ Failed |",
+        "|-------------|-------------|-----------|------------|-----------|",
+    ]
+    for name, _, rows in grouped:
+        if not rows:
+            continue
+        ok = sum(1 for row in rows if row["status"] == "PASSED")
+        bad = sum(1 for row in rows if row["status"] == "FAILED")
+        lines.append(f"| {name} | {len(rows)} | {ok} | {len(rows) - ok - bad} | {bad} |")
+
+    lines += ["", "---", ""]
+    lines += _perf_section(store, run_id, grouped)
+    lines += ["---", "", f"## 5️⃣ History (last {HISTORY_RUNS} runs)", "", "### Slowest tests:"]
+    slowest = store.slowest(HISTORY_RUNS, limit=5)
+    lines += [
+        f"{i}. **{row['test_id']}** - {row['mean']:.1f}s mean, {row['worst']:.1f}s worst over {row['runs']} runs"
+        for i, row in enumerate(slowest, 1)
+    ] or ["None recorded."]
+    lines += ["", "### Flaky tests:"]
+    lines += [
+        f"{i}. **{row['test_id']}** - passed {row['passed']} of {row['runs']} runs, {row['flips']} status flips"
+        for i, row in enumerate(store.flaky(HISTORY_RUNS), 1)
+    ] or ["None."]
+    baseline = store.baseline_run_id()
+    lines += ["", f"### Regressions vs baseline (run {baseline}):" if baseline else "### Regressions vs baseline:"]
+    if baseline is None:
+        lines.append("No baseline marked.")
+    else:
+        lines += [
+            f"{i}. **{row['test_id']}** - {row['reason']}"
+            for i, row in enumerate(store.regressions(run_id, baseline), 1)
+        ] or ["None."]
+
+    env = run["environment"]
+    lines += [
+        "",
+        "---",
+        "",
+        "## 6️⃣ Test Environment Notes",
+        "",
+        f"- **Browser:** Chromium via Playwright {env.get('playwright') or 'N/A'}"
+        f" ({'headless' if env.get('headless', True) else 'headed'})",
+        f"- **Platform:** {env.get('platform', 'N/A')}, Python {env.get('python', 'N/A')}",
+        f"- **App:** {env.get('app_url') or 'N/A'}",
+        f"- **API Status:** {'offline Gemini stand-in' if env.get('offline_gemini') else 'live Gemini API'}",
+        f"- **Workers:** {env.get('workers', 1)}",
+        "",
+        "---",
+        "",
+        f"*Report generated by TestSprite AI Team on {date}*",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def write_reports(run_id=None, json_path=TESTSPRITE_RESULTS_PATH, markdown_path=MARKDOWN_REPORT_PATH):
+    """Write both reports for ``run_id`` (default: the latest run) and return the run id."""
+    plan = load_plan()
+    with ResultStore() as store:
+        run_id = run_id or store.latest_run_id()
+        if run_id is None:
+            raise LookupError("the store has no runs yet; run `python -m harness` first")
+        entries = results_json(store, run_id, plan)
+        markdown = render_markdown(store, run_id, plan)
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    with json_path.open("w", encoding="utf-8") as fh:
+        json.dump(entries, fh, indent=2, ensure_ascii=False)
+    markdown_path.write_text(markdown, encoding="utf-8")
+    return run_id
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.report", description=__doc__.splitlines()[0])
+    parser.add_argument("--run", type=int, help="run id (default: the latest run)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        run_id = write_reports(args.run)
+    except LookupError as exc:
+        print(exc)
+        return 1
+    print(
+        f"Run {run_id} written to {TESTSPRITE_RESULTS_PATH.relative_to(SUITE_DIR)}"
+        f" and {MARKDOWN_REPORT_PATH.relative_to(SUITE_DIR)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
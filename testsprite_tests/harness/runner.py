@@ -0,0 +1,357 @@
+"""Run every ``TC*.py`` flow in one event loop against a single pooled browser.
+
+Each test gets its own fresh ``BrowserContext``; the browser itself is
+launched once per suite run instead of once per script.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness                # run the whole suite
+    python -m harness TC001 TC005    # run a subset
+    python -m harness -j 4           # spread the suite over 4 worker processes
+    python -m harness --changed      # only the cases affected by uncommitted changes
+    python -m harness --app prod     # against a production build instead of the dev server
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import sys
+import time
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+from .browser import launch_browser, new_context
+from .capture import StepCapture
+from .config import (
+    APP_MODE,
+    CAPTURE_STEPS,
+    FAILURES_DIR,
+    STEP_BUDGET_S,
+    SUITE_DIR,
+    TEST_BUDGET_S,
+    base_url,
+    url_for_port,
+)
+from .gemini import install_gemini_stub
+from .history import cached_results
+from .perf import case_metrics
+from .server import dev_server, prod_server
+from .store import STORE_PATH, ResultStore, environment
+from .trace import StepBudgetExceeded, Tracer, print_slowest, write_trace
+from .watchdog import ConsoleLog, close_context, dump_partial
+
+
+# How long reading the performance totals at the end of a case may take.
+METRICS_TIMEOUT_S = 5
+
+
+@dataclass
+class TestCase:
+    test_id: str
+    path: Path
+    run_test: object = field(repr=False)
+
+
+@dataclass
+class RunOptions:
+    """Settings shared by every case of a run, and by every worker of a parallel run."""
+
+    headless: bool = True
+    app_url: str = None
+    offline_gemini: bool = False
+    test_budget: float = TEST_BUDGET_S
+    step_budget: float = STEP_BUDGET_S
+    capture: int = 0
+
+
+@dataclass
+class TestResult:
+    test_id: str
+    status: str
+    duration: float
+    error: str = ""
+    steps: list = field(default_factory=list, repr=False)
+    cached: bool = False
+    metrics: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def passed(self):
+        return self.status == "PASSED"
+
+
+def test_id_for(path):
+    """``TC001_AI_ChatBot_....py`` -> ``TC001``."""
+    return path.stem.split("_", 1)[0]
+
+
+def load_case(path):
+    """Import a TC script without running it and return its ``run_test`` flow."""
+    spec = importlib.util.spec_from_file_location(f"testsprite_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return TestCase(test_id_for(path), path, module.run_test)
+
+
+def discover(suite_dir=SUITE_DIR, only=None):
+    """Return the TC cases in ``suite_dir`` in id order, optionally filtered by id."""
+    if str(suite_dir) not in sys.path:
+        sys.path.insert(0, str(suite_dir))
+    wanted = {test_id.upper() for test_id in only} if only else None
+    cases = []
+    for path in sorted(suite_dir.glob("TC*.py")):
+        if wanted is not None and test_id_for(path) not in wanted:
+            continue
+        cases.append(load_case(path))
+    return cases
+
+
+def describe_error(exc):
+    """One-line description of a test failure, with the failing script line."""
+    message = f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
+    frames = [f for f in traceback.extract_tb(exc.__traceback__) if Path(f.filename).name.startswith("TC")]
+    if frames:
+        message += f" ({Path(frames[-1].filename).name}:{frames[-1].lineno})"
+    return message
+
+
+async def run_case(browser, case, options):
+    """Run one case in a fresh context of ``browser``, timing it and each of its steps.
+
+    A case that runs past ``options.test_budget``, or has a single step run
+    past ``options.step_budget``, is cancelled and reported as ``TIMEOUT``
+    with a partial dump (see :mod:`harness.watchdog`); any other error,
+    including a ``TimeoutError`` raised by the case itself, is ``FAILED``. With
+    ``options.capture``, the last captured steps of a failed or timed-out
+    case are written next to it (see :mod:`harness.capture`). Whatever the
+    outcome, the pages' performance totals are read into ``TestResult.metrics``.
+    """
+    context = await new_context(browser, options.app_url)
+    if options.offline_gemini:
+        await install_gemini_stub(context)
+    console = ConsoleLog(context)
+    capture = StepCapture(options.capture) if options.capture else None
+    tracer = Tracer(case.test_id, step_budget=options.step_budget, on_step=capture and capture.record)
+    start = time.perf_counter()
+    budget = asyncio.timeout(options.test_budget)
+    try:
+        try:
+            async with budget:
+                await case.run_test(tracer.wrap(context))
+        # A TimeoutError the case raised itself (its own asyncio.wait_for, say)
+        # is an ordinary failure; only the budget expiring is a TIMEOUT.
+        except (TimeoutError, StepBudgetExceeded) as exc:
+            if isinstance(exc, StepBudgetExceeded) or budget.expired():
+                if isinstance(exc, StepBudgetExceeded):
+                    reason = describe_error(exc)
+                else:
+                    reason = f"test exceeded the {options.test_budget:g}s budget"
+                duration = time.perf_counter() - start
+                dump = await dump_partial(context, tracer, console, reason)
+                if capture:
+                    capture.flush(dump)
+                error = f"{reason}; partial dump in {dump.relative_to(SUITE_DIR)}"
+                result = TestResult(case.test_id, "TIMEOUT", duration, error, tracer.steps)
+            else:
+                result = _failed(case, exc, start, capture, tracer)
+        except Exception as exc:
+            result = _failed(case, exc, start, capture, tracer)
+        else:
+            result = TestResult(case.test_id, "PASSED", time.perf_counter() - start, steps=tracer.steps)
+        result.metrics = await _collect_metrics(context)
+    finally:
+        await close_context(context)
+    return result
+
+
+def _failed(case, exc, start, capture, tracer):
+    duration = time.perf_counter() - start
+    error = describe_error(exc)
+    if capture:
+        steps = capture.flush(FAILURES_DIR / case.test_id)
+        error += f"; last steps in {steps.relative_to(SUITE_DIR)}"
+    return TestResult(case.test_id, "FAILED", duration, error, tracer.steps)
+
+
+async def _collect_metrics(context):
+    try:
+        return await asyncio.wait_for(case_metrics(context), METRICS_TIMEOUT_S)
+    except Exception:
+        return {}  # a hung or crashed page only costs the numbers
+
+
+async def run_suite(cases, options, on_result=None):
+    """Run ``cases`` sequentially against one shared browser."""
+    results = []
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=options.headless)
+        try:
+            for case in cases:
+                result = await run_case(browser, case, options)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+        finally:
+            await browser.close()
+    return results
+
+
+def select_changed(cases, base):
+    """Split ``cases`` by :mod:`harness.impact` into those to run and reused results of the rest.
+
+    A skipped case with no recorded result is run anyway.
+    """
+    from .impact import changed_files, print_selection, select
+
+    paths = changed_files(base)
+    selection = select(paths, [case.test_id for case in cases])
+    print_selection(selection, paths)
+    cached = cached_results(selection.skipped)
+    reused = [
+        TestResult(test_id, row["status"], row["duration"], row["error"], cached=True)
+        for test_id, row in cached.items()
+    ]
+    return [case for case in cases if case.test_id not in cached], reused
+
+
+def print_result(result):
+    suffix = " (cached)" if result.cached else ""
+    print(f"{result.status:<7} {result.test_id:<6} {result.duration:8.2f}s{suffix}", flush=True)
+    if result.error:
+        print("        " + result.error.splitlines()[0], flush=True)
+
+
+def print_summary(results):
+    passed = sum(1 for r in results if r.passed)
+    total = sum(r.duration for r in results if not r.cached)
+    reused = sum(1 for r in results if r.cached)
+    print("-" * 40)
+    print(f"{passed}/{len(results)} passed in {total:.2f}s" + (f" ({reused} cached)" if reused else ""))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness", description=__doc__.splitlines()[0])
+    parser.add_argument("tests", nargs="*", help="test ids to run, e.g. TC001 (default: all)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument(
+        "--changed",
+        nargs="?",
+        const="HEAD",
+        metavar="REV",
+        help="run only the cases affected by changes since REV (default: HEAD), reusing cached results for the rest",
+    )
+    parser.add_argument("-j", "--workers", type=int, default=1, help="number of worker processes (default: 1)")
+    parser.add_argument("--base-port", type=int, help="give worker N the app on port BASE_PORT + N")
+    parser.add_argument("--serve", action="store_true", help="start a Vite dev server per worker (needs --base-port)")
+    parser.add_argument(
+        "--app",
+        choices=["dev", "prod"],
+        default=APP_MODE,
+        help="test the running dev server, or a production build served by the harness (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--offline-gemini",
+        action="store_true",
+        help="answer Gemini calls with the local stand-in (see TESTSPRITE_GEMINI_* for latency/errors)",
+    )
+    parser.add_argument(
+        "--capture",
+        type=int,
+        nargs="?",
+        const=CAPTURE_STEPS,
+        default=0,
+        metavar="N",
+        help=f"keep screenshots and DOM of the last N steps, written only on failure (default N: {CAPTURE_STEPS})",
+    )
+    parser.add_argument(
+        "--test-budget",
+        type=float,
+        default=TEST_BUDGET_S,
+        metavar="SECONDS",
+        help=f"cancel and dump a test that runs longer (default: {TEST_BUDGET_S:g})",
+    )
+    parser.add_argument(
+        "--step-budget",
+        type=float,
+        default=STEP_BUDGET_S,
+        metavar="SECONDS",
+        help=f"cancel and dump a test whose single step runs longer (default: {STEP_BUDGET_S:g})",
+    )
+    args = parser.parse_args(argv)
+    if args.serve and args.base_port is None:
+        parser.error("--serve requires --base-port")
+    if args.serve and args.app == "prod":
+        parser.error("--serve starts dev servers; --app prod serves one production build to every worker")
+    return args
+
+
+def record_run(results, options, args, started_at):
+    """Append the run to the results store and return its id."""
+    env = environment(
+        headless=options.headless,
+        workers=args.workers,
+        app_url=options.app_url or (None if args.base_port else base_url()),
+        base_port=args.base_port,
+        offline_gemini=options.offline_gemini,
+        test_budget=options.test_budget,
+        step_budget=options.step_budget,
+        capture=options.capture,
+        app=args.app,
+        changed_since=args.changed,
+    )
+    with ResultStore() as store:
+        return store.record_run(results, env, started_at)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    cases = discover(only=args.tests)
+    if not cases:
+        print("No test cases found.")
+        return 1
+    reused = []
+    if args.changed:
+        cases, reused = select_changed(cases, args.changed)
+    options = RunOptions(
+        headless=not args.headed,
+        offline_gemini=args.offline_gemini,
+        test_budget=args.test_budget,
+        step_budget=args.step_budget,
+        capture=args.capture,
+    )
+    if not cases:
+        results = []
+    elif args.app == "prod":
+        with prod_server(args.base_port or 0, offline_gemini=options.offline_gemini) as app_url:
+            options.app_url = app_url
+            if args.workers > 1:
+                from .parallel import run_parallel
+
+                results = run_parallel(cases, args.workers, options, on_result=print_result)
+            else:
+                results = asyncio.run(run_suite(cases, options, print_result))
+    elif args.workers > 1:
+        from .parallel import run_parallel
+
+        results = run_parallel(cases, args.workers, options, args.base_port, args.serve, print_result)
+    elif args.serve:
+        with dev_server(args.base_port, offline_gemini=options.offline_gemini) as app_url:
+            options.app_url = app_url
+            results = asyncio.run(run_suite(cases, options, print_result))
+    else:
+        if args.base_port:
+            options.app_url = url_for_port(args.base_port)
+        results = asyncio.run(run_suite(cases, options, print_result))
+    write_trace(results)
+    for result in reused:
+        print_result(result)
+    results += reused
+    run_id = record_run(results, options, args, started_at)
+    print_summary(results)
+    print(f"Recorded as run {run_id} in {STORE_PATH.relative_to(SUITE_DIR)}")
+    print_slowest(results)
+    return 0 if all(r.passed for r in results) else 1
@@ -0,0 +1,178 @@
+"""Data-scale benchmark for the WellnessProvider operations.
+
+For each store size the app is opened with that many seeded habits, todos
+and chat suggestions (:mod:`harness.seed`), and ``registerChatSuggestions``
+and ``addTodos`` are called through the provider's test hook with a batch of
+new titles. Each call records the time spent in the call itself and the
+time until the next paint after it.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.scale                          # 1k/10k/100k, compare with the baseline
+    python -m harness.scale --sizes 1000 5000 --save-baseline
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+
+from playwright import async_api
+
+from .browser import launch_browser, new_context, open_app
+from .config import SUITE_DIR, url_for_port
+from .seed import dataset, enable_test_hook, seed_state
+
+BASELINE_PATH = SUITE_DIR / "baselines" / "wellness_scale.json"
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+OPERATIONS = ["registerChatSuggestions", "addTodos"]
+
+# New tasks passed per call, and calls per operation and size.
+BATCH = 10
+REPEATS = 5
+
+# A measurement regresses when it is this many times the baseline and at
+# least REGRESSION_MIN_MS slower (small timings are too noisy for a ratio).
+REGRESSION_RATIO = 1.5
+REGRESSION_MIN_MS = 2.0
+
+_CALL = """async ({ op, tasks }) => {
+  const start = performance.now();
+  window.__wellness[op](tasks);
+  const called = performance.now();
+  await new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, 0)));
+  return { callMs: called - start, paintMs: performance.now() - start };
+}"""
+
+
+def _tasks(op, size, repeat):
+    return [
+        {"title": f"Benchmark {op} {size} {repeat} task {i}", "category": "health"}
+        for i in range(BATCH)
+    ]
+
+
+async def measure_size(browser, size, app_url=None):
+    """Median call and next-paint times of each operation with ``size`` records of each kind."""
+    context = await new_context(browser, app_url)
+    try:
+        await enable_test_hook(context)
+        await seed_state(context, **dataset(habits=size, todos=size, chat_suggestions=size))
+        page = await open_app(context)
+        await page.wait_for_function("() => window.__wellness !== undefined", timeout=60000)
+        results = {}
+        for op in OPERATIONS:
+            samples = [
+                await page.evaluate(_CALL, {"op": op, "tasks": _tasks(op, size, repeat)})
+                for repeat in range(REPEATS)
+            ]
+            results[op] = {
+                "call_ms": statistics.median(sample["callMs"] for sample in samples),
+                "paint_ms": statistics.median(sample["paintMs"] for sample in samples),
+            }
+        return results
+    finally:
+        await context.close()
+
+
+async def run_scale(sizes, app_url=None, headless=True):
+    """``{op: {size: {"call_ms", "paint_ms"}}}`` for every size in ``sizes``."""
+    results = {op: {} for op in OPERATIONS}
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=headless)
+        try:
+            for size in sizes:
+                for op, timing in (await measure_size(browser, size, app_url)).items():
+                    results[op][str(size)] = timing
+        finally:
+            await browser.close()
+    return results
+
+
+def growth_exponent(timings, column="call_ms"):
+    """Log-log slope between the smallest and the largest size (1 is linear, 2 quadratic)."""
+    points = sorted((int(size), timing[column]) for size, timing in timings.items())
+    if len(points) < 2:
+        return None
+    (n1, t1), (n2, t2) = points[0], points[-1]
+    if t1 <= 0 or t2 <= 0:
+        return None
+    return math.log(t2 / t1) / math.log(n2 / n1)
+
+
+def chart(results, column="paint_ms", width=40):
+    """A text bar chart of ``column`` per operation and size, on a log scale."""
+    values = [timing[column] for timings in results.values() for timing in timings.values()]
+    top = math.log10(max(values) + 1) if values else 1
+    lines = []
+    for op, timings in results.items():
+        exponent = growth_exponent(timings)
+        growth = f"~n^{exponent:.2f}" if exponent is not None else "n/a"
+        lines.append(f"{op} ({column}, call time grows {growth})")
+        for size, timing in sorted(timings.items(), key=lambda item: int(item[0])):
+            bar = "#" * max(1, round(width * math.log10(timing[column] + 1) / top))
+            lines.append(f"  {int(size):>8} {timing[column]:10.2f} ms  {bar}")
+    return "\n".join(lines)
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not path.exists():
+        return None
+    with path.open(encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def compare(results, baseline):
+    """Describe every measurement that regressed against ``baseline``."""
+    regressions = []
+    for op, timings in results.items():
+        for size, timing in timings.items():
+            before = baseline.get(op, {}).get(size)
+            if before is None:
+                continue
+            for column in ("call_ms", "paint_ms"):
+                now, then = timing[column], before[column]
+                if now > then * REGRESSION_RATIO and now - then > REGRESSION_MIN_MS:
+                    regressions.append(f"{op} @ {size}: {column} {then:.2f} -> {now:.2f} ms")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.scale", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="records of each kind to seed")
+    parser.add_argument("--port", type=int, help="app port (default: the endpoint in tmp/config.json)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--save-baseline", action="store_true", help=f"write the results to {BASELINE_PATH.name}")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    app_url = url_for_port(args.port) if args.port else None
+    results = asyncio.run(run_scale(args.sizes, app_url, headless=not args.headed))
+    print(chart(results))
+    if args.save_baseline:
+        save_baseline(results)
+        print(f"Baseline written to {BASELINE_PATH.relative_to(SUITE_DIR)}")
+        return 0
+    baseline = load_baseline()
+    if baseline is None:
+        print("No baseline yet; run with --save-baseline to record one.")
+        return 0
+    regressions = compare(results, baseline)
+    for line in regressions:
+        print("REGRESSION " + line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
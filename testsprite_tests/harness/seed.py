@@ -0,0 +1,143 @@
+"""Preload WellnessProvider state instead of clicking it in through the UI.
+
+:func:`seed_state` installs an init script that sets
+``window.__WELLNESS_SEED__`` before any app code runs; ``WellnessProvider``
+(``src/hooks/wellness-context.tsx``) takes its initial lists from it. Call it
+on the browser context before :func:`~harness.browser.open_app`::
+
+    await seed_state(context, **dataset(habits=20, journal_entries=500))
+    page = await open_app(context)
+
+The builders below produce records with the same shape as the ones the app
+creates itself, with deterministic ids and dates.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+# WellnessProvider state keys that can be seeded.
+SEED_KEYS = (
+    "habits",
+    "chatMessages",
+    "stressEntries",
+    "todos",
+    "sleepEntries",
+    "journalEntries",
+    "chatSuggestions",
+)
+
+# Seeded records are dated backwards, one per day, from this moment.
+SEED_EPOCH = datetime(2025, 9, 1, 8, 0, tzinfo=timezone.utc)
+
+SLEEP_QUALITIES = ["excellent", "good", "fair", "poor"]
+STRESS_LEVELS = ["low", "moderate", "high"]
+# The task categories the app itself assigns (see the category union in ChatBot.tsx).
+CATEGORIES = ["mindfulness", "health", "reflection", "exercise", "learning"]
+
+
+def seed_script(state):
+    """The init script that exposes ``state`` to WellnessProvider."""
+    unknown = sorted(set(state) - set(SEED_KEYS))
+    if unknown:
+        raise ValueError(f"unknown WellnessProvider state: {', '.join(unknown)}")
+    return f"window.__WELLNESS_SEED__ = {json.dumps(state)};"
+
+
+async def seed_state(context, **state):
+    """Seed every page later opened in ``context`` with ``state`` (lists keyed by :data:`SEED_KEYS`)."""
+    await context.add_init_script(seed_script(state))
+
+
+async def enable_test_hook(context):
+    """Have WellnessProvider publish its operations on ``window.__wellness``."""
+    await context.add_init_script("window.__WELLNESS_TEST_HOOK__ = true;")
+
+
+def _day(index):
+    return SEED_EPOCH - timedelta(days=index)
+
+
+def habit(index, name=None, completed=False, streak=0):
+    return {
+        "id": f"seed-habit-{index}",
+        "name": name or f"Seeded habit {index}",
+        "category": CATEGORIES[index % len(CATEGORIES)],
+        "completed": completed,
+        "isPermanent": False,
+        "streak": streak,
+    }
+
+
+def todo(index, title=None, completed=False):
+    return {
+        "id": f"seed-todo-{index}",
+        "title": title or f"Seeded task {index}",
+        "category": CATEGORIES[index % len(CATEGORIES)],
+        "completed": completed,
+        "createdAt": _day(index).isoformat(),
+    }
+
+
+def sleep_entry(index, bedtime="22:30", wakeup="06:30", quality=None):
+    bed = datetime.strptime(bedtime, "%H:%M")
+    wake = datetime.strptime(wakeup, "%H:%M")
+    if wake < bed:
+        wake += timedelta(days=1)
+    return {
+        "id": f"seed-sleep-{index}",
+        "date": _day(index).isoformat(),
+        "bedtime": bedtime,
+        "wakeup": wakeup,
+        "durationMinutes": int((wake - bed).total_seconds() // 60),
+        "quality": quality or SLEEP_QUALITIES[index % len(SLEEP_QUALITIES)],
+    }
+
+
+def chat_suggestion(index, name=None):
+    return {
+        "id": f"seed-suggestion-{index}",
+        "name": name or f"Seeded suggestion {index}",
+        "completed": False,
+        "streak": 0,
+        "category": CATEGORIES[index % len(CATEGORIES)],
+        "source": "chatbot",
+        "timestamp": _day(index).isoformat(),
+    }
+
+
+def journal_entry(index, title=None, content=None):
+    return {
+        "id": f"seed-journal-{index}",
+        "title": title or f"Seeded entry {index}",
+        "content": content or f"Seeded journal entry {index}: a calm day with a short walk.",
+        "date": _day(index).date().isoformat(),
+    }
+
+
+def stress_entry(index, level=None, note=""):
+    timestamp = _day(index).isoformat()
+    level = level or STRESS_LEVELS[index % len(STRESS_LEVELS)]
+    return {
+        "id": f"seed-stress-{index}",
+        "stressLevel": level,
+        "level": level,
+        "note": note,
+        "date": timestamp,
+        "timestamp": timestamp,
+    }
+
+
+def dataset(habits=0, todos=0, sleep_entries=0, journal_entries=0, stress_entries=0, chat_suggestions=0):
+    """A state dict with the given number of generated records of each kind.
+
+    Lists are in the order the app builds them: stress entries newest first,
+    everything else oldest first.
+    """
+    return {
+        "habits": [habit(i) for i in range(habits)],
+        "todos": [todo(i) for i in reversed(range(todos))],
+        "sleepEntries": [sleep_entry(i) for i in reversed(range(sleep_entries))],
+        "journalEntries": [journal_entry(i) for i in reversed(range(journal_entries))],
+        "stressEntries": [stress_entry(i) for i in range(stress_entries)],
+        "chatSuggestions": [chat_suggestion(i) for i in reversed(range(chat_suggestions))],
+    }
@@ -0,0 +1,230 @@
+"""App servers for the suite: a Vite dev server, or a production build served statically.
+
+:func:`dev_server` runs ``vite`` for a worker that needs its own port.
+:func:`prod_server` runs ``vite build`` once per source hash into
+``tmp/builds/<hash>/`` and serves it from a small threaded static server
+with gzip and long-lived caching for the hashed assets, so that load times
+match what users of the deployed app get.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.server              # build if needed and serve on an ephemeral port
+    python -m harness.server --port 4173
+"""
+
+import argparse
+import fnmatch
+import gzip
+import hashlib
+import mimetypes
+import os
+import shutil
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from .config import APP_DIR, BUILD_INPUTS, TMP_DIR, url_for_port
+
+BUILDS_DIR = TMP_DIR / "builds"
+
+# Builds kept in BUILDS_DIR; older ones are removed after a new build.
+KEEP_BUILDS = 3
+
+# Served pre-compressed when the browser accepts gzip.
+COMPRESSED_TYPES = {".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".map", ".webmanifest"}
+
+# Vite puts content-hashed files under assets/; they can be cached forever.
+IMMUTABLE_PREFIX = "/assets/"
+
+# Placeholder Gemini key for the offline stand-in (see harness.gemini).
+OFFLINE_GEMINI_KEY = "offline-stand-in"
+
+
+def wait_for_http(url, timeout=60.0):
+    """Poll ``url`` until it answers or ``timeout`` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=2):
+                return
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{url} did not come up within {timeout:.0f}s")
+            time.sleep(0.5)
+
+
+def _app_env(offline_gemini):
+    env = dict(os.environ)
+    # Honour the tests' window hooks in production builds too (src/lib/test-hooks.ts).
+    env.setdefault("VITE_TEST_HOOKS", "1")
+    if offline_gemini:
+        env.setdefault("VITE_GEMINI_API_KEY", OFFLINE_GEMINI_KEY)
+    return env
+
+
+@contextmanager
+def dev_server(port, offline_gemini=False):
+    """Run ``vite`` on ``port`` for the duration of the block and yield its URL.
+
+    With ``offline_gemini`` the app is given a placeholder Gemini key when
+    none is set, so that ChatBot calls the API and the stand-in answers.
+    """
+    proc = subprocess.Popen(
+        ["npx", "vite", "--port", str(port), "--strictPort"],
+        cwd=APP_DIR,
+        env=_app_env(offline_gemini),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = url_for_port(port)
+    try:
+        wait_for_http(url)
+        yield url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _build_files():
+    for directory in ("src", "public"):
+        root = APP_DIR / directory
+        if root.is_dir():
+            yield from (path for path in root.rglob("*") if path.is_file())
+    for path in APP_DIR.iterdir():
+        if path.is_file() and any(fnmatch.fnmatch(path.name, pattern) for pattern in BUILD_INPUTS):
+            yield path
+
+
+def source_hash(env, mode="production"):
+    """Hash of everything ``vite build`` reads: sources, config, ``mode`` and the ``VITE_*`` variables."""
+    digest = hashlib.sha256(mode.encode())
+    for name in sorted(key for key in env if key.startswith("VITE_")):
+        digest.update(f"{name}={env[name]}\n".encode())
+    for path in sorted(_build_files()):
+        digest.update(path.relative_to(APP_DIR).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _precompress(directory):
+    for path in directory.rglob("*"):
+        if path.is_file() and path.suffix in COMPRESSED_TYPES:
+            path.with_name(path.name + ".gz").write_bytes(gzip.compress(path.read_bytes(), compresslevel=9))
+
+
+def _prune(keep):
+    builds = sorted((p for p in BUILDS_DIR.iterdir() if (p / ".complete").exists()), key=lambda p: p.stat().st_mtime)
+    for old in builds[:-keep]:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def build_once(offline_gemini=False, mode="production"):
+    """Return the directory of a production build of the current sources, building it if needed."""
+    env = _app_env(offline_gemini)
+    out_dir = BUILDS_DIR / source_hash(env, mode)
+    if (out_dir / ".complete").exists():
+        os.utime(out_dir)  # most recently used, for pruning
+        return out_dir
+    shutil.rmtree(out_dir, ignore_errors=True)
+    subprocess.run(
+        ["npx", "vite", "build", "--mode", mode, "--outDir", str(out_dir), "--emptyOutDir"],
+        cwd=APP_DIR,
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    _precompress(out_dir)
+    (out_dir / ".complete").touch()
+    _prune(KEEP_BUILDS)
+    return out_dir
+
+
+class _StaticHandler(SimpleHTTPRequestHandler):
+    """Serves a Vite build: gzip when accepted, cache headers, and index.html for client routes."""
+
+    def translate_path(self, path):
+        translated = super().translate_path(path)
+        if not os.path.exists(translated) and not os.path.splitext(path.split("?", 1)[0])[1]:
+            return os.path.join(self.directory, "index.html")  # a react-router route
+        return translated
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return None
+        encoded = path + ".gz"
+        use_gzip = "gzip" in self.headers.get("Accept-Encoding", "") and os.path.exists(encoded)
+        body = open(encoded if use_gzip else path, "rb")
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(path)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(os.fstat(body.fileno()).st_size))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        if self.path.startswith(IMMUTABLE_PREFIX):
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        elif path.endswith(".html"):
+            self.send_header("Cache-Control", "no-cache")
+        else:
+            self.send_header("Cache-Control", "public, max-age=3600")
+        self.end_headers()
+        return body
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_static(directory, port=0):
+    """Serve ``directory`` on ``port`` (0 picks a free one) in a background thread and yield its URL."""
+
+    def handler(*args, **kwargs):
+        return _StaticHandler(*args, directory=str(directory), **kwargs)
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield url_for_port(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def prod_server(port=0, offline_gemini=False):
+    """Build the app once per source hash and serve it for the duration of the block; yield its URL."""
+    with serve_static(build_once(offline_gemini), port) as url:
+        yield url
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.server", description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=0, help="port to serve on (default: a free one)")
+    parser.add_argument("--offline-gemini", action="store_true", help="build with the stand-in's placeholder key")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with prod_server(args.port, args.offline_gemini) as url:
+        print(f"Serving the production build on {url} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
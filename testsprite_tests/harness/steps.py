@@ -0,0 +1,38 @@
+"""Step helpers that wait for the app to settle instead of sleeping.
+
+The generated scripts used ``await page.wait_for_timeout(3000)`` before every
+click and fill. These helpers wait only until no fetch/XHR is in flight and
+the DOM has been quiet for ``SETTLE_QUIET_MS``, capped at
+``SETTLE_CEILING_MS``; Playwright's own actionability checks then wait for
+the target to be visible, stable and enabled.
+"""
+
+from playwright import async_api
+
+from .config import DEFAULT_TIMEOUT_MS, SETTLE_CEILING_MS, SETTLE_QUIET_MS
+
+_IS_SETTLED = "quietMs => !window.__harnessSettle || window.__harnessSettle.isSettled(quietMs)"
+
+
+async def settle(page, ceiling_ms=None):
+    """Wait until ``page`` is idle, giving up silently after the ceiling."""
+    try:
+        await page.wait_for_function(
+            _IS_SETTLED,
+            arg=SETTLE_QUIET_MS,
+            timeout=SETTLE_CEILING_MS if ceiling_ms is None else ceiling_ms,
+        )
+    except async_api.TimeoutError:
+        pass
+
+
+async def click(elem, timeout=DEFAULT_TIMEOUT_MS):
+    """Click ``elem`` once the app has settled."""
+    await settle(elem.page)
+    await elem.click(timeout=timeout)
+
+
+async def fill(elem, value, timeout=DEFAULT_TIMEOUT_MS):
+    """Fill ``elem`` with ``value`` once the app has settled."""
+    await settle(elem.page)
+    await elem.fill(value, timeout=timeout)
@@ -0,0 +1,349 @@
+"""Append-only store of every suite run, in ``tmp/results.sqlite``.
+
+Each run of ``python -m harness`` adds one ``runs`` row, with the git
+revision and the environment. Each case adds one ``results`` row, one
+``steps`` row per traced Playwright call and its performance totals
+(:func:`harness.perf.case_metrics`) as ``metrics`` rows. Rows are only ever
+inserted, so the store keeps the whole duration and status history. The
+duration history (:mod:`harness.history`), the cached results reused by
+``--changed`` and the reports (:mod:`harness.report`) are all read from it.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.store slowest --runs 20    # slowest cases over the last 20 runs
+    python -m harness.store flaky --runs 20      # cases that both passed and failed
+    python -m harness.store baseline             # mark the latest run as the baseline
+    python -m harness.store regressions          # latest run against the baseline
+"""
+
+import argparse
+import json
+import platform
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timezone
+from importlib import metadata
+
+from .config import APP_DIR, TMP_DIR
+
+STORE_PATH = TMP_DIR / "results.sqlite"
+
+# A case regresses when it stops passing, or when it takes this many times
+# its baseline duration and at least REGRESSION_MIN_S longer.
+REGRESSION_RATIO = 1.5
+REGRESSION_MIN_S = 2.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at  TEXT NOT NULL,
+    revision    TEXT,
+    environment TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id   INTEGER NOT NULL REFERENCES runs (run_id),
+    test_id  TEXT NOT NULL,
+    status   TEXT NOT NULL,
+    duration REAL NOT NULL,
+    error    TEXT NOT NULL DEFAULT '',
+    cached   INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, test_id)
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (test_id, run_id);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id   INTEGER NOT NULL REFERENCES runs (run_id),
+    test_id  TEXT NOT NULL,
+    seq      INTEGER NOT NULL,
+    action   TEXT NOT NULL,
+    target   TEXT NOT NULL,
+    line     INTEGER,
+    comment  TEXT NOT NULL,
+    start    REAL NOT NULL,
+    duration REAL NOT NULL,
+    error    TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (run_id, test_id, seq)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id  INTEGER NOT NULL REFERENCES runs (run_id),
+    test_id TEXT NOT NULL,
+    name    TEXT NOT NULL,
+    value   REAL NOT NULL,
+    PRIMARY KEY (run_id, test_id, name)
+);
+CREATE TABLE IF NOT EXISTS baselines (
+    marked_at TEXT NOT NULL,
+    run_id    INTEGER NOT NULL REFERENCES runs (run_id)
+);
+"""
+
+# Results that measured a real run of the case: not reused from an earlier
+# run, not lost with a worker (ERROR) and not cut off by a budget (TIMEOUT).
+_MEASURED = "cached = 0 AND status NOT IN ('ERROR', 'TIMEOUT')"
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def git_revision():
+    """``HEAD``'s commit, with ``+dirty`` when the working tree has changes; ``None`` outside git."""
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=APP_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=APP_DIR, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return head + ("+dirty" if dirty else "")
+
+
+def environment(**settings):
+    """The machine and tool versions of a run, plus the run ``settings``."""
+    try:
+        playwright_version = metadata.version("playwright")
+    except metadata.PackageNotFoundError:
+        playwright_version = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "playwright": playwright_version,
+        **settings,
+    }
+
+
+class ResultStore:
+    """A connection to the results store; use as a context manager."""
+
+    def __init__(self, path=STORE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    # Writing
+
+    def record_run(self, results, env, started_at=None):
+        """Append one run with all of its ``results`` and their steps; return its ``run_id``."""
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO runs (started_at, revision, environment) VALUES (?, ?, ?)",
+                (started_at or _now(), git_revision(), json.dumps(env, sort_keys=True)),
+            )
+            run_id = cursor.lastrowid
+            self.db.executemany(
+                "INSERT INTO results (run_id, test_id, status, duration, error, cached) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, r.test_id, r.status, round(r.duration, 3), r.error, int(r.cached)) for r in results],
+            )
+            self.db.executemany(
+                "INSERT INTO steps (run_id, test_id, seq, action, target, line, comment, start, duration, error)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, r.test_id, seq, s.action, s.target, s.line, s.comment, s.start, s.duration, s.error)
+                    for r in results
+                    for seq, s in enumerate(r.steps)
+                ],
+            )
+            self.db.executemany(
+                "INSERT INTO metrics (run_id, test_id, name, value) VALUES (?, ?, ?, ?)",
+                [(run_id, r.test_id, name, value) for r in results for name, value in r.metrics.items()],
+            )
+        return run_id
+
+    def mark_baseline(self, run_id=None):
+        """Make ``run_id`` (default: the latest run) the baseline for :meth:`regressions`."""
+        run_id = run_id or self.latest_run_id()
+        if run_id is None:
+            raise LookupError("the store has no runs yet")
+        with self.db:
+            self.db.execute("INSERT INTO baselines (marked_at, run_id) VALUES (?, ?)", (_now(), run_id))
+        return run_id
+
+    # Reading
+
+    def latest_run_id(self):
+        row = self.db.execute("SELECT MAX(run_id) FROM runs").fetchone()
+        return row[0]
+
+    def baseline_run_id(self):
+        row = self.db.execute("SELECT run_id FROM baselines ORDER BY rowid DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def run(self, run_id):
+        """``{"run_id", "started_at", "revision", "environment"}`` of one run."""
+        row = self.db.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise LookupError(f"no run {run_id}")
+        return {**dict(row), "environment": json.loads(row["environment"])}
+
+    def results(self, run_id):
+        """Every result row of ``run_id``, in test id order."""
+        rows = self.db.execute("SELECT * FROM results WHERE run_id = ? ORDER BY test_id", (run_id,))
+        return [dict(row) for row in rows]
+
+    def steps(self, run_id, test_id):
+        rows = self.db.execute(
+            "SELECT * FROM steps WHERE run_id = ? AND test_id = ? ORDER BY seq", (run_id, test_id)
+        )
+        return [dict(row) for row in rows]
+
+    def metrics(self, run_id):
+        """``{test_id: {metric: value}}`` of the cases that ran in ``run_id``, duration included."""
+        measured = {}
+        for row in self.db.execute(
+            "SELECT test_id, duration FROM results WHERE run_id = ? AND cached = 0", (run_id,)
+        ):
+            measured[row["test_id"]] = {"duration_s": row["duration"]}
+        for row in self.db.execute("SELECT test_id, name, value FROM metrics WHERE run_id = ?", (run_id,)):
+            measured.setdefault(row["test_id"], {})[row["name"]] = row["value"]
+        return measured
+
+    def durations(self, keep):
+        """``{test_id: [seconds, ...]}`` of the last ``keep`` measured runs per case, oldest first."""
+        rows = self.db.execute(
+            f"""
+            SELECT test_id, duration FROM (
+                SELECT test_id, duration, run_id,
+                       ROW_NUMBER() OVER (PARTITION BY test_id ORDER BY run_id DESC) AS age
+                FROM results WHERE {_MEASURED}
+            ) WHERE age <= ? ORDER BY test_id, run_id
+            """,
+            (keep,),
+        )
+        history = {}
+        for row in rows:
+            history.setdefault(row["test_id"], []).append(row["duration"])
+        return history
+
+    def latest_results(self, test_ids):
+        """The most recent result of each of ``test_ids`` that was not reused or lost."""
+        placeholders = ", ".join("?" * len(test_ids))
+        rows = self.db.execute(
+            f"""
+            SELECT test_id, status, duration, error FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY test_id ORDER BY run_id DESC) AS age
+                FROM results WHERE cached = 0 AND status != 'ERROR' AND test_id IN ({placeholders})
+            ) WHERE age = 1
+            """,
+            list(test_ids),
+        )
+        return {row["test_id"]: dict(row) for row in rows}
+
+    def _first_of_last(self, runs):
+        row = self.db.execute(
+            "SELECT MIN(run_id) FROM (SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?)", (runs,)
+        ).fetchone()
+        return row[0] or 0
+
+    def slowest(self, runs=10, limit=10):
+        """Cases with the highest mean duration over the last ``runs`` runs."""
+        rows = self.db.execute(
+            f"""
+            SELECT test_id, COUNT(*) AS runs, AVG(duration) AS mean, MAX(duration) AS worst
+            FROM results WHERE run_id >= ? AND {_MEASURED}
+            GROUP BY test_id ORDER BY mean DESC LIMIT ?
+            """,
+            (self._first_of_last(runs), limit),
+        )
+        return [dict(row) for row in rows]
+
+    def flaky(self, runs=10):
+        """Cases that both passed and failed over the last ``runs`` runs, most status flips first."""
+        rows = self.db.execute(
+            "SELECT test_id, status FROM results WHERE run_id >= ? AND cached = 0 AND status != 'ERROR'"
+            " ORDER BY test_id, run_id",
+            (self._first_of_last(runs),),
+        )
+        statuses = {}
+        for row in rows:
+            statuses.setdefault(row["test_id"], []).append(row["status"])
+        flaky = []
+        for test_id, seen in statuses.items():
+            passes = seen.count("PASSED")
+            if 0 < passes < len(seen):
+                flips = sum(1 for a, b in zip(seen, seen[1:]) if a != b)
+                flaky.append({"test_id": test_id, "runs": len(seen), "passed": passes, "flips": flips})
+        return sorted(flaky, key=lambda row: (-row["flips"], row["test_id"]))
+
+    def regressions(self, run_id=None, baseline_id=None):
+        """Cases of ``run_id`` (default: latest) that stopped passing or slowed down since the baseline."""
+        run_id = run_id or self.latest_run_id()
+        baseline_id = baseline_id or self.baseline_run_id()
+        if run_id is None or baseline_id is None:
+            return []
+        rows = self.db.execute(
+            """
+            SELECT cur.test_id, cur.status, cur.duration, base.status AS baseline_status,
+                   base.duration AS baseline_duration
+            FROM results AS cur JOIN results AS base ON base.test_id = cur.test_id
+            WHERE cur.run_id = ? AND base.run_id = ? AND cur.cached = 0
+            ORDER BY cur.test_id
+            """,
+            (run_id, baseline_id),
+        )
+        regressions = []
+        for row in rows:
+            if row["baseline_status"] == "PASSED" and row["status"] != "PASSED":
+                regressions.append({**dict(row), "reason": f"{row['baseline_status']} -> {row['status']}"})
+            elif (
+                row["status"] == "PASSED"
+                and row["duration"] > row["baseline_duration"] * REGRESSION_RATIO
+                and row["duration"] - row["baseline_duration"] > REGRESSION_MIN_S
+            ):
+                reason = f"{row['baseline_duration']:.1f}s -> {row['duration']:.1f}s"
+                regressions.append({**dict(row), "reason": reason})
+        return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.store", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("slowest", "slowest cases"), ("flaky", "cases that both passed and failed")):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("--runs", type=int, default=10, help="look at the last RUNS runs (default: 10)")
+    baseline = commands.add_parser("baseline", help="mark a run as the baseline")
+    baseline.add_argument("run", nargs="?", type=int, help="run id (default: the latest run)")
+    regressions = commands.add_parser("regressions", help="compare a run with the baseline")
+    regressions.add_argument("run", nargs="?", type=int, help="run id (default: the latest run)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with ResultStore() as store:
+        if args.command == "slowest":
+            for row in store.slowest(args.runs):
+                print(f"{row['test_id']:<6} {row['mean']:8.2f}s mean {row['worst']:8.2f}s worst  ({row['runs']} runs)")
+        elif args.command == "flaky":
+            for row in store.flaky(args.runs):
+                print(f"{row['test_id']:<6} passed {row['passed']}/{row['runs']}, {row['flips']} status flips")
+        elif args.command == "baseline":
+            try:
+                print(f"Run {store.mark_baseline(args.run)} is now the baseline")
+            except LookupError as exc:
+                print(exc, file=sys.stderr)
+                return 1
+        else:
+            if store.baseline_run_id() is None:
+                print("No baseline yet; mark one with `python -m harness.store baseline`.")
+                return 0
+            regressions = store.regressions(args.run)
+            for row in regressions:
+                print(f"REGRESSION {row['test_id']}: {row['reason']}")
+            return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""Time to first and last token of streamed chat replies.
+
+ChatBot streams its reply into a bubble (``data-testid="chat-streaming"``)
+that is replaced by the finished message. The app's Gemini calls go to a
+:class:`~harness.gemini.GeminiServer`, which answers after a fixed latency
+and then sends the reply in chunks with a gap between them. For every
+message, the page records the time from clicking send to the first streamed
+text and to the finished reply.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.streaming
+    python -m harness.streaming --chunks 16 --chunk-delay-ms 120 --max-ttft-ms 1500
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+from contextlib import nullcontext
+
+from playwright import async_api
+
+from .browser import launch_browser, new_context, open_app
+from .config import TMP_DIR, url_for_port
+from .gemini import GeminiServer, use_gemini_server
+from .pages import ChatBot, Navigation
+from .server import prod_server
+from .steps import fill, settle
+
+STREAMING_REPORT_PATH = TMP_DIR / "streaming.json"
+
+# Distinct texts, so that no analysis is answered from the cache.
+MESSAGES = [
+    "I'm stressed about a work deadline tomorrow.",
+    "I feel calm and grateful today.",
+    "I've been worried about money this month.",
+    "I'm anxious about my exam next week.",
+]
+
+REPLY_TIMEOUT_MS = 30000
+
+# Clicks send and resolves with the ms from the click to the first streamed
+# text and to the finished bot message.
+_TIME_REPLY = """(before) => new Promise((resolve) => {
+  const started = performance.now();
+  let first = null;
+  const check = () => {
+    const streaming = document.querySelector('[data-testid="chat-streaming"]');
+    if (first === null && streaming && streaming.textContent.trim()) first = performance.now() - started;
+    const bots = document.querySelectorAll('[data-testid="chat-message"][data-sender="bot"]');
+    if (bots.length > before) {
+      observer.disconnect();
+      const last = performance.now() - started;
+      resolve({ first_ms: first === null ? last : first, last_ms: last, streamed: first !== null });
+    }
+  };
+  const observer = new MutationObserver(check);
+  observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+  document.querySelector('[data-testid="chat-send"]').click();
+})"""
+
+
+async def run_streaming(app_url, stand_in, headless=True):
+    """One ``{"first_ms", "last_ms", "streamed"}`` row per message in :data:`MESSAGES`."""
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless=headless)
+        try:
+            context = await new_context(browser, app_url)
+            await use_gemini_server(context, stand_in)
+            page = await open_app(context)
+            await Navigation(page).open("chat")
+            chat = ChatBot(page)
+            rows = []
+            for message in MESSAGES:
+                await fill(chat.input, message)
+                before = await chat.bot_messages.count()
+                timing = await asyncio.wait_for(page.evaluate(_TIME_REPLY, before), REPLY_TIMEOUT_MS / 1000)
+                rows.append({"message": message, **timing})
+                await settle(page)
+            await context.close()
+            return rows
+        finally:
+            await browser.close()
+
+
+def print_report(rows):
+    header = f"{'first ms':>10}{'last ms':>10}  message"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        marker = "" if row["streamed"] else "  (not streamed)"
+        print(f"{row['first_ms']:>10.0f}{row['last_ms']:>10.0f}  {row['message']}{marker}")
+    first = statistics.median(row["first_ms"] for row in rows)
+    last = statistics.median(row["last_ms"] for row in rows)
+    print(f"median time to first token {first:.0f} ms, to last token {last:.0f} ms")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.streaming", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="app port; the app must have a Gemini key (default: build and serve the production build)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=300, help="stand-in latency per call (default: 300)")
+    parser.add_argument("--chunks", type=int, default=8, help="chunks per streamed reply (default: 8)")
+    parser.add_argument("--chunk-delay-ms", type=float, default=80, help="gap between chunks (default: 80)")
+    parser.add_argument("--max-ttft-ms", type=float, help="exit non-zero when the median time to first token is above")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    stand_in = GeminiServer(latency_ms=args.latency_ms, chunks=args.chunks, chunk_delay_ms=args.chunk_delay_ms)
+    server = nullcontext(url_for_port(args.port)) if args.port else prod_server(offline_gemini=True)
+    with stand_in.serve(), server as app_url:
+        rows = asyncio.run(run_streaming(app_url, stand_in, headless=not args.headed))
+    STREAMING_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with STREAMING_REPORT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(rows, fh, indent=2)
+    print_report(rows)
+    failed = False
+    if not all(row["streamed"] for row in rows):
+        print("Some replies were not streamed")
+        failed = True
+    first = statistics.median(row["first_ms"] for row in rows)
+    if args.max_ttft_ms is not None and first > args.max_ttft_ms:
+        print(f"Median time to first token {first:.0f} ms is over {args.max_ttft_ms:g} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
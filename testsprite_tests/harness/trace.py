@@ -0,0 +1,213 @@
+"""Per-step timing trace for the Playwright calls made by the TC scripts.
+
+The runner hands each script a traced proxy of its ``BrowserContext``.
+Every page, frame and locator reached through it is proxied too, and every
+awaited Playwright call (``goto``, ``click``, ``fill``, ``evaluate``,
+``inner_text``, ...) is recorded as a :class:`Step` with the script line it
+was called from and the step comment written above that line.
+"""
+
+import asyncio
+import inspect
+import json
+import linecache
+import sys
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from .config import TMP_DIR
+
+TRACE_PATH = TMP_DIR / "step_trace.json"
+
+# Number of slowest steps kept in the trace summary.
+SLOWEST_STEPS = 20
+
+
+@dataclass
+class Step:
+    test_id: str
+    action: str
+    target: str
+    line: int
+    comment: str
+    start: float
+    end: float
+    duration: float
+    error: str = ""
+
+
+def _is_test_script(filename):
+    name = Path(filename).name
+    return name.startswith("TC") and name.endswith(".py")
+
+
+def _calling_line():
+    """``(filename, lineno)`` of the innermost TC script frame on the stack."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if _is_test_script(frame.f_code.co_filename):
+            return frame.f_code.co_filename, frame.f_lineno
+        frame = frame.f_back
+    return None, 0
+
+
+@lru_cache(maxsize=None)
+def step_comment(filename, lineno):
+    """The comment describing the step at ``filename:lineno``.
+
+    An inline ``# ...`` on the line itself wins; otherwise the nearest
+    comment line above it.
+    """
+    line = linecache.getline(filename, lineno)
+    if "  # " in line:
+        return line.split("  # ", 1)[1].strip()
+    for number in range(lineno - 1, 0, -1):
+        text = linecache.getline(filename, number).strip()
+        if text.startswith("#"):
+            return text.lstrip("#").strip()
+        if text.startswith(("async def ", "def ")):
+            break
+    return ""
+
+
+def _describe(target):
+    selector = getattr(getattr(target, "_impl_obj", None), "_selector", None)
+    if selector:
+        return selector
+    url = getattr(target, "url", None)
+    return url if isinstance(url, str) else type(target).__name__
+
+
+def _is_playwright_object(value):
+    return type(value).__module__.startswith("playwright.async_api")
+
+
+class StepBudgetExceeded(Exception):
+    """A single traced Playwright call ran longer than the step budget."""
+
+
+class Tracer:
+    """Collects the steps of one test run.
+
+    With a ``step_budget`` (seconds), any single awaited call that runs
+    longer is cancelled and raises :class:`StepBudgetExceeded`. ``on_step``
+    is awaited with the call's target and :class:`Step` after every call
+    that was not cancelled (see :mod:`harness.capture`); it must not raise.
+    """
+
+    def __init__(self, test_id, step_budget=None, on_step=None):
+        self.test_id = test_id
+        self.step_budget = step_budget
+        self.on_step = on_step
+        self.steps = []
+        self._origin = time.perf_counter()
+
+    def wrap(self, value):
+        """Proxy ``value`` (or every item of a list) if it is a Playwright object."""
+        if isinstance(value, list):
+            return [self.wrap(item) for item in value]
+        if _is_playwright_object(value):
+            return _Traced(value, self)
+        return value
+
+    async def timed(self, action, target, call, args, kwargs, caller):
+        filename, lineno = caller
+        start = time.perf_counter()
+        error = ""
+        cancelled = False
+        try:
+            if self.step_budget is None:
+                return self.wrap(await call(*args, **kwargs))
+            try:
+                return self.wrap(await asyncio.wait_for(call(*args, **kwargs), self.step_budget))
+            except asyncio.TimeoutError:
+                raise StepBudgetExceeded(
+                    f"{action} on {_describe(target)} exceeded the {self.step_budget:g}s step budget"
+                ) from None
+        except BaseException as exc:
+            error = f"{type(exc).__name__}: {exc}".splitlines()[0]
+            cancelled = isinstance(exc, asyncio.CancelledError)
+            raise
+        finally:
+            end = time.perf_counter()
+            self.steps.append(Step(
+                test_id=self.test_id,
+                action=action,
+                target=_describe(target),
+                line=lineno,
+                comment=step_comment(filename, lineno) if filename else "",
+                start=round(start - self._origin, 4),
+                end=round(end - self._origin, 4),
+                duration=round(end - start, 4),
+                error=error,
+            ))
+            if self.on_step is not None and not cancelled:
+                await self.on_step(target, self.steps[-1])
+
+
+def unwrap(value):
+    """Return the Playwright object behind a traced proxy (or ``value`` itself)."""
+    return value._target if isinstance(value, _Traced) else value
+
+
+class _Traced:
+    """Transparent proxy that times awaited calls on a Playwright object."""
+
+    __slots__ = ("_target", "_tracer")
+
+    def __init__(self, target, tracer):
+        self._target = target
+        self._tracer = tracer
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not callable(value):
+            return self._tracer.wrap(value)
+
+        tracer = self._tracer
+        target = self._target
+        is_async = inspect.iscoroutinefunction(value)
+
+        def call(*args, **kwargs):
+            args = [unwrap(arg) for arg in args]
+            kwargs = {key: unwrap(arg) for key, arg in kwargs.items()}
+            if is_async:
+                return tracer.timed(name, target, value, args, kwargs, _calling_line())
+            return tracer.wrap(value(*args, **kwargs))
+
+        return call
+
+    def __repr__(self):
+        return f"Traced({self._target!r})"
+
+
+def slowest(steps, limit=SLOWEST_STEPS):
+    return sorted(steps, key=lambda step: step.duration, reverse=True)[:limit]
+
+
+def write_trace(results, path=TRACE_PATH):
+    """Write every step of ``results`` plus the slowest ones to ``path``."""
+    steps = [step for result in results for step in result.steps]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(
+            {
+                "slowest": [asdict(step) for step in slowest(steps)],
+                "steps": [asdict(step) for step in steps],
+            },
+            fh,
+            indent=2,
+        )
+    return path
+
+
+def print_slowest(results, limit=10):
+    steps = slowest([step for result in results for step in result.steps], limit)
+    if not steps:
+        return
+    print(f"Slowest {len(steps)} steps:")
+    for step in steps:
+        where = f"{step.test_id}:{step.line}"
+        print(f"  {step.duration:7.2f}s  {where:<10} {step.action:<18} {step.comment[:70]}")
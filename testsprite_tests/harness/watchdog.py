@@ -0,0 +1,74 @@
+"""What the runner keeps when a test blows its time budget.
+
+A test that exceeds its budget is cancelled, and :func:`dump_partial`
+writes ``tmp/failures/<test_id>/`` with the page URL, the last completed
+step, the step that was interrupted, the browser console and a screenshot,
+so a hang can be located without re-running the case.
+"""
+
+import asyncio
+import json
+from dataclasses import asdict
+
+from .config import FAILURES_DIR
+
+# Upper bound for each capture of a dump and for closing a hung context.
+CAPTURE_TIMEOUT_S = 10
+
+# Console messages kept per test.
+CONSOLE_LIMIT = 500
+
+
+class ConsoleLog:
+    """Console messages and uncaught page errors of every page in a context."""
+
+    def __init__(self, context):
+        self.messages = []
+        context.on("page", self._watch)
+        for page in context.pages:
+            self._watch(page)
+
+    def _watch(self, page):
+        page.on("console", lambda message: self._add(f"[{message.type}] {message.text}"))
+        page.on("pageerror", lambda error: self._add(f"[pageerror] {error}"))
+
+    def _add(self, line):
+        self.messages.append(line)
+        del self.messages[:-CONSOLE_LIMIT]
+
+
+async def _bounded(awaitable):
+    """Await ``awaitable`` for at most :data:`CAPTURE_TIMEOUT_S`; return ``None`` on any failure."""
+    try:
+        return await asyncio.wait_for(awaitable, CAPTURE_TIMEOUT_S)
+    except Exception:
+        return None
+
+
+async def dump_partial(context, tracer, console, reason):
+    """Write the partial state of a cancelled test and return the dump directory."""
+    directory = FAILURES_DIR / tracer.test_id
+    directory.mkdir(parents=True, exist_ok=True)
+    page = context.pages[-1] if context.pages else None
+    completed = [step for step in tracer.steps if not step.error]
+    interrupted = tracer.steps[-1] if tracer.steps and tracer.steps[-1].error else None
+    screenshot = directory / "screenshot.png"
+    if page is None or await _bounded(page.screenshot(path=str(screenshot), timeout=CAPTURE_TIMEOUT_S * 1000)) is None:
+        screenshot = None
+    dump = {
+        "test_id": tracer.test_id,
+        "reason": reason,
+        "url": page.url if page is not None else "",
+        "last_completed_step": asdict(completed[-1]) if completed else None,
+        "interrupted_step": asdict(interrupted) if interrupted else None,
+        "screenshot": screenshot.name if screenshot else None,
+        "console": console.messages,
+    }
+    with (directory / "dump.json").open("w", encoding="utf-8") as fh:
+        json.dump(dump, fh, indent=2)
+    return directory
+
+
+async def close_context(context):
+    """Close ``context`` without letting a hung browser block the next test."""
+    await _bounded(context.close())
@@ -15,9 +15,12 @@ export default defineConfig(({ mode }) => ({
     componentTagger(),
   ].filter(Boolean),
   resolve: {
-    alias: {
-      "@": path.resolve(__dirname, "./src"),
-    },
+    alias: [
+      { find: "@", replacement: path.resolve(__dirname, "./src") },
+      // `vite build --mode profile`: react-dom's profiling build keeps <Profiler>
+      // timings in production, for the render instrumentation in src/lib/render-profile.tsx.
+      ...(mode === "profile" ? [{ find: /^react-dom$/, replacement: "react-dom/profiling" }] : []),
+    ],
     // Ensure a single React instance is used and avoid duplicate React copies
     dedupe: ["react", "react-dom"],
   },